@@ -1,3 +1,4 @@
+from .async_graph_data_science import AsyncGraphDataScience
 from .graph.graph_create_result import GraphCreateResult
 from .graph.graph_object import Graph
 from .graph_data_science import GraphDataScience
@@ -10,6 +11,15 @@ from .model.simple_rel_embedding_model import SimpleRelEmbeddingModel
 from .pipeline.lp_training_pipeline import LPTrainingPipeline
 from .pipeline.nc_training_pipeline import NCTrainingPipeline
 from .pipeline.nr_training_pipeline import NRTrainingPipeline
+from .query_runner.progress.progress_provider import TaskWithProgress
+from .query_runner.progress.progress_sink import (
+    CallbackProgressSink,
+    GaugeProgressSink,
+    LoggingProgressSink,
+    ProgressSink,
+    SpanEventProgressSink,
+    TqdmProgressSink,
+)
 from .query_runner.query_runner import QueryRunner
 from .server_version.server_version import ServerVersion
 from .session.gds_sessions import GdsSessions
@@ -17,6 +27,7 @@ from .version import __version__
 
 __all__ = [
     "GraphDataScience",
+    "AsyncGraphDataScience",
     "GdsSessions",
     "QueryRunner",
     "__version__",
@@ -33,4 +44,11 @@ __all__ = [
     "NRModel",
     "GraphSageModel",
     "SimpleRelEmbeddingModel",
+    "ProgressSink",
+    "TqdmProgressSink",
+    "CallbackProgressSink",
+    "LoggingProgressSink",
+    "GaugeProgressSink",
+    "SpanEventProgressSink",
+    "TaskWithProgress",
 ]
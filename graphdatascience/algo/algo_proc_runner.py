@@ -1,5 +1,5 @@
 from abc import ABC
-from typing import Any, Dict, Tuple
+from typing import Any, Dict, Iterator, Tuple
 
 from pandas import DataFrame, Series
 
@@ -27,6 +27,12 @@ class StreamModeRunner(AlgoProcRunner):
     def __call__(self, G: Graph, **config: Any) -> DataFrame:
         return self._run_procedure(G, config)
 
+    @graph_type_check
+    def iter(self, G: Graph, chunk_size: int = 1_000_000, **config: Any) -> Iterator[DataFrame]:
+        params = CallParameters(graph_name=G.name(), config=config)
+
+        return self._query_runner.call_procedure_batches(endpoint=self._namespace, params=params, batch_size=chunk_size)
+
 
 class StandardModeRunner(AlgoProcRunner):
     def __call__(self, G: Graph, **config: Any) -> "Series[Any]":
@@ -0,0 +1,347 @@
+from __future__ import annotations
+
+from copy import copy
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from neo4j import AsyncDriver
+from pandas import DataFrame, Series
+
+from .call_parameters import CallParameters
+from .graph.graph_object import Graph
+from .query_runner.arrow_info import ArrowInfo
+from .query_runner.async_arrow_query_runner import AsyncArrowQueryRunner
+from .query_runner.async_neo4j_query_runner import AsyncNeo4jQueryRunner
+from .query_runner.async_query_runner import AsyncQueryRunner
+from .server_version.server_version import ServerVersion
+
+# Marks a parameter without a default, which is left out of the call if it is not given
+_NO_DEFAULT = object()
+
+# The positional parameters of the graph catalog procedures, as named and defaulted by the synchronous runners.
+# A "config" parameter takes the keyword arguments of the call.
+_PROPERTY_STREAM_PARAMETERS = [
+    ("graph_name", _NO_DEFAULT),
+    ("properties", _NO_DEFAULT),
+    ("entities", ["*"]),
+    ("config", _NO_DEFAULT),
+]
+_RELATIONSHIPS_STREAM_PARAMETERS = [("graph_name", _NO_DEFAULT), ("relationship_types", ["*"]), ("config", _NO_DEFAULT)]
+_PROPERTY_DROP_PARAMETERS = [("graph_name", _NO_DEFAULT), ("properties", _NO_DEFAULT), ("config", _NO_DEFAULT)]
+_RELATIONSHIP_WRITE_PARAMETERS = [
+    ("graph_name", _NO_DEFAULT),
+    ("relationship_type", _NO_DEFAULT),
+    ("relationship_property", ""),
+    ("config", _NO_DEFAULT),
+]
+_RELATIONSHIPS_DROP_PARAMETERS = [("graph_name", _NO_DEFAULT), ("relationship_type", _NO_DEFAULT)]
+_GRAPH_PROPERTY_PARAMETERS = [("graph_name", _NO_DEFAULT), ("graph_property", _NO_DEFAULT), ("config", _NO_DEFAULT)]
+_NODE_LABEL_PARAMETERS = [("graph_name", _NO_DEFAULT), ("node_label", _NO_DEFAULT), ("config", _NO_DEFAULT)]
+_FILTER_PARAMETERS = [
+    ("graph_name", _NO_DEFAULT),
+    ("from_graph_name", _NO_DEFAULT),
+    ("node_filter", _NO_DEFAULT),
+    ("relationship_filter", _NO_DEFAULT),
+    ("config", _NO_DEFAULT),
+]
+_SAMPLE_PARAMETERS = [("graph_name", _NO_DEFAULT), ("from_graph_name", _NO_DEFAULT), ("config", _NO_DEFAULT)]
+_GENERATE_PARAMETERS = [
+    ("graph_name", _NO_DEFAULT),
+    ("node_count", _NO_DEFAULT),
+    ("average_degree", _NO_DEFAULT),
+    ("config", _NO_DEFAULT),
+]
+_PARAMETERS: Dict[str, List[Tuple[str, Any]]] = {
+    "gds.graph.project": [
+        ("graph_name", _NO_DEFAULT),
+        ("node_spec", _NO_DEFAULT),
+        ("relationship_spec", _NO_DEFAULT),
+        ("config", _NO_DEFAULT),
+    ],
+    "gds.graph.filter": _FILTER_PARAMETERS,
+    "gds.beta.graph.project.subgraph": _FILTER_PARAMETERS,
+    "gds.graph.sample.rwr": _SAMPLE_PARAMETERS,
+    "gds.graph.sample.cnarw": _SAMPLE_PARAMETERS,
+    "gds.alpha.graph.sample.rwr": _SAMPLE_PARAMETERS,
+    "gds.graph.generate": _GENERATE_PARAMETERS,
+    "gds.beta.graph.generate": _GENERATE_PARAMETERS,
+    "gds.graph.drop": [
+        ("graph_name", _NO_DEFAULT),
+        ("fail_if_missing", False),
+        ("db_name", ""),
+        ("username", _NO_DEFAULT),
+    ],
+    "gds.graph.exists": [("graph_name", _NO_DEFAULT)],
+    "gds.graph.list": [("graph_name", _NO_DEFAULT)],
+    "gds.graph.nodeProperty.stream": _PROPERTY_STREAM_PARAMETERS,
+    "gds.graph.nodeProperties.stream": _PROPERTY_STREAM_PARAMETERS,
+    "gds.graph.relationshipProperty.stream": _PROPERTY_STREAM_PARAMETERS,
+    "gds.graph.relationshipProperties.stream": _PROPERTY_STREAM_PARAMETERS,
+    "gds.graph.streamNodeProperty": _PROPERTY_STREAM_PARAMETERS,
+    "gds.graph.streamNodeProperties": _PROPERTY_STREAM_PARAMETERS,
+    "gds.graph.streamRelationshipProperty": _PROPERTY_STREAM_PARAMETERS,
+    "gds.graph.streamRelationshipProperties": _PROPERTY_STREAM_PARAMETERS,
+    "gds.graph.nodeProperties.write": _PROPERTY_STREAM_PARAMETERS,
+    "gds.graph.writeNodeProperties": _PROPERTY_STREAM_PARAMETERS,
+    "gds.graph.nodeProperties.drop": _PROPERTY_DROP_PARAMETERS,
+    "gds.graph.removeNodeProperties": _PROPERTY_DROP_PARAMETERS,
+    "gds.graph.relationship.write": _RELATIONSHIP_WRITE_PARAMETERS,
+    "gds.graph.writeRelationship": _RELATIONSHIP_WRITE_PARAMETERS,
+    "gds.graph.relationshipProperties.write": [
+        ("graph_name", _NO_DEFAULT),
+        ("relationship_type", _NO_DEFAULT),
+        ("relationship_properties", _NO_DEFAULT),
+        ("config", _NO_DEFAULT),
+    ],
+    "gds.graph.relationships.stream": _RELATIONSHIPS_STREAM_PARAMETERS,
+    "gds.beta.graph.relationships.stream": _RELATIONSHIPS_STREAM_PARAMETERS,
+    "gds.graph.relationships.drop": _RELATIONSHIPS_DROP_PARAMETERS,
+    "gds.graph.deleteRelationships": _RELATIONSHIPS_DROP_PARAMETERS,
+    "gds.graph.graphProperty.stream": _GRAPH_PROPERTY_PARAMETERS,
+    "gds.graph.graphProperty.drop": _GRAPH_PROPERTY_PARAMETERS,
+    "gds.alpha.graph.graphProperty.stream": _GRAPH_PROPERTY_PARAMETERS,
+    "gds.alpha.graph.graphProperty.drop": _GRAPH_PROPERTY_PARAMETERS,
+    "gds.graph.nodeLabel.write": _NODE_LABEL_PARAMETERS,
+    "gds.graph.nodeLabel.mutate": _NODE_LABEL_PARAMETERS,
+    "gds.alpha.graph.nodeLabel.write": _NODE_LABEL_PARAMETERS,
+    "gds.alpha.graph.nodeLabel.mutate": _NODE_LABEL_PARAMETERS,
+}
+
+_SINGLE_ROW_MODES = ["mutate", "write", "stats", "estimate"]
+
+
+class AsyncCallBuilder:
+    """
+    Builds the name of a GDS procedure through attribute access and calls it when awaited, for example
+    `await gds.pageRank.stream("my-graph", dampingFactor=0.85)`.
+    """
+
+    def __init__(self, query_runner: AsyncQueryRunner, namespace: str):
+        self._query_runner = query_runner
+        self._namespace = namespace
+
+    def __getattr__(self, attr: str) -> AsyncCallBuilder:
+        return AsyncCallBuilder(self._query_runner, f"{self._namespace}.{attr}")
+
+    async def __call__(self, *args: Any, **config: Any) -> Union[DataFrame, "Series[Any]"]:
+        params = self._call_parameters(args, config)
+        result = await self._query_runner.call_procedure(endpoint=self._namespace, params=params)
+
+        if self._namespace.split(".")[-1] in _SINGLE_ROW_MODES:
+            return result.squeeze()  # type: ignore
+
+        return result
+
+    def _call_parameters(self, args: Tuple[Any, ...], config: Dict[str, Any]) -> CallParameters:
+        args = tuple(arg.name() if isinstance(arg, Graph) else arg for arg in args)
+
+        parameters = _PARAMETERS.get(self._namespace)
+        if parameters is None:
+            # Procedures that are not inspected on the client side take their graph name and config only by position
+            params = CallParameters()
+            for i, arg in enumerate(args):
+                params["graph_name" if i == 0 else f"p{i}"] = arg
+            if config:
+                params["config"] = config
+            return params
+
+        positional_parameters = [(name, default) for name, default in parameters if name != "config"]
+        if len(args) > len(positional_parameters):
+            raise TypeError(
+                f"{self._namespace} takes at most {len(positional_parameters)} positional arguments, got {len(args)}"
+            )
+        if config and len(positional_parameters) == len(parameters):
+            raise TypeError(f"{self._namespace} takes no configuration, got {config}")
+
+        params = CallParameters()
+        for i, (name, default) in enumerate(positional_parameters):
+            if i < len(args):
+                params[name] = args[i]
+            elif default is not _NO_DEFAULT:
+                params[name] = copy(default)
+
+        if len(positional_parameters) < len(parameters):
+            params["config"] = config
+
+        return params
+
+
+class AsyncGraphDataScience:
+    """
+    Asyncio variant of the GraphDataScience API class, built on the async Neo4j driver.
+    Procedures are called through attribute access, for example `await gds.wcc.stream("my-graph")`,
+    and graph properties are streamed via Arrow Flight if available.
+    """
+
+    def __init__(self, query_runner: AsyncQueryRunner, server_version: ServerVersion):
+        """
+        Use `AsyncGraphDataScience.create` to construct a new AsyncGraphDataScience object.
+        """
+        self._query_runner = query_runner
+        self._server_version = server_version
+
+    @staticmethod
+    async def create(
+        endpoint: Union[str, AsyncDriver, AsyncQueryRunner],
+        auth: Optional[Tuple[str, str]] = None,
+        aura_ds: bool = False,
+        database: Optional[str] = None,
+        arrow: Union[str, bool] = True,
+        arrow_disable_server_verification: bool = True,
+        arrow_tls_root_certs: Optional[bytes] = None,
+        bookmarks: Optional[Any] = None,
+        arrow_compression: Optional[str] = None,
+    ) -> AsyncGraphDataScience:
+        """
+        Construct a new AsyncGraphDataScience object.
+
+        Parameters
+        ----------
+        endpoint : Union[str, AsyncDriver, AsyncQueryRunner]
+            The Neo4j endpoint to connect to. Most commonly, this is a Bolt connection URI.
+        auth : Optional[Tuple[str, str]], default None
+            A username, password pair for database authentication.
+        aura_ds : bool, default False
+            A flag that indicates that that the client is used to connect
+            to a Neo4j AuraDS instance.
+        database: Optional[str], default None
+            The Neo4j database to query against.
+        arrow : Union[str, bool], default True
+            Arrow connection information. This is either a string or a bool.
+
+            - If it is a string, it will be interpreted as a connection URL to a GDS Arrow Server.
+            - If it is a bool:
+                - True will make the client discover the connection URI to the GDS Arrow server via the Neo4j endpoint.
+                - False will make the client use Bolt for all operations.
+        arrow_disable_server_verification : bool, default True
+            A flag that overrides other TLS settings and disables server verification for TLS connections.
+        arrow_tls_root_certs : Optional[bytes], default None
+            PEM-encoded certificates that are used for the connection to the
+            GDS Arrow Flight server.
+        bookmarks : Optional[Any], default None
+            The Neo4j bookmarks to require a certain state before the next query gets executed.
+        arrow_compression : Optional[str], default None
+            The IPC compression ("lz4" or "zstd") used for data sent to the GDS Arrow Flight server.
+
+        Returns
+        -------
+        The connected AsyncGraphDataScience object.
+        """
+        query_runner: AsyncQueryRunner
+        if isinstance(endpoint, AsyncQueryRunner):
+            query_runner = endpoint
+        else:
+            query_runner = AsyncNeo4jQueryRunner.create(endpoint, auth, aura_ds, database, bookmarks)
+
+        server_version = await query_runner.server_version()
+
+        arrow_info = await ArrowInfo.create_async(query_runner)
+        if arrow and arrow_info.enabled and server_version >= ServerVersion(2, 1, 0):
+            encrypted = isinstance(query_runner, AsyncNeo4jQueryRunner) and query_runner.encrypted()
+            query_runner = await AsyncArrowQueryRunner.create(
+                query_runner,
+                arrow_info,
+                auth,
+                encrypted,
+                arrow_disable_server_verification,
+                arrow_tls_root_certs,
+                None if arrow is True else arrow,
+                arrow_compression,
+            )
+
+        return AsyncGraphDataScience(query_runner, server_version)
+
+    def __getattr__(self, attr: str) -> AsyncCallBuilder:
+        return AsyncCallBuilder(self._query_runner, f"gds.{attr}")
+
+    async def call_procedure(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        yields: Optional[List[str]] = None,
+        database: Optional[str] = None,
+    ) -> DataFrame:
+        """
+        Call a procedure by its full name, for example "gds.graph.list".
+
+        Parameters
+        ----------
+        endpoint: str
+            the name of the procedure
+        params: Dict[str, Any]
+            the parameters of the procedure, in order
+        yields: List[str]
+            the result columns to yield
+        database: str
+            the database on which to run the procedure
+
+        Returns:
+            The procedure result as a DataFrame
+        """
+        return await self._query_runner.call_procedure(endpoint, CallParameters(params or {}), yields, database)
+
+    async def run_cypher(
+        self, query: str, params: Optional[Dict[str, Any]] = None, database: Optional[str] = None
+    ) -> DataFrame:
+        """
+        Run a Cypher query
+
+        Parameters
+        ----------
+        query: str
+            the Cypher query
+        params: Dict[str, Any]
+            parameters to the query
+        database: str
+            the database on which to run the query
+
+        Returns:
+            The query result as a DataFrame
+        """
+        qr = self._query_runner
+
+        # The Arrow query runner should not be used to execute arbitrary Cypher
+        if isinstance(self._query_runner, AsyncArrowQueryRunner):
+            qr = self._query_runner.fallback_query_runner()
+
+        return await qr.run_cypher(query, params, database, False)
+
+    def set_database(self, database: str) -> None:
+        """
+        Set the database which queries are run against.
+
+        Parameters
+        -------
+        database: str
+            The name of the database to run queries against.
+        """
+        self._query_runner.set_database(database)
+
+    def database(self) -> Optional[str]:
+        """
+        Get the database which queries are run against.
+
+        Returns:
+            The name of the database.
+        """
+        return self._query_runner.database()
+
+    def server_version(self) -> ServerVersion:
+        """
+        Get the version of the GDS library installed on the Neo4j server.
+
+        Returns:
+            The version of the GDS library.
+        """
+        return self._server_version
+
+    async def close(self) -> None:
+        """
+        Close the AsyncGraphDataScience object and release any resources held by it.
+        """
+        await self._query_runner.close()
+
+    async def __aenter__(self) -> AsyncGraphDataScience:
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.close()
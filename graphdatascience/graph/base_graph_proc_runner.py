@@ -8,11 +8,14 @@ import pandas as pd
 from multimethod import multimethod
 from neo4j import __version__ as neo4j_driver_version
 from pandas import DataFrame, Series, read_parquet
+from pyarrow import RecordBatchReader, Table
+from pyarrow.dataset import Dataset, dataset
 
 from ..call_parameters import CallParameters
 from ..error.client_only_endpoint import client_only_endpoint
 from ..error.illegal_attr_checker import IllegalAttrChecker
 from ..error.uncallable_namespace import UncallableNamespace
+from ..query_runner.graph_constructor import EntityData
 from ..server_version.compatible_with import compatible_with
 from ..server_version.server_version import ServerVersion
 from .graph_create_result import GraphCreateResult
@@ -27,7 +30,7 @@ from .graph_entity_ops_runner import (
     GraphRelationshipsRunner,
 )
 from .graph_export_runner import GraphExportRunner
-from .graph_object import Graph
+from .graph_object import LIGHTWEIGHT_GRAPH_LIST_YIELDS, Graph
 from .graph_sample_runner import GraphSampleRunner
 from .graph_type_check import (
     from_graph_type_check,
@@ -37,6 +40,7 @@ from .graph_type_check import (
 from .ogb_loader import OGBLLoader, OGBNLoader
 
 Strings = Union[str, List[str]]
+ConstructInput = Union[DataFrame, Table, RecordBatchReader, Dataset]
 
 is_neo4j_4_driver = ServerVersion.from_string(neo4j_driver_version) < ServerVersion(5, 0, 0)
 
@@ -69,21 +73,26 @@ class BaseGraphProcRunner(UncallableNamespace, IllegalAttrChecker):
     def construct(
         self,
         graph_name: str,
-        nodes: Union[DataFrame, List[DataFrame]],
-        relationships: Optional[Union[DataFrame, List[DataFrame]]] = None,
+        nodes: Union[ConstructInput, List[ConstructInput]],
+        relationships: Optional[Union[ConstructInput, List[ConstructInput]]] = None,
         concurrency: int = 4,
         undirected_relationship_types: Optional[List[str]] = None,
+        conversion_processes: Optional[int] = None,
+        target_batch_bytes: int = 8_000_000,
+        max_retries: int = 3,
+        retry_backoff_seconds: float = 1.0,
     ) -> Graph:
-        nodes = nodes if isinstance(nodes, List) else [nodes]
+        node_inputs = nodes if isinstance(nodes, List) else [nodes]
 
-        if isinstance(relationships, DataFrame):
-            relationships = [relationships]
-        elif relationships is None:
-            relationships = []
+        relationship_inputs: List[ConstructInput] = []
+        if isinstance(relationships, List):
+            relationship_inputs = relationships
+        elif relationships is not None:
+            relationship_inputs = [relationships]
 
         # Filter empty dataframes
-        nodes = [df for df in nodes if not df.empty]
-        relationships = [df for df in relationships if not df.empty]
+        node_data = [df for df in self._to_entity_data(node_inputs) if not self._is_empty(df)]
+        relationship_data = [df for df in self._to_entity_data(relationship_inputs) if not self._is_empty(df)]
 
         errors = []
 
@@ -100,13 +109,13 @@ class BaseGraphProcRunner(UncallableNamespace, IllegalAttrChecker):
                 f"Graph '{graph_name}' already exists. Please drop the existing graph or use a different name."
             )
 
-        for idx, node_df in enumerate(nodes):
-            if "nodeId" not in node_df.columns.values:
+        for idx, node_df in enumerate(node_data):
+            if "nodeId" not in self._column_names(node_df):
                 errors.append(f"Node dataframe at index {idx} needs to contain a 'nodeId' column.")
 
-        for idx, rel_df in enumerate(relationships):
+        for idx, rel_df in enumerate(relationship_data):
             for expected_col in ["sourceNodeId", "targetNodeId"]:
-                if expected_col not in rel_df.columns.values:
+                if expected_col not in self._column_names(rel_df):
                     errors.append(f"Relationship dataframe at index {idx} needs to contain a '{expected_col}' column.")
 
         if self._server_version < ServerVersion(2, 3, 0) and undirected_relationship_types:
@@ -115,12 +124,90 @@ class BaseGraphProcRunner(UncallableNamespace, IllegalAttrChecker):
         if len(errors) > 0:
             raise ValueError(os.linesep.join(errors))
 
+        upload_options: Dict[str, Any] = {
+            "target_batch_bytes": target_batch_bytes,
+            "max_retries": max_retries,
+            "retry_backoff_seconds": retry_backoff_seconds,
+        }
+        if conversion_processes is not None:
+            upload_options["conversion_processes"] = conversion_processes
+
         constructor = self._query_runner.create_graph_constructor(
-            graph_name, concurrency, undirected_relationship_types
+            graph_name, concurrency, undirected_relationship_types, **upload_options
         )
-        constructor.run(nodes, relationships)
+        constructor.run(node_data, relationship_data)
 
-        return Graph(graph_name, self._query_runner)
+        return Graph(graph_name, self._query_runner, constructor.upload_settings())
+
+    @client_only_endpoint("gds.graph")
+    @compatible_with("construct_from_files", min_inclusive=ServerVersion(2, 1, 0))
+    def construct_from_files(
+        self,
+        graph_name: str,
+        node_paths: Strings,
+        relationship_paths: Optional[Strings] = None,
+        file_format: Optional[str] = None,
+        concurrency: int = 4,
+        undirected_relationship_types: Optional[List[str]] = None,
+        target_batch_bytes: int = 8_000_000,
+        max_retries: int = 3,
+        retry_backoff_seconds: float = 1.0,
+    ) -> Graph:
+        node_paths = node_paths if isinstance(node_paths, list) else [node_paths]
+        if relationship_paths is None:
+            relationship_paths = []
+        elif isinstance(relationship_paths, str):
+            relationship_paths = [relationship_paths]
+
+        if file_format not in [None, "parquet", "csv"]:
+            raise ValueError(f"Unsupported file format '{file_format}'. Supported formats are 'parquet' and 'csv'.")
+
+        # Each path (a file or a directory) becomes its own dataset, as node files for different labels
+        # or relationship files for different types usually do not share the same schema
+        node_datasets: List[ConstructInput] = [self._file_dataset(path, file_format) for path in node_paths]
+        relationship_datasets: List[ConstructInput] = [
+            self._file_dataset(path, file_format) for path in relationship_paths
+        ]
+
+        return self.construct(
+            graph_name,
+            node_datasets,
+            relationship_datasets,
+            concurrency,
+            undirected_relationship_types,
+            target_batch_bytes=target_batch_bytes,
+            max_retries=max_retries,
+            retry_backoff_seconds=retry_backoff_seconds,
+        )
+
+    @staticmethod
+    def _file_dataset(path: str, file_format: Optional[str]) -> Dataset:
+        if file_format is None:
+            file_format = "csv" if path.lower().endswith(".csv") else "parquet"
+
+        return dataset(path, format=file_format)
+
+    @staticmethod
+    def _to_entity_data(inputs: List[ConstructInput]) -> List[EntityData]:
+        # Datasets are scanned lazily so that they do not need to be loaded into memory at once
+        return [data.scanner().to_reader() if isinstance(data, Dataset) else data for data in inputs]
+
+    @staticmethod
+    def _is_empty(data: EntityData) -> bool:
+        if isinstance(data, DataFrame):
+            return data.empty
+        if isinstance(data, Table):
+            return data.num_rows == 0
+
+        # The number of rows of a reader is unknown until it has been consumed
+        return False
+
+    @staticmethod
+    def _column_names(data: EntityData) -> List[str]:
+        if isinstance(data, DataFrame):
+            return data.columns.tolist()
+
+        return data.schema.names  # type: ignore
 
     @client_only_endpoint("gds.graph")
     def load_cora(self, graph_name: str = "cora", undirected: bool = False) -> Graph:
@@ -332,7 +419,7 @@ class BaseGraphProcRunner(UncallableNamespace, IllegalAttrChecker):
         return result.squeeze()  # type: ignore
 
     @graph_type_check_optional
-    def list(self, G: Optional[Graph] = None) -> DataFrame:
+    def list(self, G: Optional[Graph] = None, lightweight: bool = False) -> DataFrame:
         self._namespace += ".list"
 
         params = CallParameters()
@@ -342,6 +429,7 @@ class BaseGraphProcRunner(UncallableNamespace, IllegalAttrChecker):
         return self._query_runner.call_procedure(
             endpoint=self._namespace,
             params=params,
+            yields=LIGHTWEIGHT_GRAPH_LIST_YIELDS if lightweight else None,
         )
 
     @client_only_endpoint("gds.graph")
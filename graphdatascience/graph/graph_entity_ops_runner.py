@@ -1,9 +1,13 @@
 from functools import reduce
-from typing import Any, Dict, List, Type, Union
+from typing import Any, Dict, Iterator, List, Literal, Type, Union, overload
 from warnings import filterwarnings
 
 import pandas as pd
+import pyarrow.compute as pc
+from numpy.typing import NDArray
 from pandas import DataFrame, Series
+from pyarrow import Array, ChunkedArray, Table
+from pyarrow.types import is_dictionary, is_fixed_size_list, is_large_list, is_list
 
 from ..call_parameters import CallParameters
 from ..error.cypher_warning_handler import (
@@ -19,6 +23,9 @@ from .graph_object import Graph
 from .graph_type_check import graph_type_check
 
 Strings = Union[str, List[str]]
+NumpyColumns = Dict[str, NDArray[Any]]
+
+OUTPUT_FORMATS = ["pandas", "arrow", "numpy"]
 
 
 class TopologyDataFrame(DataFrame):
@@ -69,6 +76,77 @@ class GraphEntityOpsBaseRunner(UncallableNamespace, IllegalAttrChecker):
             params=params,
         )
 
+    @graph_type_check
+    def _handle_properties_batches(
+        self,
+        G: Graph,
+        properties: Strings,
+        entities: Strings,
+        config: Dict[str, Any],
+    ) -> Iterator[DataFrame]:
+        params = CallParameters(
+            graph_name=G.name(),
+            properties=properties,
+            entities=entities,
+            config=config,
+        )
+
+        return self._query_runner.call_procedure_batches(
+            endpoint=self._namespace,
+            params=params,
+        )
+
+    @graph_type_check
+    def _handle_properties_table(
+        self,
+        G: Graph,
+        properties: Strings,
+        entities: Strings,
+        config: Dict[str, Any],
+    ) -> Union[Table, DataFrame]:
+        params = CallParameters(
+            graph_name=G.name(),
+            properties=properties,
+            entities=entities,
+            config=config,
+        )
+
+        return self._query_runner.call_procedure_arrow(
+            endpoint=self._namespace,
+            params=params,
+        )
+
+    @staticmethod
+    def _check_output_format(output_format: str) -> None:
+        if output_format not in OUTPUT_FORMATS:
+            raise ValueError(f"Invalid output format '{output_format}'. Supported formats are {OUTPUT_FORMATS}.")
+
+    @staticmethod
+    def _to_output_format(table: Table, output_format: str) -> Union[Table, NumpyColumns]:
+        if output_format == "arrow":
+            return table
+
+        return {
+            name: GraphEntityOpsBaseRunner._column_to_numpy(column)
+            for name, column in zip(table.column_names, table.columns)
+        }
+
+    @staticmethod
+    def _column_to_numpy(column: Union[Array, ChunkedArray]) -> NDArray[Any]:
+        array = column.combine_chunks() if isinstance(column, ChunkedArray) else column
+
+        if is_dictionary(array.type):
+            array = array.dictionary_decode()
+
+        is_list_type = is_list(array.type) or is_large_list(array.type) or is_fixed_size_list(array.type)
+        if is_list_type and len(array) > 0 and array.null_count == 0:
+            lengths = pc.min_max(pc.list_value_length(array))
+            if lengths["min"].as_py() == lengths["max"].as_py():
+                # Equally sized lists such as embeddings become a single contiguous 2-D array
+                return array.flatten().to_numpy(zero_copy_only=False).reshape(len(array), -1)  # type: ignore
+
+        return array.to_numpy(zero_copy_only=False)  # type: ignore
+
 
 class GraphNodePropertyRunner(GraphEntityOpsBaseRunner):
     @compatible_with("stream", min_inclusive=ServerVersion(2, 2, 0))
@@ -91,6 +169,61 @@ class GraphNodePropertyRunner(GraphEntityOpsBaseRunner):
 
 
 class GraphNodePropertiesRunner(GraphEntityOpsBaseRunner):
+    @overload
+    def stream(
+        self,
+        G: Graph,
+        node_properties: List[str],
+        node_labels: Strings = ...,
+        separate_property_columns: bool = ...,
+        db_node_properties: List[str] = ...,
+        as_iterator: Literal[False] = ...,
+        output_format: Literal["pandas"] = ...,
+        **config: Any,
+    ) -> DataFrame: ...
+
+    @overload
+    def stream(
+        self,
+        G: Graph,
+        node_properties: List[str],
+        node_labels: Strings = ...,
+        separate_property_columns: bool = ...,
+        db_node_properties: List[str] = ...,
+        *,
+        as_iterator: Literal[True],
+        output_format: Literal["pandas"] = ...,
+        **config: Any,
+    ) -> Iterator[DataFrame]: ...
+
+    @overload
+    def stream(
+        self,
+        G: Graph,
+        node_properties: List[str],
+        node_labels: Strings = ...,
+        separate_property_columns: bool = ...,
+        db_node_properties: List[str] = ...,
+        as_iterator: Literal[False] = ...,
+        *,
+        output_format: Literal["arrow"],
+        **config: Any,
+    ) -> Table: ...
+
+    @overload
+    def stream(
+        self,
+        G: Graph,
+        node_properties: List[str],
+        node_labels: Strings = ...,
+        separate_property_columns: bool = ...,
+        db_node_properties: List[str] = ...,
+        as_iterator: Literal[False] = ...,
+        *,
+        output_format: Literal["numpy"],
+        **config: Any,
+    ) -> NumpyColumns: ...
+
     @compatible_with("stream", min_inclusive=ServerVersion(2, 2, 0))
     @filter_id_func_deprecation_warning()
     def stream(
@@ -100,9 +233,38 @@ class GraphNodePropertiesRunner(GraphEntityOpsBaseRunner):
         node_labels: Strings = ["*"],
         separate_property_columns: bool = False,
         db_node_properties: List[str] = [],
+        as_iterator: bool = False,
+        output_format: str = "pandas",
         **config: Any,
-    ) -> DataFrame:
+    ) -> Union[DataFrame, Iterator[DataFrame], Table, NumpyColumns]:
         self._namespace += ".stream"
+        self._check_output_format(output_format)
+
+        if output_format != "pandas":
+            if as_iterator:
+                raise ValueError("The parameter 'as_iterator' is only supported for the 'pandas' output format.")
+            if db_node_properties:
+                raise ValueError("The parameter 'db_node_properties' is only supported for the 'pandas' output format.")
+
+            table = self._handle_properties_table(G, node_properties, node_labels, config)
+            if isinstance(table, DataFrame):
+                # the query was run via Cypher, so we bring the result into the column per property format of Arrow
+                # before converting it, as the property values of the long format may have different types
+                result = GraphNodePropertiesRunner._process_result(
+                    self._query_runner, node_properties, True, [], table, config
+                )
+                table = Table.from_pandas(result, preserve_index=False)
+
+            return self._to_output_format(table, output_format)
+
+        if as_iterator:
+            # Each batch is processed on its own, so that only one batch needs to be held in memory at a time
+            return (
+                GraphNodePropertiesRunner._process_result(
+                    self._query_runner, node_properties, separate_property_columns, db_node_properties, batch, config
+                )
+                for batch in self._handle_properties_batches(G, node_properties, node_labels, config)
+            )
 
         result = self._handle_properties(G, node_properties, node_labels, config)
 
@@ -201,6 +363,41 @@ class GraphRelationshipPropertyRunner(GraphEntityOpsBaseRunner):
 
 
 class GraphRelationshipPropertiesRunner(GraphEntityOpsBaseRunner):
+    @overload
+    def stream(
+        self,
+        G: Graph,
+        relationship_properties: List[str],
+        relationship_types: Strings = ...,
+        separate_property_columns: bool = ...,
+        output_format: Literal["pandas"] = ...,
+        **config: Any,
+    ) -> DataFrame: ...
+
+    @overload
+    def stream(
+        self,
+        G: Graph,
+        relationship_properties: List[str],
+        relationship_types: Strings = ...,
+        separate_property_columns: bool = ...,
+        *,
+        output_format: Literal["arrow"],
+        **config: Any,
+    ) -> Table: ...
+
+    @overload
+    def stream(
+        self,
+        G: Graph,
+        relationship_properties: List[str],
+        relationship_types: Strings = ...,
+        separate_property_columns: bool = ...,
+        *,
+        output_format: Literal["numpy"],
+        **config: Any,
+    ) -> NumpyColumns: ...
+
     @compatible_with("stream", min_inclusive=ServerVersion(2, 2, 0))
     def stream(
         self,
@@ -208,14 +405,30 @@ class GraphRelationshipPropertiesRunner(GraphEntityOpsBaseRunner):
         relationship_properties: List[str],
         relationship_types: Strings = ["*"],
         separate_property_columns: bool = False,
+        output_format: str = "pandas",
         **config: Any,
-    ) -> DataFrame:
+    ) -> Union[DataFrame, Table, NumpyColumns]:
         self._namespace += ".stream"
+        self._check_output_format(output_format)
 
         relationship_types = [relationship_types] if isinstance(relationship_types, str) else relationship_types
 
+        if output_format != "pandas":
+            table = self._handle_properties_table(G, relationship_properties, relationship_types, config)
+            if isinstance(table, DataFrame):
+                # the query was run via Cypher, so we bring the result into the column per property format of Arrow
+                # before converting it, as the property values of the long format may have different types
+                result = GraphRelationshipPropertiesRunner._process_result(table, True)
+                table = Table.from_pandas(result, preserve_index=False)
+
+            return self._to_output_format(table, output_format)
+
         result = self._handle_properties(G, relationship_properties, relationship_types, config)
 
+        return GraphRelationshipPropertiesRunner._process_result(result, separate_property_columns)
+
+    @staticmethod
+    def _process_result(result: DataFrame, separate_property_columns: bool) -> DataFrame:
         # new format was requested, but the query was run via Cypher
         if separate_property_columns and "propertyValue" in result.keys():
             result = result.pivot(
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+from copy import deepcopy
 from types import TracebackType
-from typing import Any, List, Optional, Type, Union
+from typing import Any, Dict, List, Optional, Type, Union
 
 from pandas import Series
 
 from ..call_parameters import CallParameters
+from ..query_runner.graph_info_cache import LIGHTWEIGHT_GRAPH_LIST_YIELDS
 from ..query_runner.query_runner import QueryRunner
 
 
@@ -16,10 +18,11 @@ class Graph:
     It contains summary information about the graph.
     """
 
-    def __init__(self, name: str, query_runner: QueryRunner):
+    def __init__(self, name: str, query_runner: QueryRunner, upload_settings: Optional[Dict[str, Any]] = None):
         self._name = name
         self._query_runner = query_runner
         self._db = query_runner.database()
+        self._upload_settings = upload_settings
 
     def __enter__(self: Graph) -> Graph:
         return self
@@ -39,7 +42,27 @@ class Graph:
         """
         return self._name
 
+    def upload_settings(self) -> Optional[Dict[str, Any]]:
+        """
+        Returns:
+            the batch settings chosen for uploading the graph via Arrow, if it was constructed by this object
+        """
+        return self._upload_settings
+
     def _graph_info(self, yields: List[str] = []) -> "Series[Any]":
+        graph_info_cache = self._query_runner.graph_info_cache()
+        if graph_info_cache is None or not set(yields).issubset(LIGHTWEIGHT_GRAPH_LIST_YIELDS):
+            return self._fetch_graph_info(yields)
+
+        info = graph_info_cache.get(self._db, self._name)
+        if info is None:
+            info = self._fetch_graph_info(LIGHTWEIGHT_GRAPH_LIST_YIELDS)
+            graph_info_cache.put(self._db, self._name, info)
+
+        # The snapshot is shared by all graph objects, so callers get a copy of its mutable values
+        return deepcopy(info[yields[0]] if len(yields) == 1 else info[yields])
+
+    def _fetch_graph_info(self, yields: List[str]) -> "Series[Any]":
         yield_db = "database" in yields
         yields_with_db = yields if yield_db else yields + ["database"]
 
@@ -169,6 +192,21 @@ class Graph:
         """
         return self._graph_info(["sizeInBytes"])  # type: ignore
 
+    def refresh(self) -> None:
+        """
+        Fetch the summary information about the graph from the graph catalog again.
+
+        The information is cached for a few seconds, and the cache is cleared automatically when the graph is modified
+        through the same `GraphDataScience` object. Refreshing is only needed to see changes made by other clients
+        before the cache expires.
+        """
+        graph_info_cache = self._query_runner.graph_info_cache()
+        if graph_info_cache is None:
+            return
+
+        graph_info_cache.invalidate(self._name)
+        graph_info_cache.put(self._db, self._name, self._fetch_graph_info(LIGHTWEIGHT_GRAPH_LIST_YIELDS))
+
     def exists(self) -> bool:
         """
         Returns:
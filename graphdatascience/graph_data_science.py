@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Any, Dict, Optional, Tuple, Type, Union
+from typing import Any, ContextManager, Dict, List, Optional, Tuple, Type, Union
 
 from neo4j import Driver
 from pandas import DataFrame
@@ -12,6 +12,7 @@ from .graph.graph_proc_runner import GraphProcRunner
 from .query_runner.arrow_info import ArrowInfo
 from .query_runner.arrow_query_runner import ArrowQueryRunner
 from .query_runner.neo4j_query_runner import Neo4jQueryRunner
+from .query_runner.progress.progress_sink import ProgressSink
 from .query_runner.query_runner import QueryRunner
 from .server_version.server_version import ServerVersion
 from .utils.util_proc_runner import UtilProcRunner
@@ -34,6 +35,10 @@ class GraphDataScience(DirectEndpoints, UncallableNamespace):
         arrow_disable_server_verification: bool = True,
         arrow_tls_root_certs: Optional[bytes] = None,
         bookmarks: Optional[Any] = None,
+        arrow_compression: Optional[str] = None,
+        managed_transactions: bool = False,
+        arrow_stream_via_mutate: bool = False,
+        arrow_download_concurrency: int = 1,
     ):
         """
         Construct a new GraphDataScience object.
@@ -63,6 +68,22 @@ class GraphDataScience(DirectEndpoints, UncallableNamespace):
             GDS Arrow Flight server.
         bookmarks : Optional[Any], default None
             The Neo4j bookmarks to require a certain state before the next query gets executed.
+        arrow_compression : Optional[str], default None
+            The IPC compression ("lz4" or "zstd") used for data sent to the GDS Arrow Flight server.
+            Compression reduces the amount of data transferred at the cost of CPU time, which pays off on slow networks.
+        managed_transactions : bool, default False
+            A flag that makes the client call read-only procedures in managed read transactions, which the driver
+            retries on transient errors such as cluster leader switches, and which may be routed to any cluster member
+            serving reads. Other procedures are not retried, as they may have modified data before failing.
+            Arbitrary Cypher queries are not affected.
+        arrow_stream_via_mutate : bool, default False
+            A flag that makes stream mode calls of supported algorithms, such as `gds.pageRank.stream`, run the
+            algorithm in mutate mode under a temporary property and stream the property back via Arrow.
+            The temporary property is dropped afterward, and the result has the same columns as over Bolt.
+        arrow_download_concurrency : int, default 1
+            The number of Arrow streams the client reads in parallel when streaming graph properties.
+            With a value larger than one, a property stream is fetched in one Arrow stream per node label or
+            relationship type that has the requested properties.
         """
         if aura_ds:
             GraphDataScience._validate_endpoint(endpoint)
@@ -70,7 +91,9 @@ class GraphDataScience(DirectEndpoints, UncallableNamespace):
         if isinstance(endpoint, QueryRunner):
             self._query_runner = endpoint
         else:
-            self._query_runner = Neo4jQueryRunner.create(endpoint, auth, aura_ds, database, bookmarks)
+            self._query_runner = Neo4jQueryRunner.create(
+                endpoint, auth, aura_ds, database, bookmarks, managed_transactions
+            )
 
         self._server_version = self._query_runner.server_version()
 
@@ -84,6 +107,9 @@ class GraphDataScience(DirectEndpoints, UncallableNamespace):
                 arrow_disable_server_verification,
                 arrow_tls_root_certs,
                 None if arrow is True else arrow,
+                arrow_compression,
+                arrow_stream_via_mutate,
+                arrow_download_concurrency,
             )
 
         super().__init__(self._query_runner, namespace="gds", server_version=self._server_version)
@@ -129,6 +155,33 @@ class GraphDataScience(DirectEndpoints, UncallableNamespace):
         """
         self._query_runner.set_bookmarks(bookmarks)
 
+    def set_progress_sinks(self, progress_sinks: List[ProgressSink]) -> None:
+        """
+        Set where procedures that log their progress report it to. By default, progress is shown as a tqdm progress bar.
+
+        Parameters
+        ----------
+        progress_sinks: List[ProgressSink]
+            The sinks receiving the progress. If empty, progress is not polled at all.
+        """
+        self._query_runner.set_progress_sinks(progress_sinks)
+
+    def progress_sinks(self, progress_sinks: List[ProgressSink]) -> ContextManager[None]:
+        """
+        Report the progress of procedures called on the current thread within the returned context to the given sinks,
+        instead of to the sinks set with `set_progress_sinks`.
+
+        Parameters
+        ----------
+        progress_sinks: List[ProgressSink]
+            The sinks receiving the progress. If empty, progress is not polled at all.
+
+        Returns
+        -------
+        A context manager to use in a `with` statement.
+        """
+        return self._query_runner.scoped_progress_sinks(progress_sinks)
+
     def database(self) -> Optional[str]:
         """
         Get the database which queries are run against.
@@ -203,6 +256,10 @@ class GraphDataScience(DirectEndpoints, UncallableNamespace):
         arrow_disable_server_verification: bool = True,
         arrow_tls_root_certs: Optional[bytes] = None,
         bookmarks: Optional[Any] = None,
+        arrow_compression: Optional[str] = None,
+        managed_transactions: bool = False,
+        arrow_stream_via_mutate: bool = False,
+        arrow_download_concurrency: int = 1,
     ) -> "GraphDataScience":
         return cls(
             driver,
@@ -212,6 +269,10 @@ class GraphDataScience(DirectEndpoints, UncallableNamespace):
             arrow_disable_server_verification=arrow_disable_server_verification,
             arrow_tls_root_certs=arrow_tls_root_certs,
             bookmarks=bookmarks,
+            arrow_compression=arrow_compression,
+            managed_transactions=managed_transactions,
+            arrow_stream_via_mutate=arrow_stream_via_mutate,
+            arrow_download_concurrency=arrow_download_concurrency,
         )
 
     @staticmethod
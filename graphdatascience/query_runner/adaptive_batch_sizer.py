@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import time
+from contextlib import contextmanager
+from threading import Condition
+from typing import Any, Dict, Iterator
+
+
+class AdaptiveBatchSizer:
+    """
+    Chooses the number of rows per Arrow batch from the width of the data and the measured throughput, and limits
+    the number of concurrent writes when the server is slow to accept them.
+
+    Batches start out at `target_batch_bytes`. Once writes were measured, they are sized so that each `write_batch`
+    takes about `target_write_seconds` at the throughput of a stream, within a factor of four of `target_batch_bytes`.
+    """
+
+    _MAX_BATCH_BYTES_FACTOR = 4
+
+    def __init__(
+        self,
+        target_batch_bytes: int,
+        max_in_flight: int,
+        max_write_seconds: float = 5.0,
+        target_write_seconds: float = 1.0,
+        min_chunk_size: int = 100,
+        max_chunk_size: int = 1_000_000,
+    ):
+        self._target_batch_bytes = target_batch_bytes
+        self._max_in_flight = max_in_flight
+        self._max_write_seconds = max_write_seconds
+        self._target_write_seconds = target_write_seconds
+        self._min_chunk_size = min_chunk_size
+        self._max_chunk_size = max_chunk_size
+
+        self._condition = Condition()
+        self._in_flight = 0
+        self._in_flight_limit = max_in_flight
+        self._chunk_size = min_chunk_size
+        self._batch_bytes = target_batch_bytes
+        self._bytes_written = 0
+        self._write_seconds = 0.0
+
+    def chunk_size(self, num_bytes: int, num_rows: int) -> int:
+        with self._condition:
+            if num_rows == 0:
+                return self._chunk_size
+
+            bytes_per_row = max(1, num_bytes // num_rows)
+            self._chunk_size = min(self._max_chunk_size, max(self._min_chunk_size, self._batch_bytes // bytes_per_row))
+
+            return self._chunk_size
+
+    @contextmanager
+    def write(self, num_bytes: int) -> Iterator[None]:
+        with self._condition:
+            self._condition.wait_for(lambda: self._in_flight < self._in_flight_limit)
+            self._in_flight += 1
+
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            elapsed = time.monotonic() - start
+            with self._condition:
+                self._in_flight -= 1
+                self._bytes_written += num_bytes
+                self._write_seconds += elapsed
+                self._adjust_in_flight_limit(elapsed)
+                self._adjust_batch_bytes()
+                self._condition.notify_all()
+
+    def _adjust_in_flight_limit(self, write_seconds: float) -> None:
+        # Slow writes mean that the server cannot keep up, so we back off one stream at a time
+        # and ramp up again once writes are fast
+        if write_seconds > self._max_write_seconds:
+            self._in_flight_limit = max(1, self._in_flight_limit - 1)
+        elif write_seconds < self._max_write_seconds / 2:
+            self._in_flight_limit = min(self._max_in_flight, self._in_flight_limit + 1)
+
+    def _adjust_batch_bytes(self) -> None:
+        # A slow stream gets smaller batches, so that back-pressure is applied at a finer granularity,
+        # and a fast stream gets larger ones, so that fewer writes are needed
+        if self._write_seconds <= 0:
+            return
+
+        throughput = self._bytes_written / self._write_seconds
+        self._batch_bytes = int(
+            min(
+                self._target_batch_bytes * self._MAX_BATCH_BYTES_FACTOR,
+                max(self._target_batch_bytes / self._MAX_BATCH_BYTES_FACTOR, throughput * self._target_write_seconds),
+            )
+        )
+
+    def throughput(self) -> float:
+        """Average number of bytes per second written by a single stream."""
+        with self._condition:
+            return self._bytes_written / self._write_seconds if self._write_seconds > 0 else 0.0
+
+    def settings(self) -> Dict[str, Any]:
+        with self._condition:
+            chunk_size, batch_bytes, in_flight_limit = self._chunk_size, self._batch_bytes, self._in_flight_limit
+
+        return {
+            "chunk_size": chunk_size,
+            "batch_bytes": batch_bytes,
+            "streams": in_flight_limit,
+            "MB/s per stream": round(self.throughput() / 1_000_000, 2),
+        }
@@ -14,6 +14,9 @@ class ArrowEndpointVersion(Enum):
     def prefix(self) -> str:
         return self._value_
 
+    def supports_dictionary_encoding(self) -> bool:
+        return self == ArrowEndpointVersion.V1
+
     @staticmethod
     def from_arrow_info(supported_arrow_versions: List[str]) -> ArrowEndpointVersion:
         # Fallback for pre 2.6.0 servers that do not support versions
@@ -1,21 +1,51 @@
 from __future__ import annotations
 
 import concurrent
+import itertools
 import math
+import multiprocessing
+import os
+import time
 import warnings
-from concurrent.futures import ThreadPoolExecutor
-from typing import Any, Dict, List, NoReturn, Optional
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from queue import Empty, Full, Queue
+from typing import Any, Callable, Dict, Iterator, List, NoReturn, Optional, Tuple, TypeVar, Union
 
 import numpy
 from pandas import DataFrame
-from pyarrow import Table
+from pyarrow import (
+    Array,
+    FixedSizeBufferWriter,
+    ListArray,
+    MockOutputStream,
+    RecordBatch,
+    RecordBatchReader,
+    Schema,
+    Table,
+    flight,
+    ipc,
+    py_buffer,
+)
+from pyarrow.types import is_large_string, is_list, is_string
 from tqdm.auto import tqdm
 
+from .adaptive_batch_sizer import AdaptiveBatchSizer
 from .gds_arrow_client import GdsArrowClient
-from .graph_constructor import GraphConstructor
+from .graph_constructor import EntityData, GraphConstructor
+
+T = TypeVar("T")
 
 
 class ArrowGraphConstructor(GraphConstructor):
+    _batches_per_partition = 10
+    # Number of rows of a dataframe converted to Arrow to estimate the size of its rows
+    _size_sample_rows = 1_000
+    # Columns with very few distinct values, which are sent dictionary encoded if the server supports it
+    _dictionary_columns = ["labels", "relationshipType"]
+
     def __init__(
         self,
         database: str,
@@ -23,7 +53,12 @@ class ArrowGraphConstructor(GraphConstructor):
         flight_client: GdsArrowClient,
         concurrency: int,
         undirected_relationship_types: Optional[List[str]],
-        chunk_size: int = 10_000,
+        chunk_size: Optional[int] = None,
+        target_batch_bytes: int = 8_000_000,
+        max_retries: int = 3,
+        retry_backoff_seconds: float = 1.0,
+        conversion_processes: Optional[int] = None,
+        dictionary_encode: bool = False,
     ):
         self._database = database
         self._concurrency = concurrency
@@ -32,10 +67,15 @@ class ArrowGraphConstructor(GraphConstructor):
         self._undirected_relationship_types = (
             [] if undirected_relationship_types is None else undirected_relationship_types
         )
+        # A fixed chunk size disables the adaptive sizing of batches
         self._chunk_size = chunk_size
-        self._min_batch_size = chunk_size * 10
+        self._batch_sizer = AdaptiveBatchSizer(target_batch_bytes, concurrency)
+        self._max_retries = max_retries
+        self._retry_backoff_seconds = retry_backoff_seconds
+        self._conversion_processes = conversion_processes
+        self._dictionary_encode = dictionary_encode
 
-    def run(self, node_dfs: List[DataFrame], relationship_dfs: List[DataFrame]) -> None:
+    def run(self, node_dfs: List[EntityData], relationship_dfs: List[EntityData]) -> None:
         try:
             config: Dict[str, Any] = {
                 "name": self._graph_name,
@@ -62,12 +102,29 @@ class ArrowGraphConstructor(GraphConstructor):
 
             raise e
 
-    def _partition_dfs(self, dfs: List[DataFrame]) -> List[DataFrame]:
-        partitioned_dfs: List[DataFrame] = []
+    def upload_settings(self) -> Optional[Dict[str, Any]]:
+        settings = self._batch_sizer.settings()
+        if self._chunk_size is not None:
+            settings["chunk_size"] = self._chunk_size
+
+        return settings
+
+    def _partition_dfs(self, dfs: List[Union[DataFrame, Table]]) -> List[Union[DataFrame, Table]]:
+        partitioned_dfs: List[Union[DataFrame, Table]] = []
 
         for df in dfs:
+            if isinstance(df, Table):
+                min_batch_size = self._chunk_size_for(df.nbytes, df.num_rows) * self._batches_per_partition
+                # Slicing a table is zero-copy, so we avoid converting to pandas and splitting with numpy
+                partitioned_dfs += [
+                    df.slice(offset, min_batch_size) for offset in range(0, df.num_rows, min_batch_size)
+                ]
+                continue
+
             num_rows = df.shape[0]
-            num_batches = math.ceil(num_rows / self._min_batch_size)
+            num_bytes = self._estimate_arrow_bytes(df)
+            min_batch_size = self._chunk_size_for(num_bytes, num_rows) * self._batches_per_partition
+            num_batches = math.ceil(num_rows / min_batch_size)
 
             # pandas 2.1.0 deprecates swapaxes, but numpy did not catch up yet.
             warnings.filterwarnings(
@@ -81,34 +138,277 @@ class ArrowGraphConstructor(GraphConstructor):
 
         return partitioned_dfs
 
-    def _send_df(self, df: DataFrame, entity_type: str, pbar: tqdm[NoReturn]) -> None:
-        table = Table.from_pandas(df)
-        batches = table.to_batches(self._chunk_size)
+    def _estimate_arrow_bytes(self, df: DataFrame) -> int:
+        # The memory usage of pandas counts object columns, such as lists or strings, as one pointer per row.
+        # Converting a sample instead gives the size of the rows as they are sent.
+        sample = df.head(self._size_sample_rows)
+        if len(sample) == 0:
+            return 0
+
+        sample_bytes = Table.from_pandas(sample, preserve_index=False).nbytes
+        return sample_bytes * df.shape[0] // len(sample)
+
+    def _send_df(self, df: Union[DataFrame, Table], entity_type: str, pbar: tqdm[NoReturn]) -> None:
+        table = df if isinstance(df, Table) else Table.from_pandas(df)
+        chunk_size = self._chunk_size_for(table.nbytes, table.num_rows)
+        batches = table.to_batches(chunk_size)
+        self._send_batches(table.schema, batches, entity_type, pbar)
+
+    @contextmanager
+    def _conversion_pool(
+        self, partitions: List[Union[DataFrame, Table]]
+    ) -> Iterator[Optional[Tuple[ProcessPoolExecutor, int]]]:
+        if self._conversion_processes is None or not any(isinstance(df, DataFrame) for df in partitions):
+            yield None
+            return
+
+        if "fork" not in multiprocessing.get_all_start_methods():
+            warnings.warn(
+                "Converting dataframes in separate processes requires the 'fork' start method, which is not available "
+                "on this platform. The dataframes are converted on the upload threads instead."
+            )
+            yield None
+            return
+
+        # Pickling the partitions for the workers would take as long as converting them, so forked workers inherit
+        # them instead and are only sent their index
+        key = next(_conversion_keys)
+        _conversion_partitions[key] = partitions
+        try:
+            fork_context = multiprocessing.get_context("fork")
+            with ProcessPoolExecutor(self._conversion_processes, mp_context=fork_context) as pool:
+                # The first task forks all workers, which we do before the upload threads start
+                pool.submit(os.getpid).result()
+                yield pool, key
+        finally:
+            del _conversion_partitions[key]
+
+    def _send_converted_df(
+        self, conversion_pool: Tuple[ProcessPoolExecutor, int], index: int, entity_type: str, pbar: tqdm[NoReturn]
+    ) -> None:
+        # Converting object columns holds the GIL, so it is done in a separate process. The upload thread waits
+        # for the result, which bounds the number of converted partitions held in memory by the concurrency.
+        process_pool, key = conversion_pool
+        name, size = process_pool.submit(_to_shared_ipc_stream, key, index).result()
+
+        shared_memory = SharedMemory(name=name)
+        try:
+            self._send_ipc_stream(shared_memory.buf[:size], entity_type, pbar)
+        finally:
+            try:
+                shared_memory.close()
+            except BufferError:
+                # Batches referenced by a pending exception keep the mapping alive until they are collected
+                pass
+            shared_memory.unlink()
+
+    def _send_ipc_stream(self, buffer: memoryview, entity_type: str, pbar: tqdm[NoReturn]) -> None:
+        # Reading the stream is zero-copy, so the batches point directly into the shared memory
+        table = ipc.open_stream(buffer).read_all()
+        self._send_df(table, entity_type, pbar)
+
+    def _send_batches(self, schema: Schema, batches: List[RecordBatch], entity_type: str, pbar: tqdm[NoReturn]) -> None:
         flight_descriptor = {"name": self._graph_name, "entity_type": entity_type}
 
-        writer, _ = self._client.start_put(flight_descriptor, table.schema)
+        schema, batches = self._encode_dictionary_columns(schema, batches)
+        # Only opening the stream is retried. Once batches were written, the server may have ingested some of them,
+        # and sending them again would duplicate their nodes or relationships in the graph.
+        writer, _ = self._with_retries(lambda: self._client.start_put(flight_descriptor, schema))
 
         try:
             with writer:
                 # Write table in chunks
                 for partition in batches:
-                    writer.write_batch(partition)
+                    with self._batch_sizer.write(partition.nbytes):
+                        writer.write_batch(partition)
                     pbar.update(partition.num_rows)
             # Force a refresh to avoid the progress bar getting stuck at 0%
             pbar.refresh()
         except Exception as e:
             GdsArrowClient.handle_flight_error(e)
 
-    def _send_dfs(self, dfs: List[DataFrame], entity_type: str) -> None:
-        desc = "Uploading Nodes" if entity_type == "node" else "Uploading Relationships"
-        pbar = tqdm(total=sum([df.shape[0] for df in dfs]), unit="Records", desc=desc)
+    def _encode_dictionary_columns(
+        self, schema: Schema, batches: List[RecordBatch]
+    ) -> Tuple[Schema, List[RecordBatch]]:
+        columns = [name for name in self._dictionary_columns if name in schema.names]
+        if not self._dictionary_encode or not columns:
+            return schema, batches
+
+        table = Table.from_batches(batches, schema)
+        for name in columns:
+            # Encoding the combined column gives all batches of the stream the same dictionary
+            encoded = self._dictionary_encode_array(table.column(name).combine_chunks())
+            table = table.set_column(table.schema.get_field_index(name), name, encoded)
+
+        return table.schema, table.to_batches()
+
+    @staticmethod
+    def _dictionary_encode_array(array: Array) -> Array:
+        if is_string(array.type) or is_large_string(array.type):
+            return array.dictionary_encode()
 
-        partitioned_dfs = self._partition_dfs(dfs)
+        if is_list(array.type) and (is_string(array.type.value_type) or is_large_string(array.type.value_type)):
+            return ListArray.from_arrays(
+                array.offsets, array.values.dictionary_encode(), mask=array.is_null() if array.null_count else None
+            )
+
+        # Columns that are already dictionary encoded, for example from a categorical pandas column, are kept as is
+        return array
+
+    def _with_retries(self, action: Callable[[], T]) -> T:
+        attempt = 0
+        while True:
+            try:
+                return action()
+            except (flight.FlightUnavailableError, flight.FlightTimedOutError) as e:
+                if attempt >= self._max_retries:
+                    raise e
+
+                # Transient connection errors are retried with exponential backoff instead of aborting the upload
+                time.sleep(self._retry_backoff_seconds * 2**attempt)
+                attempt += 1
+
+    def _send_reader(self, reader: RecordBatchReader, entity_type: str, pbar: tqdm[NoReturn]) -> None:
+        # The reader is consumed on this thread and its batches are handed to the upload threads through a bounded
+        # queue, so that only a few batches are held in memory regardless of the size of the input
+        batch_queue: Queue[Optional[RecordBatch]] = Queue(maxsize=self._concurrency * 2)
 
         with ThreadPoolExecutor(self._concurrency) as executor:
-            futures = [executor.submit(self._send_df, df, entity_type, pbar) for df in partitioned_dfs]
+            futures = [
+                executor.submit(self._send_queued_batches, reader.schema, batch_queue, entity_type, pbar)
+                for _ in range(self._concurrency)
+            ]
+
+            try:
+                for batch in self._rechunk(reader):
+                    self._enqueue(batch_queue, batch, futures)
+
+                for _ in futures:
+                    self._enqueue(batch_queue, None, futures)
+            except (Exception, KeyboardInterrupt) as e:
+                # Unblock the upload threads before the executor waits for them
+                while not batch_queue.empty():
+                    try:
+                        batch_queue.get_nowait()
+                    except Empty:
+                        break
+                for _ in futures:
+                    batch_queue.put_nowait(None)
+
+                raise e
 
             for future in concurrent.futures.as_completed(futures):
                 if not future.exception():
                     continue
                 raise future.exception()  # type: ignore
+
+    @staticmethod
+    def _enqueue(
+        batch_queue: Queue[Optional[RecordBatch]], batch: Optional[RecordBatch], futures: List[Future[None]]
+    ) -> None:
+        while True:
+            try:
+                batch_queue.put(batch, timeout=0.1)
+                return
+            except Full:
+                # An upload thread that failed stops consuming the queue, so we surface its error instead of waiting
+                for future in futures:
+                    if future.done():
+                        future.result()
+
+    def _send_queued_batches(
+        self, schema: Schema, batch_queue: Queue[Optional[RecordBatch]], entity_type: str, pbar: tqdm[NoReturn]
+    ) -> None:
+        # The batches are sent in partitions of a bounded size, so that each stream only holds a few of them
+        done = False
+        while not done:
+            partition: List[RecordBatch] = []
+            while len(partition) < self._batches_per_partition:
+                batch = batch_queue.get()
+                if batch is None:
+                    done = True
+                    break
+                partition.append(batch)
+
+            if partition:
+                self._send_batches(schema, partition, entity_type, pbar)
+
+    def _rechunk(self, reader: RecordBatchReader) -> Iterator[RecordBatch]:
+        # The batches of a reader can have any size, so we slice them into chunks like we do for tables
+        for batch in reader:
+            chunk_size = self._chunk_size_for(batch.nbytes, batch.num_rows)
+            for offset in range(0, batch.num_rows, chunk_size):
+                yield batch.slice(offset, chunk_size)
+
+    def _chunk_size_for(self, num_bytes: int, num_rows: int) -> int:
+        if self._chunk_size is not None:
+            return self._chunk_size
+
+        return self._batch_sizer.chunk_size(num_bytes, num_rows)
+
+    @staticmethod
+    def _num_rows(df: EntityData) -> Optional[int]:
+        if isinstance(df, RecordBatchReader):
+            return None
+
+        return df.num_rows if isinstance(df, Table) else df.shape[0]
+
+    def _send_dfs(self, dfs: List[EntityData], entity_type: str) -> None:
+        desc = "Uploading Nodes" if entity_type == "node" else "Uploading Relationships"
+        row_counts = [self._num_rows(df) for df in dfs]
+        # The number of rows of a reader is only known once it has been consumed
+        total = None if None in row_counts else sum(row_counts)  # type: ignore
+        pbar = tqdm(total=total, unit="Records", desc=desc)
+
+        readers = [df for df in dfs if isinstance(df, RecordBatchReader)]
+        partitioned_dfs = self._partition_dfs([df for df in dfs if not isinstance(df, RecordBatchReader)])
+
+        for reader in readers:
+            self._send_reader(reader, entity_type, pbar)
+
+        with self._conversion_pool(partitioned_dfs) as pool, ThreadPoolExecutor(self._concurrency) as executor:
+            futures = [
+                (
+                    executor.submit(self._send_converted_df, pool, index, entity_type, pbar)
+                    if pool is not None and isinstance(df, DataFrame)
+                    else executor.submit(self._send_df, df, entity_type, pbar)
+                )
+                for index, df in enumerate(partitioned_dfs)
+            ]
+
+            for future in concurrent.futures.as_completed(futures):
+                if not future.exception():
+                    continue
+                raise future.exception()  # type: ignore
+
+        # Report the batch settings chosen for the upload
+        pbar.set_postfix(self.upload_settings())
+
+
+# Partitions that are converted by forked worker processes, which inherit them from the parent process
+_conversion_partitions: Dict[int, List[Union[DataFrame, Table]]] = {}
+_conversion_keys = itertools.count()
+
+
+def _to_shared_ipc_stream(key: int, index: int) -> Tuple[str, int]:
+    table = Table.from_pandas(_conversion_partitions[key][index])
+
+    # The stream is written straight into the shared memory, which is sized by writing it to a mock stream first
+    mock_sink = MockOutputStream()
+    with ipc.new_stream(mock_sink, table.schema) as writer:
+        writer.write_table(table)
+    size = mock_sink.size()
+
+    shared_memory = SharedMemory(create=True, size=max(1, size))
+    sink = FixedSizeBufferWriter(py_buffer(shared_memory.buf))
+    with ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    # The writers export the memory of the segment, which must be released before it can be closed
+    del writer, sink
+    shared_memory.close()
+    if os.name == "posix":
+        # The parent process attaches to the segment and unlinks it once it is sent, so it takes over the ownership.
+        # Otherwise the resource tracker would report the segment as leaked, or unlink it a second time.
+        resource_tracker.unregister(shared_memory._name, "shared_memory")  # type: ignore[attr-defined]
+
+    return shared_memory.name, size
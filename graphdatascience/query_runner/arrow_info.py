@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import List
+from typing import Any, List
 
+from ..query_runner.async_query_runner import AsyncQueryRunner
 from ..query_runner.query_runner import QueryRunner
 from ..server_version.server_version import ServerVersion
 
@@ -16,14 +17,33 @@ class ArrowInfo:
 
     @staticmethod
     def create(query_runner: QueryRunner) -> ArrowInfo:
-        debugYields = ["listenAddress", "enabled", "running"]
-        if query_runner.server_version() > ServerVersion(2, 6, 0):
-            debugYields.append("versions")
+        debugYields = ArrowInfo._debug_yields(query_runner.server_version())
 
         procResult = query_runner.call_procedure(
             endpoint="gds.debug.arrow", custom_error=False, yields=debugYields
         ).iloc[0]
 
+        return ArrowInfo._from_result(procResult)
+
+    @staticmethod
+    async def create_async(query_runner: AsyncQueryRunner) -> ArrowInfo:
+        debugYields = ArrowInfo._debug_yields(await query_runner.server_version())
+
+        procResult = (
+            await query_runner.call_procedure(endpoint="gds.debug.arrow", custom_error=False, yields=debugYields)
+        ).iloc[0]
+
+        return ArrowInfo._from_result(procResult)
+
+    @staticmethod
+    def _debug_yields(server_version: ServerVersion) -> List[str]:
+        debugYields = ["listenAddress", "enabled", "running"]
+        if server_version > ServerVersion(2, 6, 0):
+            debugYields.append("versions")
+        return debugYields
+
+    @staticmethod
+    def _from_result(procResult: Any) -> ArrowInfo:
         return ArrowInfo(
             listenAddress=procResult["listenAddress"],
             enabled=procResult["enabled"],
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
 import warnings
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, ContextManager, Dict, Iterator, List, Optional, Set, Tuple, Union
+from uuid import uuid4
 
+import numpy
 from pandas import DataFrame
+from pyarrow import Table
 
 from ..call_parameters import CallParameters
 from ..query_runner.arrow_info import ArrowInfo
@@ -14,9 +17,33 @@ from ..server_version.server_version import ServerVersion
 from .arrow_graph_constructor import ArrowGraphConstructor
 from .gds_arrow_client import GdsArrowClient
 from .graph_constructor import GraphConstructor
+from .graph_info_cache import LIGHTWEIGHT_GRAPH_LIST_YIELDS, GraphInfoCache
+from .progress.progress_sink import ProgressSink
 from .query_runner import QueryRunner
 
 
+# Stream mode procedures that can be run in mutate mode, with the name of the result column they stream
+NODE_PROPERTY_STREAMS = {
+    "gds.articleRank": "score",
+    "gds.betweenness": "score",
+    "gds.degree": "score",
+    "gds.eigenvector": "score",
+    "gds.pageRank": "score",
+    "gds.fastRP": "embedding",
+    "gds.hashgnn": "embedding",
+    "gds.node2vec": "embedding",
+    "gds.kcore": "coreValue",
+    "gds.labelPropagation": "communityId",
+    "gds.localClusteringCoefficient": "localClusteringCoefficient",
+    "gds.triangleCount": "triangleCount",
+    "gds.wcc": "componentId",
+}
+RELATIONSHIP_PROPERTY_STREAMS = {
+    "gds.knn": ("node1", "node2", "similarity"),
+    "gds.nodeSimilarity": ("node1", "node2", "similarity"),
+}
+
+
 class ArrowQueryRunner(QueryRunner):
     @staticmethod
     def create(
@@ -27,6 +54,9 @@ class ArrowQueryRunner(QueryRunner):
         disable_server_verification: bool = False,
         tls_root_certs: Optional[bytes] = None,
         connection_string_override: Optional[str] = None,
+        compression: Optional[str] = None,
+        stream_via_mutate: bool = False,
+        download_concurrency: int = 1,
     ) -> ArrowQueryRunner:
         if not arrow_info.enabled:
             raise ValueError("Arrow is not enabled on the server")
@@ -39,24 +69,33 @@ class ArrowQueryRunner(QueryRunner):
             disable_server_verification,
             tls_root_certs,
             connection_string_override,
+            compression,
         )
 
-        return ArrowQueryRunner(gds_arrow_client, fallback_query_runner, fallback_query_runner.server_version())
+        return ArrowQueryRunner(
+            gds_arrow_client,
+            fallback_query_runner,
+            fallback_query_runner.server_version(),
+            stream_via_mutate,
+            download_concurrency,
+        )
 
     def __init__(
         self,
         gds_arrow_client: GdsArrowClient,
         fallback_query_runner: QueryRunner,
         server_version: ServerVersion,
+        stream_via_mutate: bool = False,
+        download_concurrency: int = 1,
     ):
         self._fallback_query_runner = fallback_query_runner
         self._gds_arrow_client = gds_arrow_client
         self._server_version = server_version
+        self._stream_via_mutate = stream_via_mutate
+        self._download_concurrency = download_concurrency
 
     def warn_about_deprecation(self, old_endpoint: str, new_endpoint: str) -> None:
-        warnings.warn(
-            DeprecationWarning(f"The endpoint '{old_endpoint}' is deprecated. Please use '{new_endpoint}' instead.")
-        )
+        warn_about_deprecation(old_endpoint, new_endpoint)
 
     def run_cypher(
         self,
@@ -82,128 +121,233 @@ class ArrowQueryRunner(QueryRunner):
         if params is None:
             params = CallParameters()
 
-        new_endpoint_server_version = ServerVersion(2, 2, 0)
-        no_tier_in_namespace_server_version = ServerVersion(2, 5, 0)
+        property_stream = resolve_property_stream(endpoint, params, self._server_version)
+        if property_stream is not None:
+            arrow_endpoint, graph_name, config = property_stream
+            table = self._get_property_table(graph_name, arrow_endpoint, config)
+            return self._gds_arrow_client.table_to_pandas(table)
 
-        # We need to support the deprecated endpoints until they get removed on the server side
-        if (
-            old_endpoint := ("gds.graph.streamNodeProperty" == endpoint)
-        ) or "gds.graph.nodeProperty.stream" == endpoint:
-            graph_name = params["graph_name"]
-            property_name = params["properties"]
-            node_labels = params["entities"]
+        if self._stream_via_mutate and yields is None and self._server_version >= ServerVersion(2, 2, 0):
+            algorithm = endpoint[: -len(".stream")] if endpoint.endswith(".stream") else None
+            if algorithm in NODE_PROPERTY_STREAMS:
+                return self._stream_node_property_via_mutate(algorithm, params, logging)
+            if algorithm in RELATIONSHIP_PROPERTY_STREAMS:
+                return self._stream_relationship_property_via_mutate(algorithm, params, logging)
 
-            config = {"node_property": property_name, "node_labels": node_labels}
+        return self._fallback_query_runner.call_procedure(endpoint, params, yields, database, logging, custom_error)
 
-            if "listNodeLabels" in params["config"]:
-                config["list_node_labels"] = params["config"]["listNodeLabels"]
+    def _stream_node_property_via_mutate(self, algorithm: str, params: CallParameters, logging: bool) -> DataFrame:
+        """
+        Run the algorithm in mutate mode under a temporary property, stream the property via Arrow and drop it again.
+        The result has the same columns as the result of the stream mode procedure.
+        """
+        graph_name = params["graph_name"]
+        property_name = f"__stream_{uuid4().hex}"
+        config = {**params.get("config", {}), "mutateProperty": property_name}
+
+        self._fallback_query_runner.call_procedure(
+            f"{algorithm}.mutate", CallParameters(graph_name=graph_name, config=config), logging=logging
+        )
 
-            if self._server_version < new_endpoint_server_version:
-                endpoint = "gds.graph.streamNodeProperty"
-            else:
-                endpoint = "gds.graph.nodeProperty.stream"
-                if old_endpoint:
-                    self.warn_about_deprecation(
-                        old_endpoint="gds.graph.streamNodeProperty", new_endpoint="gds.graph.nodeProperty.stream"
-                    )
+        def drop() -> None:
+            self._fallback_query_runner.call_procedure(
+                "gds.graph.nodeProperties.drop",
+                CallParameters(graph_name=graph_name, node_properties=[property_name], config={}),
+                custom_error=False,
+            )
 
-            return self._gds_arrow_client.get_property(self.database(), graph_name, endpoint, config)
-        elif (
-            old_endpoint := ("gds.graph.streamNodeProperties" == endpoint)
-        ) or "gds.graph.nodeProperties.stream" == endpoint:
-            graph_name = params["graph_name"]
+        try:
+            stream_config = {"node_property": property_name, "node_labels": config.get("nodeLabels", ["*"])}
+            table = self._get_property_table(graph_name, "gds.graph.nodeProperty.stream", stream_config)
+        except BaseException:
+            self._drop_after_failure(drop, f"node property '{property_name}' of graph '{graph_name}'")
+            raise
+        drop()
 
-            config = {"node_properties": params["properties"], "node_labels": params["entities"]}
+        result = self._gds_arrow_client.table_to_pandas(table)
+        result_column = NODE_PROPERTY_STREAMS[algorithm]
+        return result.rename(columns={"propertyValue": result_column, property_name: result_column})
 
-            if "listNodeLabels" in params["config"]:
-                config["list_node_labels"] = params["config"]["listNodeLabels"]
+    def _stream_relationship_property_via_mutate(
+        self, algorithm: str, params: CallParameters, logging: bool
+    ) -> DataFrame:
+        """
+        Run the algorithm in mutate mode under a temporary relationship type, stream the relationships via Arrow
+        and drop them again. The result has the same columns as the result of the stream mode procedure.
+        """
+        graph_name = params["graph_name"]
+        relationship_type = f"__STREAM_{uuid4().hex}"
+        property_name = "score"
+        config = {
+            **params.get("config", {}),
+            "mutateRelationshipType": relationship_type,
+            "mutateProperty": property_name,
+        }
+
+        self._fallback_query_runner.call_procedure(
+            f"{algorithm}.mutate", CallParameters(graph_name=graph_name, config=config), logging=logging
+        )
 
-            if self._server_version < new_endpoint_server_version:
-                endpoint = "gds.graph.streamNodeProperties"
-            else:
-                endpoint = "gds.graph.nodeProperties.stream"
-                if old_endpoint:
-                    self.warn_about_deprecation(
-                        old_endpoint="gds.graph.streamNodeProperties", new_endpoint="gds.graph.nodeProperties.stream"
-                    )
-            return self._gds_arrow_client.get_property(
-                self.database(),
-                graph_name,
-                endpoint,
-                config,
+        def drop() -> None:
+            self._fallback_query_runner.call_procedure(
+                "gds.graph.relationships.drop",
+                CallParameters(graph_name=graph_name, relationship_type=relationship_type),
+                custom_error=False,
             )
-        elif (
-            old_endpoint := ("gds.graph.streamRelationshipProperty" == endpoint)
-        ) or "gds.graph.relationshipProperty.stream" == endpoint:
-            graph_name = params["graph_name"]
-            property_name = params["properties"]
-            relationship_types = params["entities"]
-
-            if self._server_version < new_endpoint_server_version:
-                endpoint = "gds.graph.streamRelationshipProperty"
-            else:
-                endpoint = "gds.graph.relationshipProperty.stream"
-                if old_endpoint:
-                    self.warn_about_deprecation(
-                        old_endpoint="gds.graph.streamRelationshipProperty",
-                        new_endpoint="gds.graph.relationshipProperty.stream",
-                    )
-            return self._gds_arrow_client.get_property(
-                self.database(),
-                graph_name,
-                endpoint,
-                {"relationship_property": property_name, "relationship_types": relationship_types},
-            )
-        elif (
-            old_endpoint := ("gds.graph.streamRelationshipProperties" == endpoint)
-        ) or "gds.graph.relationshipProperties.stream" == endpoint:
-            graph_name = params["graph_name"]
-            property_names = params["properties"]
-            relationship_types = params["entities"]
-
-            if self._server_version < new_endpoint_server_version:
-                endpoint = "gds.graph.streamRelationshipProperties"
-            else:
-                endpoint = "gds.graph.relationshipProperties.stream"
-                if old_endpoint:
-                    self.warn_about_deprecation(
-                        old_endpoint="gds.graph.streamRelationshipProperties",
-                        new_endpoint="gds.graph.relationshipProperties.stream",
-                    )
 
-            return self._gds_arrow_client.get_property(
-                self.database(),
-                graph_name,
-                endpoint,
-                {"relationship_properties": property_names, "relationship_types": relationship_types},
-            )
-        elif (
-            old_endpoint := ("gds.beta.graph.relationships.stream" == endpoint)
-        ) or "gds.graph.relationships.stream" == endpoint:
-            graph_name = params["graph_name"]
-            relationship_types = params["relationship_types"]
-
-            if self._server_version < new_endpoint_server_version:
-                raise IncompatibleServerVersionError(
-                    f"The call gds.beta.graph.relationships.stream with parameters {params} via Arrow requires GDS "
-                    f"server version >= 2.2.0. The current version is {self._server_version}"
-                )
-            else:
-                if self._server_version < no_tier_in_namespace_server_version:
-                    endpoint = "gds.beta.graph.relationships.stream"
-                else:
-                    endpoint = "gds.graph.relationships.stream"
-                    if old_endpoint:
-                        self.warn_about_deprecation(
-                            old_endpoint="gds.beta.graph.relationships.stream",
-                            new_endpoint="gds.graph.relationships.stream",
-                        )
-
-            return self._gds_arrow_client.get_property(
-                self.database(), graph_name, endpoint, {"relationship_types": relationship_types}
+        try:
+            stream_config = {"relationship_property": property_name, "relationship_types": [relationship_type]}
+            table = self._get_property_table(graph_name, "gds.graph.relationshipProperty.stream", stream_config)
+        except BaseException:
+            self._drop_after_failure(drop, f"relationship type '{relationship_type}' of graph '{graph_name}'")
+            raise
+        drop()
+
+        source_column, target_column, property_column = RELATIONSHIP_PROPERTY_STREAMS[algorithm]
+        result = self._gds_arrow_client.table_to_pandas(table).drop(columns=["relationshipType"], errors="ignore")
+        return result.rename(
+            columns={
+                "sourceNodeId": source_column,
+                "targetNodeId": target_column,
+                "propertyValue": property_column,
+                property_name: property_column,
+            }
+        )
+
+    @staticmethod
+    def _drop_after_failure(drop: Callable[[], None], description: str) -> None:
+        # The error of the stream is more useful than an error of the cleanup it caused, so the latter is only a warning
+        try:
+            drop()
+        except Exception as e:
+            warnings.warn(f"Failed to drop the temporary {description}: {e}")
+
+    def call_procedure_batches(
+        self,
+        endpoint: str,
+        params: Optional[CallParameters] = None,
+        yields: Optional[List[str]] = None,
+        database: Optional[str] = None,
+        custom_error: bool = True,
+        batch_size: Optional[int] = None,
+    ) -> Iterator[DataFrame]:
+        if params is None:
+            params = CallParameters()
+
+        property_stream = resolve_property_stream(endpoint, params, self._server_version)
+        if property_stream is not None:
+            arrow_endpoint, graph_name, config = property_stream
+            return self._gds_arrow_client.get_property_batches(self.database(), graph_name, arrow_endpoint, config)
+
+        return self._fallback_query_runner.call_procedure_batches(
+            endpoint, params, yields, database, custom_error, batch_size
+        )
+
+    def call_procedure_arrow(
+        self,
+        endpoint: str,
+        params: Optional[CallParameters] = None,
+        yields: Optional[List[str]] = None,
+        database: Optional[str] = None,
+        custom_error: bool = True,
+    ) -> Union[Table, DataFrame]:
+        if params is None:
+            params = CallParameters()
+
+        property_stream = resolve_property_stream(endpoint, params, self._server_version)
+        if property_stream is not None:
+            arrow_endpoint, graph_name, config = property_stream
+            return self._get_property_table(graph_name, arrow_endpoint, config)
+
+        return self._fallback_query_runner.call_procedure_arrow(endpoint, params, yields, database, custom_error)
+
+    def _get_property_table(self, graph_name: str, endpoint: str, config: Dict[str, Any]) -> Table:
+        partitions = self._partition_configurations(graph_name, config) if self._download_concurrency > 1 else []
+
+        if len(partitions) <= 1:
+            return self._gds_arrow_client.get_property_table(self.database(), graph_name, endpoint, config)
+
+        table = self._gds_arrow_client.get_property_table_partitioned(
+            self.database(), graph_name, endpoint, partitions, min(self._download_concurrency, len(partitions))
+        )
+
+        if "node_labels" in config:
+            # A node with multiple labels is part of several partitions, so we keep only its first occurrence
+            _, first_indices = numpy.unique(table["nodeId"].to_numpy(), return_index=True)
+            table = table.take(numpy.sort(first_indices))
+
+        return table
+
+    def _partition_configurations(self, graph_name: str, config: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Split the configuration of a property stream into one configuration per node label or relationship type
+        that has the requested properties. Returns no configurations if the stream should not be split.
+        """
+        for entity_key, property_keys, schema_key in [
+            ("node_labels", ["node_property", "node_properties"], "nodes"),
+            ("relationship_types", ["relationship_property", "relationship_properties"], "relationships"),
+        ]:
+            if entity_key not in config:
+                continue
+
+            entities = config[entity_key]
+            entities = [entities] if isinstance(entities, str) else list(entities)
+            all_entities = "*" in entities
+            if not all_entities and len(entities) <= 1:
+                return []
+
+            properties: Set[str] = set()
+            for property_key in property_keys:
+                requested = config.get(property_key, [])
+                properties.update([requested] if isinstance(requested, str) else requested)
+
+            schema = self._graph_schema(graph_name)
+            if schema is None:
+                return []
+
+            entity_properties = schema[schema_key]
+            if all_entities:
+                entities = list(entity_properties.keys())
+
+            # Graphs projected without labels or types cannot be filtered by them
+            if "__ALL__" in entities:
+                return []
+
+            with_properties = [entity for entity in entities if properties.issubset(entity_properties.get(entity, {}))]
+            without_properties = [
+                entity for entity in entities if properties.isdisjoint(entity_properties.get(entity, {}))
+            ]
+            # A stream over all labels or types skips the ones without the properties. Any other mismatch is left
+            # to the server to reject
+            skipped = len(without_properties) if all_entities else 0
+            if len(with_properties) + skipped != len(entities):
+                return []
+
+            return [{**config, entity_key: [entity]} for entity in with_properties]
+
+        return []
+
+    def _graph_schema(self, graph_name: str) -> Optional[Dict[str, Any]]:
+        graph_info_cache = self.graph_info_cache()
+        info = graph_info_cache.get(self.database(), graph_name) if graph_info_cache is not None else None
+
+        if info is None:
+            graph_list = self._fallback_query_runner.call_procedure(
+                endpoint="gds.graph.list",
+                params=CallParameters(graph_name=graph_name),
+                yields=LIGHTWEIGHT_GRAPH_LIST_YIELDS,
+                custom_error=False,
             )
+            graph_list = graph_list[graph_list["database"] == self.database()] if len(graph_list) > 0 else graph_list
+            if len(graph_list) == 0:
+                return None
 
-        return self._fallback_query_runner.call_procedure(endpoint, params, yields, database, logging, custom_error)
+            info = graph_list.iloc[0]
+            # Later streams, and the graph object, can then reuse the information
+            if graph_info_cache is not None:
+                graph_info_cache.put(self.database(), graph_name, info)
+
+        return info["schema"]  # type: ignore
 
     def server_version(self) -> ServerVersion:
         return self._fallback_query_runner.server_version()
@@ -220,6 +364,15 @@ class ArrowQueryRunner(QueryRunner):
     def set_bookmarks(self, bookmarks: Optional[Any]) -> None:
         self._fallback_query_runner.set_bookmarks(bookmarks)
 
+    def set_progress_sinks(self, progress_sinks: List[ProgressSink]) -> None:
+        self._fallback_query_runner.set_progress_sinks(progress_sinks)
+
+    def graph_info_cache(self) -> Optional[GraphInfoCache]:
+        return self._fallback_query_runner.graph_info_cache()
+
+    def scoped_progress_sinks(self, progress_sinks: List[ProgressSink]) -> ContextManager[None]:
+        return self._fallback_query_runner.scoped_progress_sinks(progress_sinks)
+
     def database(self) -> Optional[str]:
         return self._fallback_query_runner.database()
 
@@ -237,7 +390,11 @@ class ArrowQueryRunner(QueryRunner):
         return self._fallback_query_runner
 
     def create_graph_constructor(
-        self, graph_name: str, concurrency: int, undirected_relationship_types: Optional[List[str]]
+        self,
+        graph_name: str,
+        concurrency: int,
+        undirected_relationship_types: Optional[List[str]],
+        **upload_options: Any,
     ) -> GraphConstructor:
         database = self.database()
         if not database:
@@ -252,4 +409,132 @@ class ArrowQueryRunner(QueryRunner):
             self._gds_arrow_client,
             concurrency,
             undirected_relationship_types,
+            dictionary_encode=self._gds_arrow_client.arrow_endpoint_version().supports_dictionary_encoding(),
+            **upload_options,
         )
+
+
+def warn_about_deprecation(old_endpoint: str, new_endpoint: str) -> None:
+    warnings.warn(
+        DeprecationWarning(f"The endpoint '{old_endpoint}' is deprecated. Please use '{new_endpoint}' instead.")
+    )
+
+
+def resolve_property_stream(
+    endpoint: str, params: CallParameters, server_version: ServerVersion
+) -> Optional[Tuple[str, str, Dict[str, Any]]]:
+    """
+    Returns the Arrow endpoint, graph name and configuration to stream the result via Arrow,
+    or `None` if the procedure should be called via the fallback query runner.
+    """
+    new_endpoint_server_version = ServerVersion(2, 2, 0)
+    no_tier_in_namespace_server_version = ServerVersion(2, 5, 0)
+
+    # We need to support the deprecated endpoints until they get removed on the server side
+    if (old_endpoint := ("gds.graph.streamNodeProperty" == endpoint)) or "gds.graph.nodeProperty.stream" == endpoint:
+        graph_name = params["graph_name"]
+        property_name = params["properties"]
+        node_labels = params["entities"]
+
+        config = {"node_property": property_name, "node_labels": node_labels}
+
+        if "listNodeLabels" in params["config"]:
+            config["list_node_labels"] = params["config"]["listNodeLabels"]
+
+        if server_version < new_endpoint_server_version:
+            endpoint = "gds.graph.streamNodeProperty"
+        else:
+            endpoint = "gds.graph.nodeProperty.stream"
+            if old_endpoint:
+                warn_about_deprecation(
+                    old_endpoint="gds.graph.streamNodeProperty", new_endpoint="gds.graph.nodeProperty.stream"
+                )
+
+        return endpoint, graph_name, config
+    elif (
+        old_endpoint := ("gds.graph.streamNodeProperties" == endpoint)
+    ) or "gds.graph.nodeProperties.stream" == endpoint:
+        graph_name = params["graph_name"]
+
+        config = {"node_properties": params["properties"], "node_labels": params["entities"]}
+
+        if "listNodeLabels" in params["config"]:
+            config["list_node_labels"] = params["config"]["listNodeLabels"]
+
+        if server_version < new_endpoint_server_version:
+            endpoint = "gds.graph.streamNodeProperties"
+        else:
+            endpoint = "gds.graph.nodeProperties.stream"
+            if old_endpoint:
+                warn_about_deprecation(
+                    old_endpoint="gds.graph.streamNodeProperties", new_endpoint="gds.graph.nodeProperties.stream"
+                )
+        return endpoint, graph_name, config
+    elif (
+        old_endpoint := ("gds.graph.streamRelationshipProperty" == endpoint)
+    ) or "gds.graph.relationshipProperty.stream" == endpoint:
+        graph_name = params["graph_name"]
+        property_name = params["properties"]
+        relationship_types = params["entities"]
+
+        if server_version < new_endpoint_server_version:
+            endpoint = "gds.graph.streamRelationshipProperty"
+        else:
+            endpoint = "gds.graph.relationshipProperty.stream"
+            if old_endpoint:
+                warn_about_deprecation(
+                    old_endpoint="gds.graph.streamRelationshipProperty",
+                    new_endpoint="gds.graph.relationshipProperty.stream",
+                )
+        return (
+            endpoint,
+            graph_name,
+            {"relationship_property": property_name, "relationship_types": relationship_types},
+        )
+    elif (
+        old_endpoint := ("gds.graph.streamRelationshipProperties" == endpoint)
+    ) or "gds.graph.relationshipProperties.stream" == endpoint:
+        graph_name = params["graph_name"]
+        property_names = params["properties"]
+        relationship_types = params["entities"]
+
+        if server_version < new_endpoint_server_version:
+            endpoint = "gds.graph.streamRelationshipProperties"
+        else:
+            endpoint = "gds.graph.relationshipProperties.stream"
+            if old_endpoint:
+                warn_about_deprecation(
+                    old_endpoint="gds.graph.streamRelationshipProperties",
+                    new_endpoint="gds.graph.relationshipProperties.stream",
+                )
+
+        return (
+            endpoint,
+            graph_name,
+            {"relationship_properties": property_names, "relationship_types": relationship_types},
+        )
+    elif (
+        old_endpoint := ("gds.beta.graph.relationships.stream" == endpoint)
+    ) or "gds.graph.relationships.stream" == endpoint:
+        graph_name = params["graph_name"]
+        relationship_types = params["relationship_types"]
+
+        if server_version < new_endpoint_server_version:
+            raise IncompatibleServerVersionError(
+                f"The call gds.beta.graph.relationships.stream with parameters {params} via Arrow requires GDS "
+                f"server version >= 2.2.0. The current version is {server_version}"
+            )
+        else:
+            if server_version < no_tier_in_namespace_server_version:
+                endpoint = "gds.beta.graph.relationships.stream"
+            else:
+                endpoint = "gds.graph.relationships.stream"
+                if old_endpoint:
+                    warn_about_deprecation(
+                        old_endpoint="gds.beta.graph.relationships.stream",
+                        new_endpoint="gds.graph.relationships.stream",
+                    )
+
+        return endpoint, graph_name, {"relationship_types": relationship_types}
+
+    return None
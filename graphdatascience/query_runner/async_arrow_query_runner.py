@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import asyncio
+from functools import partial
+from typing import Any, Dict, List, Optional, Tuple
+
+from pandas import DataFrame
+
+from ..call_parameters import CallParameters
+from ..server_version.server_version import ServerVersion
+from .arrow_endpoint_version import ArrowEndpointVersion
+from .arrow_info import ArrowInfo
+from .arrow_query_runner import resolve_property_stream
+from .async_query_runner import AsyncQueryRunner
+from .gds_arrow_client import GdsArrowClient
+
+
+class AsyncArrowQueryRunner(AsyncQueryRunner):
+    """
+    Streams graph properties via Arrow Flight and delegates everything else to the fallback query runner.
+    The Flight client is blocking, so its calls are run in the default executor of the event loop.
+    """
+
+    @staticmethod
+    async def create(
+        fallback_query_runner: AsyncQueryRunner,
+        arrow_info: ArrowInfo,
+        auth: Optional[Tuple[str, str]] = None,
+        encrypted: bool = False,
+        disable_server_verification: bool = False,
+        tls_root_certs: Optional[bytes] = None,
+        connection_string_override: Optional[str] = None,
+        compression: Optional[str] = None,
+    ) -> AsyncArrowQueryRunner:
+        if not arrow_info.enabled:
+            raise ValueError("Arrow is not enabled on the server")
+
+        server_version = await fallback_query_runner.server_version()
+        connection_string = connection_string_override or arrow_info.listenAddress
+        host, port = connection_string.split(":")
+
+        # Connecting to the Flight server may authenticate, which blocks
+        gds_arrow_client = await asyncio.get_running_loop().run_in_executor(
+            None,
+            partial(
+                GdsArrowClient,
+                host,
+                int(port),
+                server_version,
+                auth,
+                encrypted,
+                disable_server_verification,
+                tls_root_certs,
+                ArrowEndpointVersion.from_arrow_info(arrow_info.versions),
+                compression,
+            ),
+        )
+
+        return AsyncArrowQueryRunner(gds_arrow_client, fallback_query_runner, server_version)
+
+    def __init__(
+        self,
+        gds_arrow_client: GdsArrowClient,
+        fallback_query_runner: AsyncQueryRunner,
+        server_version: ServerVersion,
+    ):
+        self._fallback_query_runner = fallback_query_runner
+        self._gds_arrow_client = gds_arrow_client
+        self._server_version = server_version
+
+    async def run_cypher(
+        self,
+        query: str,
+        params: Optional[Dict[str, Any]] = None,
+        database: Optional[str] = None,
+        custom_error: bool = True,
+    ) -> DataFrame:
+        return await self._fallback_query_runner.run_cypher(query, params, database, custom_error)
+
+    async def call_function(self, endpoint: str, params: Optional[CallParameters] = None) -> Any:
+        return await self._fallback_query_runner.call_function(endpoint, params)
+
+    async def call_procedure(
+        self,
+        endpoint: str,
+        params: Optional[CallParameters] = None,
+        yields: Optional[List[str]] = None,
+        database: Optional[str] = None,
+        custom_error: bool = True,
+    ) -> DataFrame:
+        if params is None:
+            params = CallParameters()
+
+        property_stream = resolve_property_stream(endpoint, params, self._server_version)
+        if property_stream is not None:
+            arrow_endpoint, graph_name, config = property_stream
+            get_property = partial(
+                self._gds_arrow_client.get_property, self.database(), graph_name, arrow_endpoint, config
+            )
+            return await asyncio.get_running_loop().run_in_executor(None, get_property)
+
+        return await self._fallback_query_runner.call_procedure(endpoint, params, yields, database, custom_error)
+
+    async def server_version(self) -> ServerVersion:
+        return self._server_version
+
+    def set_database(self, database: str) -> None:
+        self._fallback_query_runner.set_database(database)
+
+    def database(self) -> Optional[str]:
+        return self._fallback_query_runner.database()
+
+    async def close(self) -> None:
+        self._gds_arrow_client.close()
+        await self._fallback_query_runner.close()
+
+    def fallback_query_runner(self) -> AsyncQueryRunner:
+        return self._fallback_query_runner
@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import re
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import neo4j
+from pandas import DataFrame
+
+from ..call_parameters import CallParameters
+from ..error.endpoint_suggester import generate_suggestive_error_message
+from ..error.gds_not_installed import GdsNotFound
+from ..error.unable_to_connect import UnableToConnectError
+from ..server_version.server_version import ServerVersion
+from ..version import __version__
+from .async_query_runner import AsyncQueryRunner
+from .columnar_result import to_columnar_frame
+from .neo4j_query_runner import Neo4jQueryRunner
+
+
+class AsyncNeo4jQueryRunner(AsyncQueryRunner):
+    @staticmethod
+    def create(
+        endpoint: Union[str, neo4j.AsyncDriver],
+        auth: Optional[Tuple[str, str]] = None,
+        aura_ds: bool = False,
+        database: Optional[str] = None,
+        bookmarks: Optional[Any] = None,
+    ) -> AsyncNeo4jQueryRunner:
+        if isinstance(endpoint, str):
+            config: Dict[str, Any] = {"user_agent": f"neo4j-graphdatascience-v{__version__}"}
+
+            if aura_ds:
+                Neo4jQueryRunner._configure_aura(config)
+
+            driver = neo4j.AsyncGraphDatabase.driver(endpoint, auth=auth, **config)
+
+            return AsyncNeo4jQueryRunner(driver, auto_close=True, bookmarks=bookmarks, database=database)
+
+        elif isinstance(endpoint, neo4j.AsyncDriver):
+            return AsyncNeo4jQueryRunner(endpoint, auto_close=False, bookmarks=bookmarks, database=database)
+
+        else:
+            raise ValueError(f"Invalid endpoint type: {type(endpoint)}")
+
+    def __init__(
+        self,
+        driver: neo4j.AsyncDriver,
+        database: Optional[str] = neo4j.DEFAULT_DATABASE,
+        auto_close: bool = False,
+        bookmarks: Optional[Any] = None,
+    ):
+        self._driver = driver
+        self._auto_close = auto_close
+        self._database = database
+        self._bookmarks = bookmarks
+        self._last_bookmarks: Optional[Any] = None
+        self._server_version: Optional[ServerVersion] = None
+
+    async def run_cypher(
+        self,
+        query: str,
+        params: Optional[Dict[str, Any]] = None,
+        database: Optional[str] = None,
+        custom_error: bool = True,
+    ) -> DataFrame:
+        if params is None:
+            params = {}
+
+        if database is None:
+            database = self._database
+
+        async with self._driver.session(database=database, bookmarks=self._bookmarks) as session:
+            try:
+                result = await session.run(query, params)
+                keys = await result.keys()
+                records = [record async for record in result]
+            except Exception as e:
+                if custom_error:
+                    await self._handle_driver_exception(session, e)
+                raise e
+
+            self._last_bookmarks = await session.last_bookmarks()
+
+        return to_columnar_frame(keys, records)
+
+    async def call_function(self, endpoint: str, params: Optional[CallParameters] = None) -> Any:
+        if params is None:
+            params = CallParameters()
+        query = f"RETURN {endpoint}({params.placeholder_str()})"
+
+        return (await self.run_cypher(query, params)).squeeze()
+
+    async def call_procedure(
+        self,
+        endpoint: str,
+        params: Optional[CallParameters] = None,
+        yields: Optional[List[str]] = None,
+        database: Optional[str] = None,
+        custom_error: bool = True,
+    ) -> DataFrame:
+        if params is None:
+            params = CallParameters()
+
+        yields_clause = "" if yields is None else " YIELD " + ", ".join(yields)
+        query = f"CALL {endpoint}({params.placeholder_str()}){yields_clause}"
+
+        return await self.run_cypher(query, params, database, custom_error)
+
+    async def server_version(self) -> ServerVersion:
+        if self._server_version:
+            return self._server_version
+
+        try:
+            server_version_string = (await self.run_cypher("RETURN gds.version()", custom_error=False)).squeeze()
+            self._server_version = ServerVersion.from_string(server_version_string)
+            return self._server_version
+        except Exception as e:
+            if "Unknown function 'gds.version'" in str(e):
+                await self.close()
+
+                raise GdsNotFound(
+                    """The Graph Data Science library is not correctly installed on the Neo4j server.
+                    Please refer to https://neo4j.com/docs/graph-data-science/current/installation/.
+                    """
+                )
+
+            raise UnableToConnectError(e)
+
+    def encrypted(self) -> bool:
+        return self._driver.encrypted
+
+    def set_database(self, database: str) -> None:
+        self._database = database
+
+    def database(self) -> Optional[str]:
+        return self._database
+
+    def set_bookmarks(self, bookmarks: Optional[Any]) -> None:
+        self._bookmarks = bookmarks
+
+    def last_bookmarks(self) -> Optional[Any]:
+        return self._last_bookmarks
+
+    async def close(self) -> None:
+        if self._auto_close:
+            await self._driver.close()
+
+    @staticmethod
+    async def _handle_driver_exception(session: neo4j.AsyncSession, e: Exception) -> None:
+        reg_gds_hit = re.search(
+            r"There is no procedure with the name `(gds(?:\.\w+)+)` registered for this database instance",
+            str(e),
+        )
+        if not reg_gds_hit:
+            raise e
+
+        requested_endpoint = reg_gds_hit.group(1)
+
+        list_result = await session.run("CALL gds.list() YIELD name")
+        all_endpoints = [record["name"] async for record in list_result]
+
+        raise SyntaxError(generate_suggestive_error_message(requested_endpoint, all_endpoints)) from e
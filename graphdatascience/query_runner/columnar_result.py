@@ -0,0 +1,37 @@
+from typing import Any, Iterable, List, Sequence, Tuple, Union
+
+import numpy
+from numpy.typing import NDArray
+from pandas import DataFrame
+
+Column = Union[NDArray[Any], List[Any]]
+
+
+def to_columnar_frame(keys: Sequence[str], records: Iterable[Tuple[Any, ...]]) -> DataFrame:
+    """
+    Build a DataFrame from result records by transposing them into one typed NumPy array per column.
+    Neo4j records are tuples, so the transposition runs in C and no intermediate per-row objects are created.
+    Columns that are not purely integral, floating point or boolean are handed to pandas for its usual inference.
+    """
+    columns = list(zip(*records))
+    if not columns:
+        columns = [() for _ in keys]
+
+    return DataFrame({key: _to_column(values) for key, values in zip(keys, columns)}, columns=list(keys))
+
+
+def _to_column(values: Tuple[Any, ...]) -> Column:
+    value_types = set(map(type, values))
+
+    try:
+        if value_types == {int}:
+            return numpy.fromiter(values, dtype=numpy.int64, count=len(values))
+        if value_types == {float} or value_types == {float, int}:
+            return numpy.fromiter(values, dtype=numpy.float64, count=len(values))
+        if value_types == {bool}:
+            return numpy.fromiter(values, dtype=numpy.bool_, count=len(values))
+    except OverflowError:
+        # Integers beyond the int64 range are kept as Python objects
+        pass
+
+    return list(values)
@@ -5,10 +5,12 @@ from dataclasses import dataclass
 from typing import Any, Dict, List, Optional, Set, Tuple
 from uuid import uuid4
 
-from pandas import DataFrame, concat
+from numpy import ndarray
+from pandas import DataFrame, Series, concat
+from pandas.api.types import infer_dtype
 
 from ..server_version.server_version import ServerVersion
-from .graph_constructor import GraphConstructor
+from .graph_constructor import EntityData, GraphConstructor, entity_data_to_pandas
 from .query_runner import QueryRunner
 
 
@@ -66,7 +68,11 @@ class CypherGraphConstructor(GraphConstructor):
         self._server_version = server_version
         self._undirected_relationship_types = undirected_relationship_types
 
-    def run(self, node_dfs: List[DataFrame], relationship_dfs: List[DataFrame]) -> None:
+    def run(self, node_dfs: List[EntityData], relationship_dfs: List[EntityData]) -> None:
+        # Cypher projections take their data as query parameters, so Arrow inputs are converted up front
+        pandas_node_dfs = [entity_data_to_pandas(df) for df in node_dfs]
+        pandas_relationship_dfs = [entity_data_to_pandas(df) for df in relationship_dfs]
+
         if self._should_warn_about_arrow_missing():
             warnings.warn(
                 "GDS Enterprise users can use Apache Arrow for fast graph construction; please see the documentation "
@@ -82,21 +88,21 @@ class CypherGraphConstructor(GraphConstructor):
                 self._concurrency,
                 self._undirected_relationship_types,
                 self._server_version,
-            ).run(node_dfs, relationship_dfs)
+            ).run(pandas_node_dfs, pandas_relationship_dfs)
         else:
             assert not self._undirected_relationship_types, "This should have been raised earlier."
 
             def graph_construct_error_multidf(element: str) -> str:
                 return f"Graph construction only supports a single {element} dataframe on GDS versions prior to GDS 2.3"
 
-            if len(node_dfs) > 1:
+            if len(pandas_node_dfs) > 1:
                 raise ValueError(graph_construct_error_multidf("node"))
 
-            if len(relationship_dfs) > 1:
+            if len(pandas_relationship_dfs) > 1:
                 raise ValueError(graph_construct_error_multidf("relationship"))
 
-            node_df = node_dfs[0]
-            rel_df = relationship_dfs[0]
+            node_df = pandas_node_dfs[0]
+            rel_df = pandas_relationship_dfs[0]
 
             self.LegacyCypherProjectionRunner(self._query_runner, self._graph_name, self._concurrency).run(
                 node_df, rel_df
@@ -199,10 +205,10 @@ class CypherGraphConstructor(GraphConstructor):
             tier = "" if is_cypher_projection_v2 else ".alpha"
 
             query = (
-                "UNWIND $data AS data"
-                f" WITH data, {source_node_labels_clause}{rel_type_clause}{target_id_clause}{property_clauses_str}"
+                "UNWIND range(0, size($data[0]) - 1) AS i"
+                f" WITH i, {source_node_labels_clause}{rel_type_clause}{target_id_clause}{property_clauses_str}"
                 f" RETURN gds{tier}.graph.project("
-                f"$graph_name, data[{combined_cols.index('sourceNodeId')}], targetNodeId, "
+                f"$graph_name, $data[{combined_cols.index('sourceNodeId')}][i], targetNodeId, "
                 f"{data_config}, $configuration)"
             )
 
@@ -214,7 +220,7 @@ class CypherGraphConstructor(GraphConstructor):
             self._query_runner.run_cypher(
                 query,
                 {
-                    "data": combined_df.values.tolist(),
+                    "data": columns(combined_df),
                     "graph_name": self._graph_name,
                     "configuration": configuration,
                 },
@@ -224,8 +230,8 @@ class CypherGraphConstructor(GraphConstructor):
         def check_value_clause(self, combined_cols: List[str], col: str) -> str:
             return (
                 f"CASE"
-                f" WHEN data[{combined_cols.index(col + self._BIT_COL_SUFFIX)}]"
-                f" THEN data[{combined_cols.index(col)}]"
+                f" WHEN $data[{combined_cols.index(col + self._BIT_COL_SUFFIX)}][i]"
+                f" THEN $data[{combined_cols.index(col)}][i]"
                 f" ELSE null"
                 f" END AS {col}, "
             )
@@ -268,11 +274,10 @@ class CypherGraphConstructor(GraphConstructor):
                     node_dict[CypherProjectionApi.SOURCE_NODE_LABEL + self._BIT_COL_SUFFIX] = False
                     node_dict[CypherProjectionApi.SOURCE_NODE_LABEL] = ""
 
-                def collect_to_dict(row: Dict[str, Any]) -> Dict[str, Any]:
-                    return {column: row[column] for column in schema.nodes_per_df[i].properties}
-
                 node_dict_df = DataFrame(node_dict)
-                node_dict_df[CypherProjectionApi.SOURCE_NODE_PROPERTIES] = df.apply(collect_to_dict, axis=1)
+                node_dict_df[CypherProjectionApi.SOURCE_NODE_PROPERTIES] = self.property_dicts(
+                    df, schema.nodes_per_df[i].properties
+                )
                 node_dict_df[CypherProjectionApi.SOURCE_NODE_PROPERTIES + self._BIT_COL_SUFFIX] = True
                 node_dict_df[rel_properties_key] = None
                 node_dict_df[rel_properties_key + self._BIT_COL_SUFFIX] = False
@@ -304,11 +309,8 @@ class CypherGraphConstructor(GraphConstructor):
                     rel_dict[CypherProjectionApi.SOURCE_NODE_LABEL] = None
                     rel_dict[CypherProjectionApi.SOURCE_NODE_LABEL + self._BIT_COL_SUFFIX] = False
 
-                def collect_to_dict(row: Dict[str, Any]) -> Dict[str, Any]:
-                    return {column: row[column] for column in schema.rels_per_df[i].properties}
-
                 rel_dict_df = DataFrame(rel_dict)
-                rel_dict_df[rel_properties_key] = df.apply(collect_to_dict, axis=1)
+                rel_dict_df[rel_properties_key] = self.property_dicts(df, schema.rels_per_df[i].properties)
                 rel_dict_df[rel_properties_key + self._BIT_COL_SUFFIX] = True
                 rel_dict_df[CypherProjectionApi.SOURCE_NODE_PROPERTIES] = None
                 rel_dict_df[CypherProjectionApi.SOURCE_NODE_PROPERTIES + self._BIT_COL_SUFFIX] = False
@@ -317,9 +319,16 @@ class CypherGraphConstructor(GraphConstructor):
 
             return adjusted_dfs
 
+        @staticmethod
+        def property_dicts(df: DataFrame, properties: Set[str]) -> List[Dict[str, Any]]:
+            if not properties:
+                return [{} for _ in range(len(df))]
+
+            return df[sorted(properties)].to_dict("records")  # type: ignore
+
         def nodes_config_part(self, node_cols: List[EntityColumnSchema], is_cypher_projection_v2: bool) -> List[str]:
             # Cannot use a dictionary as we need to refer to the `data` variable in the cypher query.
-            # Otherwise we would just pass a string such as `data[0]`
+            # Otherwise we would just pass a string such as `$data[0][i]`
             nodes_config_fields: List[str] = []
             if any(x.has_labels() for x in node_cols):
                 nodes_config_fields.append(
@@ -387,54 +396,76 @@ class CypherGraphConstructor(GraphConstructor):
             )
 
         def _node_query(self, node_df: DataFrame) -> Tuple[str, List[List[Any]]]:
-            node_list = node_df.values.tolist()
             node_columns = list(node_df.columns)
+            nodes = columns(node_df)
             node_id_index = node_columns.index("nodeId")
 
             label_query = ""
-            if "labels" in node_df.keys():
+            if "labels" in node_columns:
                 label_index = node_columns.index("labels")
-                label_query = f", node[{label_index}] as labels"
+                label_query = f", $nodes[{label_index}][i] as labels"
 
                 # Make sure every node has a list of labels
-                for node in node_list:
-                    labels = node[label_index]
-                    if isinstance(labels, List):
-                        continue
-                    node[label_index] = [labels]
+                nodes[label_index] = label_lists(node_df["labels"])
 
             property_query = ""
-            property_columns: Set[str] = set(node_df.columns.tolist()) - {"nodeId", "labels"}
+            property_columns: Set[str] = set(node_columns) - {"nodeId", "labels"}
             if len(property_columns) > 0:
-                property_queries = (f", node[{node_columns.index(col)}] as {col}" for col in property_columns)
+                property_queries = (f", $nodes[{node_columns.index(col)}][i] as {col}" for col in property_columns)
                 property_query = "".join(property_queries)
 
-            return f"UNWIND $nodes as node RETURN node[{node_id_index}] as id{label_query}{property_query}", node_list
+            return (
+                f"UNWIND range(0, size($nodes[{node_id_index}]) - 1) AS i "
+                f"RETURN $nodes[{node_id_index}][i] as id{label_query}{property_query}",
+                nodes,
+            )
 
         def _relationship_query(self, rel_df: DataFrame) -> Tuple[str, List[List[Any]]]:
-            rel_list = rel_df.values.tolist()
             rel_columns = list(rel_df.columns)
+            relationships = columns(rel_df)
             source_id_index = rel_columns.index("sourceNodeId")
             target_id_index = rel_columns.index("targetNodeId")
 
             type_query = ""
-            if "relationshipType" in rel_df.keys():
+            if "relationshipType" in rel_columns:
                 type_index = rel_columns.index("relationshipType")
-                type_query = f", relationship[{type_index}] as type"
+                type_query = f", $relationships[{type_index}][i] as type"
 
             property_query = ""
-            property_columns: Set[str] = set(rel_df.columns.tolist()) - {
+            property_columns: Set[str] = set(rel_columns) - {
                 "sourceNodeId",
                 "targetNodeId",
                 "relationshipType",
             }
             if len(property_columns) > 0:
-                property_queries = (f", relationship[{rel_columns.index(col)}] as {col}" for col in property_columns)
+                property_queries = (
+                    f", $relationships[{rel_columns.index(col)}][i] as {col}" for col in property_columns
+                )
                 property_query = "".join(property_queries)
 
             return (
-                "UNWIND $relationships as relationship "
-                f"RETURN relationship[{source_id_index}] as source, relationship[{target_id_index}] as target"
+                f"UNWIND range(0, size($relationships[{source_id_index}]) - 1) AS i "
+                f"RETURN $relationships[{source_id_index}][i] as source, "
+                f"$relationships[{target_id_index}][i] as target"
                 f"{type_query}{property_query}",
-                rel_list,
+                relationships,
             )
+
+
+def columns(df: DataFrame) -> List[List[Any]]:
+    """
+    Encode a DataFrame as one list per column, which the Cypher query indexes by row position.
+    Compared to one list per row, this avoids boxing every cell into an object array and a list header per row.
+    """
+    return [df[column].tolist() for column in df.columns]
+
+
+def label_lists(labels: "Series[Any]") -> List[Any]:
+    if infer_dtype(labels, skipna=False) == "string":
+        # The common case of a single label per node
+        return [[label] for label in labels.tolist()]
+
+    return [
+        label.tolist() if isinstance(label, ndarray) else label if isinstance(label, list) else [label]
+        for label in labels.tolist()
+    ]
@@ -5,11 +5,13 @@ import json
 import re
 import time
 import warnings
-from typing import Any, Dict, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock, Timer
+from typing import Any, Callable, Dict, Hashable, Iterator, List, NamedTuple, NoReturn, Optional, Tuple
 
 from neo4j.exceptions import ClientError
 from pandas import DataFrame
-from pyarrow import ChunkedArray, Schema, Table, chunked_array, flight
+from pyarrow import ChunkedArray, Schema, Table, chunked_array, concat_tables, flight, ipc
 from pyarrow import __version__ as arrow_version
 from pyarrow._flight import FlightStreamReader, FlightStreamWriter
 from pyarrow.flight import ClientMiddleware, ClientMiddlewareFactory
@@ -32,6 +34,7 @@ class GdsArrowClient:
         disable_server_verification: bool = False,
         tls_root_certs: Optional[bytes] = None,
         connection_string_override: Optional[str] = None,
+        compression: Optional[str] = None,
     ) -> GdsArrowClient:
         server_version = query_runner.server_version()
         connection_string: str
@@ -53,6 +56,7 @@ class GdsArrowClient:
             disable_server_verification,
             tls_root_certs,
             arrow_endpoint_version,
+            compression,
         )
 
     def __init__(
@@ -65,38 +69,151 @@ class GdsArrowClient:
         disable_server_verification: bool = False,
         tls_root_certs: Optional[bytes] = None,
         arrow_endpoint_version: ArrowEndpointVersion = ArrowEndpointVersion.ALPHA,
+        compression: Optional[str] = None,
     ):
+        if compression not in [None, "lz4", "zstd"]:
+            raise ValueError(f"Unsupported compression '{compression}'. Supported values are 'lz4', 'zstd' and None.")
+
         self._server_version = server_version
         self._arrow_endpoint_version = arrow_endpoint_version
         self._host = host
         self._port = port
         self._auth = auth
 
+        # Clients for the same server and credentials share one connection, and with it the channel and auth token
+        self._connection_key = (host, port, encrypted, disable_server_verification, tls_root_certs, auth)
+        connection = _connection_pool.acquire(
+            self._connection_key,
+            lambda: self._connect(host, port, auth, encrypted, disable_server_verification, tls_root_certs),
+        )
+        self._closed = False
+
+        self._flight_client = connection.client
+        if connection.auth_middleware:
+            self._auth_middleware = connection.auth_middleware
+
+        # Uploaded buffers are compressed by the writer, while compressed results of the server are
+        # decompressed transparently by the readers
+        self._put_options = (
+            flight.FlightCallOptions(write_options=ipc.IpcWriteOptions(compression=compression))
+            if compression
+            else None
+        )
+
+    @staticmethod
+    def _connect(
+        host: str,
+        port: int,
+        auth: Optional[Tuple[str, str]],
+        encrypted: bool,
+        disable_server_verification: bool,
+        tls_root_certs: Optional[bytes],
+    ) -> FlightConnection:
         location = flight.Location.for_grpc_tls(host, port) if encrypted else flight.Location.for_grpc_tcp(host, port)
 
+        auth_middleware = None
         client_options: Dict[str, Any] = {"disable_server_verification": disable_server_verification}
         if auth:
-            self._auth_middleware = AuthMiddleware(auth)
+            auth_middleware = AuthMiddleware(auth)
             user_agent = f"neo4j-graphdatascience-v{__version__} pyarrow-v{arrow_version}"
-            client_options["middleware"] = [AuthFactory(self._auth_middleware), UserAgentFactory(useragent=user_agent)]
+            client_options["middleware"] = [AuthFactory(auth_middleware), UserAgentFactory(useragent=user_agent)]
         if tls_root_certs:
             client_options["tls_root_certs"] = tls_root_certs
 
-        self._flight_client = flight.FlightClient(location, **client_options)
+        client = flight.FlightClient(location, **client_options)
+        if auth and auth_middleware:
+            username, password = auth
+            auth_middleware.set_refresh_callback(lambda: client.authenticate_basic_token(username, password))
+
+        return FlightConnection(client, auth_middleware)
 
     def connection_info(self) -> Tuple[str, int]:
         return self._host, self._port
 
+    def arrow_endpoint_version(self) -> ArrowEndpointVersion:
+        return self._arrow_endpoint_version
+
     def request_token(self) -> Optional[str]:
-        if self._auth:
-            self._flight_client.authenticate_basic_token(self._auth[0], self._auth[1])
-            return self._auth_middleware.token()
-        else:
+        if not self._auth:
             return "IGNORED"
 
+        # The token is handed to jobs on the server that may run for minutes, so one close to expiry is replaced
+        if self._auth_middleware.token() is None or self._auth_middleware.should_refresh():
+            self._authenticate()
+
+        return self._auth_middleware.token()
+
+    def _authenticate(self) -> None:
+        self._flight_client.authenticate_basic_token(self._auth[0], self._auth[1])  # type: ignore
+
     def get_property(
         self, database: Optional[str], graph_name: str, procedure_name: str, configuration: Dict[str, Any]
     ) -> DataFrame:
+        return self.table_to_pandas(self.get_property_table(database, graph_name, procedure_name, configuration))
+
+    def get_property_table(
+        self, database: Optional[str], graph_name: str, procedure_name: str, configuration: Dict[str, Any]
+    ) -> Table:
+        reader = self._do_get_property(database, graph_name, procedure_name, configuration)
+
+        try:
+            arrow_table = reader.read_all()
+        except Exception as e:
+            self.handle_flight_error(e)
+
+        return self._rename_node_labels_column(arrow_table, configuration)
+
+    def get_property_table_partitioned(
+        self,
+        database: Optional[str],
+        graph_name: str,
+        procedure_name: str,
+        configurations: List[Dict[str, Any]],
+        concurrency: int,
+    ) -> Table:
+        """
+        Fetch one stream per configuration, reading up to `concurrency` streams in parallel.
+        The resulting tables are concatenated in the order of the given configurations.
+        """
+
+        def get_partition(configuration: Dict[str, Any]) -> Table:
+            return self.get_property_table(database, graph_name, procedure_name, configuration)
+
+        with ThreadPoolExecutor(concurrency) as executor:
+            tables = list(executor.map(get_partition, configurations))
+
+        return concat_tables(tables)
+
+    def get_property_batches(
+        self, database: Optional[str], graph_name: str, procedure_name: str, configuration: Dict[str, Any]
+    ) -> Iterator[DataFrame]:
+        """
+        Stream the property as a sequence of DataFrames, one per record batch received from the server.
+        Only a single batch is held in client memory at a time.
+        """
+        reader = self._do_get_property(database, graph_name, procedure_name, configuration)
+
+        exhausted = False
+        try:
+            while True:
+                try:
+                    chunk = reader.read_chunk()
+                except StopIteration:
+                    exhausted = True
+                    return
+                except Exception as e:
+                    self.handle_flight_error(e)
+
+                arrow_table = self._rename_node_labels_column(Table.from_batches([chunk.data]), configuration)
+                yield self.table_to_pandas(arrow_table)
+        finally:
+            # Let the server stop sending data if the consumer did not read the stream to the end
+            if not exhausted:
+                reader.cancel()
+
+    def _do_get_property(
+        self, database: Optional[str], graph_name: str, procedure_name: str, configuration: Dict[str, Any]
+    ) -> FlightStreamReader:
         if not database:
             raise ValueError(
                 "For this call you must have explicitly specified a valid Neo4j database to execute on, "
@@ -120,16 +237,20 @@ class GdsArrowClient:
         ticket = flight.Ticket(json.dumps(payload).encode("utf-8"))
 
         try:
-            get = self._flight_client.do_get(ticket)
-            arrow_table = get.read_all()
+            return self._flight_client.do_get(ticket)
         except Exception as e:
             self.handle_flight_error(e)
 
+    @staticmethod
+    def _rename_node_labels_column(arrow_table: Table, configuration: Dict[str, Any]) -> Table:
         if configuration.get("list_node_labels", False):
             # GDS 2.5 had an inconsistent naming of the node labels column
             new_colum_names = ["nodeLabels" if i == "labels" else i for i in arrow_table.column_names]
             arrow_table = arrow_table.rename_columns(new_colum_names)
 
+        return arrow_table
+
+    def table_to_pandas(self, arrow_table: Table) -> DataFrame:
         # Pandas 2.2.0 deprecated an API used by ArrowTable.to_pandas() (< pyarrow 15.0)
         warnings.filterwarnings(
             "ignore",
@@ -156,10 +277,14 @@ class GdsArrowClient:
     def start_put(self, payload: Dict[str, Any], schema: Schema) -> Tuple[FlightStreamWriter, FlightStreamReader]:
         flight_descriptor = self._versioned_flight_descriptor(payload)
         upload_descriptor = flight.FlightDescriptor.for_command(json.dumps(flight_descriptor).encode("utf-8"))
-        return self._flight_client.do_put(upload_descriptor, schema)  # type: ignore
+        return self._flight_client.do_put(upload_descriptor, schema, options=self._put_options)  # type: ignore
 
     def close(self) -> None:
-        self._flight_client.close()
+        if self._closed:
+            return
+
+        self._closed = True
+        _connection_pool.release(self._connection_key)
 
     def _versioned_action_type(self, action_type: str) -> str:
         return self._arrow_endpoint_version.prefix() + action_type
@@ -198,7 +323,7 @@ class GdsArrowClient:
         return arrow_table
 
     @staticmethod
-    def handle_flight_error(e: Exception):
+    def handle_flight_error(e: Exception) -> NoReturn:
         if (
             isinstance(e, flight.FlightServerError)
             or isinstance(e, flight.FlightInternalError)
@@ -222,6 +347,48 @@ class GdsArrowClient:
             raise e
 
 
+class FlightConnection(NamedTuple):
+    client: flight.FlightClient
+    auth_middleware: Optional[AuthMiddleware]
+
+
+class FlightConnectionPool:
+    """
+    Reference counted Flight clients, keyed by the server and credentials they connect with.
+    A Flight client multiplexes concurrent calls over a single gRPC channel, so it can be shared by all users.
+    """
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._connections: Dict[Hashable, Tuple[FlightConnection, int]] = {}
+
+    def acquire(self, key: Hashable, connect: Callable[[], FlightConnection]) -> FlightConnection:
+        with self._lock:
+            if key in self._connections:
+                connection, ref_count = self._connections[key]
+            else:
+                connection, ref_count = connect(), 0
+
+            self._connections[key] = (connection, ref_count + 1)
+            return connection
+
+    def release(self, key: Hashable) -> None:
+        with self._lock:
+            if key not in self._connections:
+                return
+
+            connection, ref_count = self._connections[key]
+            if ref_count > 1:
+                self._connections[key] = (connection, ref_count - 1)
+                return
+
+            del self._connections[key]
+
+        if connection.auth_middleware:
+            connection.auth_middleware.close()
+        connection.client.close()
+
+
 class UserAgentFactory(ClientMiddlewareFactory):
     def __init__(self, useragent: str, *args: Any, **kwargs: Any) -> None:
         super().__init__(*args, **kwargs)
@@ -253,22 +420,60 @@ class AuthFactory(ClientMiddlewareFactory):
 
 
 class AuthMiddleware(ClientMiddleware):  # type: ignore
+    # the server accepts a bearer token for 10 minutes
+    TOKEN_LIFETIME = 600
+    # refresh the token 2 minutes before it expires
+    REFRESH_MARGIN = 120
+
     def __init__(self, auth: Tuple[str, str], *args: Any, **kwargs: Any) -> None:
         super().__init__(*args, **kwargs)
         self._auth = auth
         self._token: Optional[str] = None
         self._token_timestamp = 0
+        self._lock = Lock()
+        self._refresh_callback: Optional[Callable[[], None]] = None
+        self._refresh_timer: Optional[Timer] = None
+        self._closed = False
 
     def token(self) -> Optional[str]:
         # check whether the token is older than 10 minutes. If so, reset it.
-        if self._token and int(time.time()) - self._token_timestamp > 600:
+        if self._token and int(time.time()) - self._token_timestamp > self.TOKEN_LIFETIME:
             self._token = None
 
         return self._token
 
+    def should_refresh(self) -> bool:
+        return int(time.time()) - self._token_timestamp > self.TOKEN_LIFETIME - self.REFRESH_MARGIN
+
+    def set_refresh_callback(self, refresh_callback: Callable[[], None]) -> None:
+        self._refresh_callback = refresh_callback
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+            if self._refresh_timer is not None:
+                self._refresh_timer.cancel()
+
     def _set_token(self, token: str) -> None:
-        self._token = token
-        self._token_timestamp = int(time.time())
+        with self._lock:
+            self._token = token
+            self._token_timestamp = int(time.time())
+
+            # Replace the token before it expires, so that calls do not fall back to basic auth in between
+            if self._refresh_callback is None or self._closed:
+                return
+            if self._refresh_timer is not None:
+                self._refresh_timer.cancel()
+            self._refresh_timer = Timer(self.TOKEN_LIFETIME - self.REFRESH_MARGIN, self._refresh)
+            self._refresh_timer.daemon = True
+            self._refresh_timer.start()
+
+    def _refresh(self) -> None:
+        try:
+            self._refresh_callback()  # type: ignore
+        except Exception:
+            # A failed refresh is not fatal, as calls authenticate again with basic auth once the token expired
+            pass
 
     def received_headers(self, headers: Dict[str, Any]) -> None:
         auth_header = headers.get("authorization", None)
@@ -295,3 +500,6 @@ class AuthMiddleware(ClientMiddleware):  # type: ignore
             return {"authorization": auth_token}
         else:
             return {"authorization": "Bearer " + token}
+
+
+_connection_pool = FlightConnectionPool()
@@ -1,10 +1,27 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Any, Dict, List, Optional, Union
 
 from pandas import DataFrame
+from pyarrow import RecordBatchReader, Table
+
+# Node or relationship data which can be used to construct a graph
+EntityData = Union[DataFrame, Table, RecordBatchReader]
 
 
 class GraphConstructor(ABC):
     @abstractmethod
-    def run(self, node_dfs: List[DataFrame], relationship_dfs: List[DataFrame]) -> None:
+    def run(self, node_dfs: List[EntityData], relationship_dfs: List[EntityData]) -> None:
         pass
+
+    def upload_settings(self) -> Optional[Dict[str, Any]]:
+        # Only constructors that tune their uploads report the settings they chose
+        return None
+
+
+def entity_data_to_pandas(data: EntityData) -> DataFrame:
+    if isinstance(data, DataFrame):
+        return data
+    if isinstance(data, RecordBatchReader):
+        return data.read_pandas()
+
+    return data.to_pandas()
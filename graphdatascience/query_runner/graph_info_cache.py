@@ -0,0 +1,87 @@
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+from pandas import Series
+
+from ..call_parameters import CallParameters
+
+# All fields of `gds.graph.list` but the degree distribution, which is expensive to compute for large graphs
+LIGHTWEIGHT_GRAPH_LIST_YIELDS = [
+    "graphName",
+    "database",
+    "configuration",
+    "nodeCount",
+    "relationshipCount",
+    "schema",
+    "density",
+    "memoryUsage",
+    "sizeInBytes",
+    "creationTime",
+    "modificationTime",
+]
+
+
+class GraphInfoCache:
+    """
+    Snapshots of the `gds.graph.list` information of graphs in the catalog, shared by the graph objects of a client.
+
+    A snapshot expires after a time to live. It is invalidated earlier when a procedure that may modify the graph, or
+    Cypher calling GDS, is run through the same client, while changes made by other clients become visible once the
+    snapshot expired.
+    """
+
+    DEFAULT_TTL_SECONDS = 10.0
+
+    # Procedure modes that never modify the in-memory graph they are called on
+    _READ_ONLY_MODES = ["stream", "stats", "estimate", "write", "list", "exists", "export", "csv"]
+
+    def __init__(self, ttl_seconds: float = DEFAULT_TTL_SECONDS):
+        self._ttl_seconds = ttl_seconds
+        self._snapshots: Dict[Tuple[Optional[str], str], Tuple[float, "Series[Any]"]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, database: Optional[str], graph_name: str) -> Optional["Series[Any]"]:
+        with self._lock:
+            snapshot = self._snapshots.get((database, graph_name))
+            if snapshot is None:
+                return None
+
+            fetched_at, info = snapshot
+            if time.monotonic() - fetched_at >= self._ttl_seconds:
+                del self._snapshots[(database, graph_name)]
+                return None
+
+            return info
+
+    def put(self, database: Optional[str], graph_name: str, info: "Series[Any]") -> None:
+        with self._lock:
+            self._snapshots[(database, graph_name)] = (time.monotonic(), info)
+
+    def invalidate(self, graph_name: Optional[str] = None) -> None:
+        """
+        Drop the snapshots of the graph with the given name in any database, or of all graphs if no name is given.
+        """
+        with self._lock:
+            if graph_name is None:
+                self._snapshots.clear()
+                return
+
+            for key in [key for key in self._snapshots if key[1] == graph_name]:
+                del self._snapshots[key]
+
+    def invalidate_after_call(self, endpoint: str, params: Optional[CallParameters]) -> None:
+        if params is None or "graph_name" not in params:
+            return
+
+        if endpoint.split(".")[-1] in self._READ_ONLY_MODES:
+            return
+
+        graph_name = params["graph_name"]
+        self.invalidate(graph_name if isinstance(graph_name, str) else None)
+
+    def invalidate_after_query(self, query: str) -> None:
+        # Cypher that calls GDS may drop or project graphs without naming them in a parameter,
+        # for example `gds.graph.project` in a Cypher aggregation
+        if "gds." in query:
+            self.invalidate()
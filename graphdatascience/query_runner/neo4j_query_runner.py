@@ -4,7 +4,8 @@ import logging
 import re
 import time
 import warnings
-from typing import Any, Dict, List, Optional, Tuple, Union
+from itertools import islice
+from typing import Any, ContextManager, Dict, Iterator, List, NoReturn, Optional, Tuple, Union
 
 import neo4j
 from pandas import DataFrame
@@ -15,8 +16,11 @@ from ..error.gds_not_installed import GdsNotFound
 from ..error.unable_to_connect import UnableToConnectError
 from ..server_version.server_version import ServerVersion
 from ..version import __version__
+from .columnar_result import to_columnar_frame
 from .cypher_graph_constructor import CypherGraphConstructor
 from .graph_constructor import GraphConstructor
+from .graph_info_cache import GraphInfoCache
+from .progress.progress_sink import ProgressSink
 from .progress.query_progress_logger import QueryProgressLogger
 from .query_runner import QueryRunner
 
@@ -25,6 +29,9 @@ class Neo4jQueryRunner(QueryRunner):
     _AURA_DS_PROTOCOL = "neo4j+s"
     _LOG_POLLING_INTERVAL = 0.5
     _NEO4J_DRIVER_VERSION = ServerVersion.from_string(neo4j.__version__)
+    _DEFAULT_BATCH_SIZE = 100_000
+    _READ_ONLY_MODES = ["stream", "stats", "estimate"]
+    _READ_ONLY_ENDPOINTS = ["gds.graph.list", "gds.model.list"]
 
     @staticmethod
     def create(
@@ -33,6 +40,7 @@ class Neo4jQueryRunner(QueryRunner):
         aura_ds: bool = False,
         database: Optional[str] = None,
         bookmarks: Optional[Any] = None,
+        managed_transactions: bool = False,
     ) -> Neo4jQueryRunner:
         if isinstance(endpoint, str):
             config: Dict[str, Any] = {"user_agent": f"neo4j-graphdatascience-v{__version__}"}
@@ -48,10 +56,17 @@ class Neo4jQueryRunner(QueryRunner):
                 bookmarks=bookmarks,
                 config=config,
                 database=database,
+                managed_transactions=managed_transactions,
             )
 
         elif isinstance(endpoint, neo4j.Driver):
-            query_runner = Neo4jQueryRunner(endpoint, auto_close=False, bookmarks=bookmarks, database=database)
+            query_runner = Neo4jQueryRunner(
+                endpoint,
+                auto_close=False,
+                bookmarks=bookmarks,
+                database=database,
+                managed_transactions=managed_transactions,
+            )
 
         else:
             raise ValueError(f"Invalid endpoint type: {type(endpoint)}")
@@ -80,6 +95,7 @@ class Neo4jQueryRunner(QueryRunner):
         database: Optional[str] = neo4j.DEFAULT_DATABASE,
         auto_close: bool = False,
         bookmarks: Optional[Any] = None,
+        managed_transactions: bool = False,
     ):
         self._driver = driver
         self._config = config
@@ -89,12 +105,16 @@ class Neo4jQueryRunner(QueryRunner):
         self._bookmarks = bookmarks
         self._last_bookmarks: Optional[Any] = None
         self._server_version = None
+        self._connectivity_verified = False
+        self._managed_transactions = managed_transactions
+        self._graph_info_cache = GraphInfoCache()
         self._progress_logger = QueryProgressLogger(
             self.__run_cypher_simplified_for_query_progress_logger, self.server_version
         )
 
     def __run_cypher_simplified_for_query_progress_logger(self, query: str, database: Optional[str]) -> DataFrame:
-        return self.run_cypher(query=query, database=database)
+        # Progress queries do not modify graphs, so they bypass the invalidation of the graph info cache
+        return self._execute(query, None, database, True)
 
     def run_cypher(
         self,
@@ -102,6 +122,20 @@ class Neo4jQueryRunner(QueryRunner):
         params: Optional[Dict[str, Any]] = None,
         database: Optional[str] = None,
         custom_error: bool = True,
+    ) -> DataFrame:
+        try:
+            return self._execute(query, params, database, custom_error)
+        finally:
+            self._graph_info_cache.invalidate_after_query(query)
+
+    def _execute(
+        self,
+        query: str,
+        params: Optional[Dict[str, Any]],
+        database: Optional[str],
+        custom_error: bool,
+        managed: bool = False,
+        retryable: bool = False,
     ) -> DataFrame:
         if params is None:
             params = {}
@@ -109,47 +143,90 @@ class Neo4jQueryRunner(QueryRunner):
         if database is None:
             database = self._database
 
-        self._verify_connectivity(database=database)
+        if not self._connectivity_verified:
+            self._verify_connectivity(database=database)
+
+        try:
+            return self._run_cypher(query, params, database, custom_error, managed)
+        except (neo4j.exceptions.ServiceUnavailable, neo4j.exceptions.SessionExpired):
+            # The connection to the DBMS was lost, so we wait until it is reachable again.
+            # Only read-only queries are retried, as a write may have been applied before the connection was lost.
+            self._connectivity_verified = False
+            self._verify_connectivity(database=database)
+
+            if not retryable:
+                raise
+
+            return self._run_cypher(query, params, database, custom_error, managed)
+
+    def _run_cypher(
+        self,
+        query: str,
+        params: Dict[str, Any],
+        database: Optional[str],
+        custom_error: bool,
+        managed: bool,
+    ) -> DataFrame:
+        # Though pandas support may be experimental in the `neo4j` package, it should always
+        # be supported in the `graphdatascience` package.
+        warnings.filterwarnings(
+            "ignore",
+            message=r"^pandas support is experimental and might be changed or removed in future versions$",
+        )
 
         with self._driver.session(database=database, bookmarks=self.bookmarks()) as session:
             try:
-                result = session.run(query, params)
+                if managed:
+                    df = self._run_read_transaction(session, query, params)
+                else:
+                    df = self._consume_result(session.run(query, params))
             except Exception as e:
                 if custom_error:
                     self.handle_driver_exception(session, e)
-                else:
-                    raise e
-
-            # Though pandas support may be experimental in the `neo4j` package, it should always
-            # be supported in the `graphdatascience` package.
-            warnings.filterwarnings(
-                "ignore",
-                message=r"^pandas support is experimental and might be changed or removed in future versions$",
-            )
-
-            df = result.to_df()
+                raise e
 
             if self._NEO4J_DRIVER_VERSION < ServerVersion(5, 0, 0):
                 self._last_bookmarks = [session.last_bookmark()]
             else:
                 self._last_bookmarks = session.last_bookmarks()
 
-            if (
-                Neo4jQueryRunner._NEO4J_DRIVER_VERSION >= ServerVersion(5, 21, 0)
-                and result._warn_notification_severity == "WARNING"
-            ):
-                # the client does not expose YIELD fields so we just skip these warnings for now
-                warnings.filterwarnings(
-                    "ignore", message=r".*The query used a deprecated field from a procedure\. .* by 'gds.* "
-                )
-            else:
-                notifications = result.consume().notifications
-                if notifications:
-                    for notification in notifications:
-                        self._forward_cypher_warnings(notification)
-
             return df
 
+    def _run_read_transaction(self, session: neo4j.Session, query: str, params: Dict[str, Any]) -> DataFrame:
+        """
+        Run the query in a managed read transaction, which the driver retries on transient errors such as leader
+        switches, and which may be routed to any cluster member that serves reads.
+        """
+
+        def work(tx: Any) -> DataFrame:
+            return self._consume_result(tx.run(query, params))
+
+        if self._NEO4J_DRIVER_VERSION < ServerVersion(5, 0, 0):
+            return session.read_transaction(work)
+
+        return session.execute_read(work)
+
+    def _consume_result(self, result: neo4j.Result) -> DataFrame:
+        df = to_columnar_frame(result.keys(), result)
+        self._handle_notifications(result)
+
+        return df
+
+    def _handle_notifications(self, result: neo4j.Result) -> None:
+        if (
+            Neo4jQueryRunner._NEO4J_DRIVER_VERSION >= ServerVersion(5, 21, 0)
+            and result._warn_notification_severity == "WARNING"
+        ):
+            # the client does not expose YIELD fields so we just skip these warnings for now
+            warnings.filterwarnings(
+                "ignore", message=r".*The query used a deprecated field from a procedure\. .* by 'gds.* "
+            )
+        else:
+            notifications = result.consume().notifications
+            if notifications:
+                for notification in notifications:
+                    self._forward_cypher_warnings(notification)
+
     def call_function(self, endpoint: str, params: Optional[CallParameters] = None) -> Any:
         if params is None:
             params = CallParameters()
@@ -172,14 +249,96 @@ class Neo4jQueryRunner(QueryRunner):
         yields_clause = "" if yields is None else " YIELD " + ", ".join(yields)
         query = f"CALL {endpoint}({params.placeholder_str()}){yields_clause}"
 
+        retryable = self._access_mode(endpoint) == neo4j.READ_ACCESS
+        # The driver re-runs the work of a managed transaction on failures, which would apply writes twice,
+        # for example GDS write mode procedures that commit their own transactions
+        managed = self._managed_transactions and retryable
+
         def run_cypher_query() -> DataFrame:
-            return self.run_cypher(query, params, database, custom_error)
+            return self._execute(query, params, database, custom_error, managed, retryable)
 
-        if logging:
-            job_id = self._progress_logger.extract_or_create_job_id(params)
-            return self._progress_logger.run_with_progress_logging(run_cypher_query, job_id, database)
-        else:
-            return run_cypher_query()
+        try:
+            if logging:
+                job_id = self._progress_logger.extract_or_create_job_id(params)
+                return self._progress_logger.run_with_progress_logging(run_cypher_query, job_id, database)
+            else:
+                return run_cypher_query()
+        finally:
+            # Also a failed call may have modified the graph before failing
+            self._graph_info_cache.invalidate_after_call(endpoint, params)
+
+    def call_procedure_batches(
+        self,
+        endpoint: str,
+        params: Optional[CallParameters] = None,
+        yields: Optional[List[str]] = None,
+        database: Optional[str] = None,
+        custom_error: bool = True,
+        batch_size: Optional[int] = None,
+    ) -> Iterator[DataFrame]:
+        """
+        Stream the result as a sequence of DataFrames of up to `batch_size` rows, consuming the Bolt result lazily.
+        The driver fetches records in batches of the same size, so only about one batch is held in memory at a time.
+        """
+        if params is None:
+            params = CallParameters()
+
+        if database is None:
+            database = self._database
+
+        if batch_size is None:
+            batch_size = self._DEFAULT_BATCH_SIZE
+
+        yields_clause = "" if yields is None else " YIELD " + ", ".join(yields)
+        query = f"CALL {endpoint}({params.placeholder_str()}){yields_clause}"
+
+        if not self._connectivity_verified:
+            self._verify_connectivity(database=database)
+
+        with self._driver.session(database=database, bookmarks=self.bookmarks(), fetch_size=batch_size) as session:
+            # Procedure errors and lost connections usually surface when records are pulled, not when the query is run
+            try:
+                result = session.run(query, params)
+                keys = result.keys()
+                record_iterator = iter(result)
+                records = list(islice(record_iterator, batch_size))
+            except Exception as e:
+                self._handle_batch_exception(session, e, custom_error)
+
+            while records:
+                yield to_columnar_frame(keys, records)
+
+                try:
+                    records = list(islice(record_iterator, batch_size))
+                except Exception as e:
+                    self._handle_batch_exception(session, e, custom_error)
+
+            self._handle_notifications(result)
+
+            if self._NEO4J_DRIVER_VERSION < ServerVersion(5, 0, 0):
+                self._last_bookmarks = [session.last_bookmark()]
+            else:
+                self._last_bookmarks = session.last_bookmarks()
+
+    def _handle_batch_exception(self, session: neo4j.Session, e: Exception, custom_error: bool) -> NoReturn:
+        if isinstance(e, (neo4j.exceptions.ServiceUnavailable, neo4j.exceptions.SessionExpired)):
+            # The records already consumed cannot be re-read, so the call is not retried, but the next call waits
+            # until the DBMS is reachable again
+            self._connectivity_verified = False
+
+        if custom_error:
+            self.handle_driver_exception(session, e)
+        raise e
+
+    @staticmethod
+    def _access_mode(endpoint: str) -> str:
+        if endpoint in Neo4jQueryRunner._READ_ONLY_ENDPOINTS:
+            return neo4j.READ_ACCESS
+
+        if endpoint.split(".")[-1] in Neo4jQueryRunner._READ_ONLY_MODES:
+            return neo4j.READ_ACCESS
+
+        return neo4j.WRITE_ACCESS
 
     def server_version(self) -> ServerVersion:
         if self._server_version:
@@ -233,6 +392,15 @@ class Neo4jQueryRunner(QueryRunner):
     def set_bookmarks(self, bookmarks: Optional[Any]) -> None:
         self._bookmarks = bookmarks
 
+    def set_progress_sinks(self, progress_sinks: List[ProgressSink]) -> None:
+        self._progress_logger.set_progress_sinks(progress_sinks)
+
+    def graph_info_cache(self) -> Optional[GraphInfoCache]:
+        return self._graph_info_cache
+
+    def scoped_progress_sinks(self, progress_sinks: List[ProgressSink]) -> ContextManager[None]:
+        return self._progress_logger.scoped_progress_sinks(progress_sinks)
+
     def close(self) -> None:
         self._driver.close()
 
@@ -250,7 +418,11 @@ class Neo4jQueryRunner(QueryRunner):
             self._driver.close()
 
     def create_graph_constructor(
-        self, graph_name: str, concurrency: int, undirected_relationship_types: Optional[List[str]]
+        self,
+        graph_name: str,
+        concurrency: int,
+        undirected_relationship_types: Optional[List[str]],
+        **upload_options: Any,
     ) -> GraphConstructor:
         return CypherGraphConstructor(
             self, graph_name, concurrency, undirected_relationship_types, self.server_version()
@@ -273,43 +445,49 @@ class Neo4jQueryRunner(QueryRunner):
         raise SyntaxError(generate_suggestive_error_message(requested_endpoint, all_endpoints)) from e
 
     def _verify_connectivity(self, database: Optional[str] = None) -> None:
-        WAIT_TIME = 1
-        MAX_RETRYS = 10 * 60
+        """
+        Wait until the DBMS is reachable, backing off exponentially between attempts.
+        Called before the first query and after a query failed because the connection was lost.
+        """
+        INITIAL_WAIT_TIME = 0.5
+        MAX_WAIT_TIME = 10
+        TIMEOUT = 10 * 60
         WARN_INTERVAL = 10
 
         if database is None:
             database = self._database
 
-        exception = None
+        if self._NEO4J_DRIVER_VERSION < ServerVersion(5, 0, 0):
+            warnings.filterwarnings(
+                "ignore",
+                category=neo4j.ExperimentalWarning,
+                message=r"^The configuration may change in the future.$",
+            )
+        else:
+            warnings.filterwarnings(
+                "ignore",
+                category=neo4j.ExperimentalWarning,
+                message=(
+                    r"^All configuration key-word arguments to verify_connectivity\(\) are experimental. "
+                    "They might be changed or removed in any future version without prior notice.$"
+                ),
+            )
+
+        deadline = time.monotonic() + TIMEOUT
+        wait_time = INITIAL_WAIT_TIME
         retrys = 0
-        while retrys < MAX_RETRYS:
+        while True:
             try:
-                if self._NEO4J_DRIVER_VERSION < ServerVersion(5, 0, 0):
-                    warnings.filterwarnings(
-                        "ignore",
-                        category=neo4j.ExperimentalWarning,
-                        message=r"^The configuration may change in the future.$",
-                    )
-                else:
-                    warnings.filterwarnings(
-                        "ignore",
-                        category=neo4j.ExperimentalWarning,
-                        message=(
-                            r"^All configuration key-word arguments to verify_connectivity\(\) are experimental. "
-                            "They might be changed or removed in any future version without prior notice.$"
-                        ),
-                    )
                 self._driver.verify_connectivity(database=database)
-                break
+                self._connectivity_verified = True
+                return
             except neo4j.exceptions.DriverError as e:
-                exception = e
+                if time.monotonic() + wait_time > deadline:
+                    raise UnableToConnectError("Unable to connect to the Neo4j DBMS") from e
+
                 if retrys % WARN_INTERVAL == 0:
                     self._logger.warning("Unable to connect to the Neo4j DBMS. Trying again...")
 
-                time.sleep(WAIT_TIME)
+                time.sleep(wait_time)
+                wait_time = min(2 * wait_time, MAX_WAIT_TIME)
                 retrys += 1
-
-                continue
-
-        if retrys == MAX_RETRYS:
-            raise UnableToConnectError("Unable to connect to the Neo4j DBMS") from exception
@@ -0,0 +1,135 @@
+import threading
+from collections import defaultdict
+from dataclasses import dataclass
+from functools import partial
+from typing import Callable, Dict, List, Optional
+
+from .progress_provider import TaskWithProgress
+from .query_progress_provider import QueryProgressProvider
+
+ProgressCallback = Callable[[TaskWithProgress], None]
+ErrorCallback = Callable[[Exception], None]
+
+
+@dataclass
+class _Subscription:
+    database: Optional[str]
+    on_progress: ProgressCallback
+    on_error: ErrorCallback
+    last_task: Optional[TaskWithProgress] = None
+
+
+class ProgressMonitor:
+    """
+    Polls the progress of all subscribed jobs from a single background thread.
+
+    Each poll sends one `listProgress` query per database for all subscribed jobs together, and publishes changed
+    progress to the subscribers of each job. The polling interval grows while no progress changes and is reset
+    whenever a job is subscribed or makes progress. The thread is started on the first subscription and stops once
+    there are no subscriptions left.
+    """
+
+    _MIN_POLLING_INTERVAL = 0.5
+    _MAX_POLLING_INTERVAL = 5.0
+    _POLLING_BACKOFF_FACTOR = 1.5
+
+    def __init__(self, progress_provider: QueryProgressProvider):
+        self._progress_provider = progress_provider
+        self._subscriptions: Dict[str, _Subscription] = {}
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._polling_interval = self._MIN_POLLING_INTERVAL
+        # The job whose callback is currently running on the polling thread
+        self._publishing_job_id: Optional[str] = None
+
+    def subscribe(
+        self, job_id: str, database: Optional[str], on_progress: ProgressCallback, on_error: ErrorCallback
+    ) -> None:
+        with self._condition:
+            self._subscriptions[job_id] = _Subscription(database, on_progress, on_error)
+            self._polling_interval = self._MIN_POLLING_INTERVAL
+
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="gds-progress-monitor", daemon=True)
+                self._thread.start()
+
+    def unsubscribe(self, job_id: str) -> None:
+        """
+        Stop publishing progress for the job. No callback of the job is running or will run once this returns.
+        Only a running callback of the same job is waited for, so a slow callback does not block other jobs.
+        """
+        with self._condition:
+            self._subscriptions.pop(job_id, None)
+            self._condition.notify_all()
+
+            # A callback unsubscribing its own job must not wait for itself
+            if threading.current_thread() is not self._thread:
+                self._condition.wait_for(lambda: self._publishing_job_id != job_id)
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: not self._subscriptions, timeout=self._polling_interval)
+                if not self._subscriptions:
+                    self._thread = None
+                    return
+
+                subscriptions = dict(self._subscriptions)
+
+            changed = self._poll(subscriptions)
+
+            with self._condition:
+                if changed:
+                    self._polling_interval = self._MIN_POLLING_INTERVAL
+                else:
+                    self._polling_interval = min(
+                        self._polling_interval * self._POLLING_BACKOFF_FACTOR, self._MAX_POLLING_INTERVAL
+                    )
+
+    def _poll(self, subscriptions: Dict[str, _Subscription]) -> bool:
+        job_ids_by_database: Dict[Optional[str], List[str]] = defaultdict(list)
+        for job_id, subscription in subscriptions.items():
+            job_ids_by_database[subscription.database].append(job_id)
+
+        changed = False
+        for database, job_ids in job_ids_by_database.items():
+            try:
+                tasks = self._progress_provider.root_tasks_with_progress(job_ids, database)
+            except Exception as e:
+                for job_id in job_ids:
+                    self._publish(job_id, subscriptions[job_id], partial(subscriptions[job_id].on_error, e))
+                continue
+
+            # Jobs that have not started yet or have already completed are not part of the result
+            for job_id, task in tasks.items():
+                subscription = subscriptions.get(job_id)
+                if subscription is None or task == subscription.last_task:
+                    continue
+
+                subscription.last_task = task
+                # A job with an unknown volume will not report any progress
+                unsubscribe = task.progress_percent == "n/a"
+                if self._publish(job_id, subscription, partial(subscription.on_progress, task), unsubscribe):
+                    changed = True
+
+        return changed
+
+    def _publish(
+        self, job_id: str, subscription: _Subscription, callback: Callable[[], None], unsubscribe: bool = False
+    ) -> bool:
+        # The callback runs without holding the lock, so that a slow subscriber does not block (un)subscribing
+        with self._condition:
+            if self._subscriptions.get(job_id) is not subscription:
+                return False
+            self._publishing_job_id = job_id
+
+        try:
+            callback()
+        finally:
+            with self._condition:
+                self._publishing_job_id = None
+                if unsubscribe and self._subscriptions.get(job_id) is subscription:
+                    del self._subscriptions[job_id]
+                self._condition.notify_all()
+
+        return True
@@ -0,0 +1,199 @@
+import logging
+import warnings
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, NoReturn, Optional, Set
+
+from tqdm.auto import tqdm
+
+from .progress_monitor import ProgressMonitor
+from .progress_provider import TaskWithProgress
+
+
+class ProgressSink(ABC):
+    """
+    Receives the progress of procedures that are run with progress logging.
+
+    A single sink can receive the progress of several concurrently running jobs, which are told apart by their job id.
+    `start` and `finish` are called on the thread calling the procedure, while `update` and `error` are called on the
+    thread polling the progress.
+    """
+
+    def start(self, job_id: str) -> None:
+        """Called before the procedure of the job is run."""
+        pass
+
+    @abstractmethod
+    def update(self, job_id: str, task_with_progress: TaskWithProgress) -> None:
+        """
+        Called when the progress of the root task of the job changed.
+        The progress is `"n/a"` for tasks with an unknown volume, which will not receive further updates.
+        """
+        pass
+
+    def error(self, job_id: str, e: Exception) -> None:
+        """Called when the progress of the job could not be retrieved."""
+        pass
+
+    def finish(self, job_id: str) -> None:
+        """Called after the procedure of the job completed, whether it succeeded or failed."""
+        pass
+
+
+def _parse_progress_percent(task_with_progress: TaskWithProgress) -> Optional[float]:
+    if task_with_progress.progress_percent == "n/a":
+        return None
+
+    return float(task_with_progress.progress_percent[:-1])
+
+
+class TqdmProgressSink(ProgressSink):
+    """
+    Draws a tqdm progress bar per job, and warns once per job if its progress could not be retrieved.
+    This is the sink used by default.
+    """
+
+    def __init__(self) -> None:
+        self._pbars: Dict[str, tqdm[NoReturn]] = {}
+        self._failed_job_ids: Set[str] = set()
+
+    def update(self, job_id: str, task_with_progress: TaskWithProgress) -> None:
+        progress_percent = _parse_progress_percent(task_with_progress)
+        if progress_percent is None:
+            return
+
+        if job_id not in self._pbars:
+            self._pbars[job_id] = tqdm(
+                total=100,
+                unit="%",
+                desc=task_with_progress.task_name,
+                maxinterval=ProgressMonitor._MAX_POLLING_INTERVAL,
+            )
+
+        pbar = self._pbars[job_id]
+        pbar.update(progress_percent - pbar.n)
+
+    def error(self, job_id: str, e: Exception) -> None:
+        if job_id not in self._failed_job_ids:
+            warnings.warn(f"Unable to get progress: {str(e)}", RuntimeWarning)
+            self._failed_job_ids.add(job_id)
+
+    def finish(self, job_id: str) -> None:
+        self._failed_job_ids.discard(job_id)
+        pbar = self._pbars.pop(job_id, None)
+        if pbar:
+            pbar.update(100 - pbar.n)
+            pbar.refresh()
+            pbar.close()
+
+
+class CallbackProgressSink(ProgressSink):
+    """
+    Calls a function with the job id and the root task with its progress on every progress update.
+    """
+
+    def __init__(
+        self,
+        on_progress: Callable[[str, TaskWithProgress], None],
+        on_error: Optional[Callable[[str, Exception], None]] = None,
+    ):
+        self._on_progress = on_progress
+        self._on_error = on_error
+
+    def update(self, job_id: str, task_with_progress: TaskWithProgress) -> None:
+        self._on_progress(job_id, task_with_progress)
+
+    def error(self, job_id: str, e: Exception) -> None:
+        if self._on_error:
+            self._on_error(job_id, e)
+
+
+class LoggingProgressSink(ProgressSink):
+    """
+    Writes progress updates to a Python logger, and failures to retrieve progress as warnings.
+    """
+
+    def __init__(self, logger: Optional[logging.Logger] = None, level: int = logging.INFO):
+        self._logger = logger if logger else logging.getLogger(__name__)
+        self._level = level
+
+    def update(self, job_id: str, task_with_progress: TaskWithProgress) -> None:
+        self._logger.log(
+            self._level, "%s [%s]: %s", task_with_progress.task_name, job_id, task_with_progress.progress_percent
+        )
+
+    def error(self, job_id: str, e: Exception) -> None:
+        self._logger.warning("Unable to get progress of job %s: %s", job_id, e)
+
+    def finish(self, job_id: str) -> None:
+        self._logger.log(self._level, "Finished job %s", job_id)
+
+
+class GaugeProgressSink(ProgressSink):
+    """
+    Sets the progress percentage of each job on a Prometheus-style gauge with a single label for the job id,
+    for example `prometheus_client.Gauge("gds_progress_percent", "Progress of GDS jobs", ["job_id"])`.
+    The label of a job is removed when the job finished.
+    """
+
+    def __init__(self, gauge: Any):
+        self._gauge = gauge
+        self._labelled_job_ids: Set[str] = set()
+
+    def update(self, job_id: str, task_with_progress: TaskWithProgress) -> None:
+        progress_percent = _parse_progress_percent(task_with_progress)
+        if progress_percent is None:
+            return
+
+        self._gauge.labels(job_id).set(progress_percent)
+        self._labelled_job_ids.add(job_id)
+
+    def finish(self, job_id: str) -> None:
+        if job_id in self._labelled_job_ids:
+            self._gauge.remove(job_id)
+            self._labelled_job_ids.discard(job_id)
+
+
+class SpanEventProgressSink(ProgressSink):
+    """
+    Adds an OpenTelemetry span event for every progress update of a job.
+    The events are added to the given span, or else to the span that is current when the procedure is called.
+    """
+
+    EVENT_NAME = "gds.progress"
+
+    def __init__(self, span: Optional[Any] = None):
+        self._span = span
+        self._spans: Dict[str, Any] = {}
+
+    def start(self, job_id: str) -> None:
+        if self._span is not None:
+            self._spans[job_id] = self._span
+            return
+
+        try:
+            from opentelemetry import trace
+        except ImportError:
+            raise ImportError(
+                "The `opentelemetry-api` package is required to add progress events to the current span, "
+                "alternatively pass the span explicitly"
+            )
+
+        # The polling thread does not share the context of the calling thread, so the span is looked up here
+        self._spans[job_id] = trace.get_current_span()
+
+    def update(self, job_id: str, task_with_progress: TaskWithProgress) -> None:
+        span = self._spans.get(job_id)
+        if span is None:
+            return
+
+        span.add_event(
+            self.EVENT_NAME,
+            {
+                "gds.job_id": job_id,
+                "gds.task_name": task_with_progress.task_name,
+                "gds.progress": task_with_progress.progress_percent,
+            },
+        )
+
+    def finish(self, job_id: str) -> None:
+        self._spans.pop(job_id, None)
@@ -1,13 +1,15 @@
+import threading
 import warnings
-from concurrent.futures import Future, ThreadPoolExecutor, wait
-from typing import Any, Callable, Dict, NoReturn, Optional
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional
 from uuid import uuid4
 
 from pandas import DataFrame
-from tqdm.auto import tqdm
 
 from ...server_version.server_version import ServerVersion
-from .progress_provider import ProgressProvider
+from .progress_monitor import ProgressMonitor
+from .progress_provider import ProgressProvider, TaskWithProgress
+from .progress_sink import ProgressSink, TqdmProgressSink
 from .query_progress_provider import CypherQueryFunction, QueryProgressProvider, ServerVersionFunction
 from .static_progress_provider import StaticProgressProvider, StaticProgressStore
 
@@ -15,8 +17,6 @@ DataFrameProducer = Callable[[], DataFrame]
 
 
 class QueryProgressLogger:
-    _LOG_POLLING_INTERVAL = 0.5
-
     def __init__(
         self,
         run_cypher_func: CypherQueryFunction,
@@ -26,6 +26,11 @@ class QueryProgressLogger:
         self._server_version_func = server_version_func
         self._static_progress_provider = StaticProgressProvider()
         self._query_progress_provider = QueryProgressProvider(run_cypher_func, server_version_func)
+        # A single thread polls the progress of all jobs that are run concurrently through this logger
+        self._progress_monitor = ProgressMonitor(self._query_progress_provider)
+        self._progress_sinks: List[ProgressSink] = [TqdmProgressSink()]
+        # Sinks set for the calls within a `scoped_progress_sinks` block, which apply to the current thread only
+        self._scoped_progress_sinks = threading.local()
 
     @staticmethod
     def extract_or_create_job_id(params: Dict[str, Any]) -> str:
@@ -49,57 +54,58 @@ class QueryProgressLogger:
 
         # Select progress provider based on whether the job id is in the static progress store.
         # Entries in the static progress store are already visible at this point.
-        progress_provider = self._select_progress_provider(job_id)
+        if isinstance(self._select_progress_provider(job_id), StaticProgressProvider):
+            # Tasks in the static progress store have an unknown volume, so there is no progress to log
+            return runnable()
 
-        with ThreadPoolExecutor() as executor:
-            future = executor.submit(runnable)
+        progress_sinks = self.progress_sinks()
+        if len(progress_sinks) == 0:
+            return runnable()
 
-            self._log(future, job_id, progress_provider, database)
+        for sink in progress_sinks:
+            sink.start(job_id)
 
-            if future.exception():
-                raise future.exception()  # type: ignore
-            else:
-                return future.result()
+        def on_progress(task_with_progress: TaskWithProgress) -> None:
+            self._publish(progress_sinks, lambda sink: sink.update(job_id, task_with_progress))
+
+        def on_error(e: Exception) -> None:
+            self._publish(progress_sinks, lambda sink: sink.error(job_id, e))
+
+        self._progress_monitor.subscribe(job_id, database, on_progress, on_error)
+        try:
+            return runnable()
+        finally:
+            self._progress_monitor.unsubscribe(job_id)
+            self._publish(progress_sinks, lambda sink: sink.finish(job_id))
+
+    def set_progress_sinks(self, progress_sinks: List[ProgressSink]) -> None:
+        self._progress_sinks = list(progress_sinks)
+
+    def progress_sinks(self) -> List[ProgressSink]:
+        scoped_progress_sinks: Optional[List[ProgressSink]] = getattr(self._scoped_progress_sinks, "sinks", None)
+        return self._progress_sinks if scoped_progress_sinks is None else scoped_progress_sinks
+
+    @contextmanager
+    def scoped_progress_sinks(self, progress_sinks: List[ProgressSink]) -> Iterator[None]:
+        previous_progress_sinks = getattr(self._scoped_progress_sinks, "sinks", None)
+        self._scoped_progress_sinks.sinks = list(progress_sinks)
+        try:
+            yield
+        finally:
+            self._scoped_progress_sinks.sinks = previous_progress_sinks
+
+    @staticmethod
+    def _publish(progress_sinks: List[ProgressSink], notify: Callable[[ProgressSink], None]) -> None:
+        for sink in progress_sinks:
+            # A failing sink must neither fail the procedure call nor keep the other sinks from being notified
+            try:
+                notify(sink)
+            except Exception as e:
+                warnings.warn(f"Progress sink {type(sink).__name__} failed: {str(e)}", RuntimeWarning)
 
-    def _select_progress_provider(self, job_id) -> ProgressProvider:
+    def _select_progress_provider(self, job_id: str) -> ProgressProvider:
         return (
             self._static_progress_provider
             if StaticProgressStore.contains_job_id(job_id)
             else self._query_progress_provider
         )
-
-    def _log(
-        self, future: "Future[Any]", job_id: str, progress_provider: ProgressProvider, database: Optional[str] = None
-    ) -> None:
-        pbar: Optional[tqdm[NoReturn]] = None
-        warn_if_failure = True
-
-        while wait([future], timeout=self._LOG_POLLING_INTERVAL).not_done:
-            try:
-                task_with_progress = progress_provider.root_task_with_progress(job_id, database)
-                root_task_name = task_with_progress.task_name
-                progress_percent = task_with_progress.progress_percent
-
-                if progress_percent == "n/a":
-                    return
-
-                if not pbar:
-                    pbar = tqdm(total=100, unit="%", desc=root_task_name, maxinterval=self._LOG_POLLING_INTERVAL)
-
-                parsed_progress = float(progress_percent[:-1])
-                pbar.update(parsed_progress - pbar.n)
-            except Exception as e:
-                # Do nothing if the procedure either:
-                # * has not started yet,
-                # * has already completed.
-                if f"No task with job id `{job_id}` was found" in str(e):
-                    continue
-                else:
-                    if warn_if_failure:
-                        warnings.warn(f"Unable to get progress: {str(e)}", RuntimeWarning)
-                        warn_if_failure = False
-                    continue
-
-        if pbar:
-            pbar.update(100 - pbar.n)
-            pbar.refresh()
@@ -1,4 +1,4 @@
-from typing import Callable, Optional
+from typing import Callable, Dict, List, Optional
 
 from pandas import DataFrame
 
@@ -34,3 +34,27 @@ class QueryProgressProvider(ProgressProvider):
         root_task_name = progress["taskName"][0].split("|--")[-1][1:]
 
         return TaskWithProgress(root_task_name, progress_percent)
+
+    def root_tasks_with_progress(
+        self, job_ids: List[str], database: Optional[str] = None
+    ) -> Dict[str, TaskWithProgress]:
+        """
+        Return the root task with progress of every given job that is currently running, using a single query.
+        """
+        tier = "beta." if self._server_version_func() < ServerVersion(2, 5, 0) else ""
+        job_id_list = ", ".join(f"'{job_id}'" for job_id in job_ids)
+        # without a job id, only the root task of each job is listed
+        progress = self._run_cypher_func(
+            f"CALL gds.{tier}listProgress()"
+            + " YIELD jobId, taskName, progress"
+            + f" WHERE jobId IN [{job_id_list}]"
+            + " RETURN jobId, taskName, progress",
+            database,
+        )
+
+        return {
+            job_id: TaskWithProgress(task_name.split("|--")[-1].strip(), progress_percent)
+            for job_id, task_name, progress_percent in zip(
+                progress["jobId"], progress["taskName"], progress["progress"]
+            )
+        }
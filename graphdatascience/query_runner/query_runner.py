@@ -1,11 +1,15 @@
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from contextlib import nullcontext
+from typing import Any, ContextManager, Dict, Iterator, List, Optional, Union
 
 from pandas import DataFrame
+from pyarrow import Table
 
 from ..call_parameters import CallParameters
 from ..server_version.server_version import ServerVersion
 from .graph_constructor import GraphConstructor
+from .graph_info_cache import GraphInfoCache
+from .progress.progress_sink import ProgressSink
 
 
 class QueryRunner(ABC):
@@ -21,6 +25,30 @@ class QueryRunner(ABC):
     ) -> DataFrame:
         pass
 
+    def call_procedure_batches(
+        self,
+        endpoint: str,
+        params: Optional[CallParameters] = None,
+        yields: Optional[List[str]] = None,
+        database: Optional[str] = None,
+        custom_error: bool = True,
+        batch_size: Optional[int] = None,
+    ) -> Iterator[DataFrame]:
+        # Runners that cannot stream results incrementally return the full result as a single batch
+        yield self.call_procedure(endpoint, params, yields, database, custom_error=custom_error)
+
+    def call_procedure_arrow(
+        self,
+        endpoint: str,
+        params: Optional[CallParameters] = None,
+        yields: Optional[List[str]] = None,
+        database: Optional[str] = None,
+        custom_error: bool = True,
+    ) -> Union[Table, DataFrame]:
+        # Runners that do not receive Arrow data return the pandas result, which the caller converts once it is
+        # brought into its final shape, as Arrow requires a single type per column
+        return self.call_procedure(endpoint, params, yields, database, custom_error=custom_error)
+
     @abstractmethod
     def call_function(self, endpoint: str, params: Optional[CallParameters] = None) -> Any:
         pass
@@ -60,8 +88,13 @@ class QueryRunner(ABC):
 
     @abstractmethod
     def create_graph_constructor(
-        self, graph_name: str, concurrency: int, undirected_relationship_types: Optional[List[str]]
+        self,
+        graph_name: str,
+        concurrency: int,
+        undirected_relationship_types: Optional[List[str]],
+        **upload_options: Any,
     ) -> GraphConstructor:
+        # The upload options tune uploads via Arrow Flight, and are ignored by constructors that do not use it
         pass
 
     @abstractmethod
@@ -78,3 +111,14 @@ class QueryRunner(ABC):
 
     def set_server_version(self, _: ServerVersion) -> None:
         pass
+
+    def set_progress_sinks(self, progress_sinks: List[ProgressSink]) -> None:
+        pass
+
+    def graph_info_cache(self) -> Optional[GraphInfoCache]:
+        # Runners without a cache make graph objects look up the catalog on every access
+        return None
+
+    def scoped_progress_sinks(self, progress_sinks: List[ProgressSink]) -> ContextManager[None]:
+        # Runners that do not log progress have no sinks to replace
+        return nullcontext()
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 import time
-from typing import Any, Dict, List, Optional
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Union
 from uuid import uuid4
 
 from pandas import DataFrame
+from pyarrow import Table
 
 from graphdatascience.query_runner.graph_constructor import GraphConstructor
 from graphdatascience.query_runner.progress.query_progress_logger import QueryProgressLogger
@@ -13,6 +15,8 @@ from graphdatascience.server_version.server_version import ServerVersion
 from ..call_parameters import CallParameters
 from ..session.dbms.protocol_resolver import ProtocolVersionResolver
 from .gds_arrow_client import GdsArrowClient
+from .graph_info_cache import GraphInfoCache
+from .progress.progress_sink import ProgressSink
 from .progress.static_progress_provider import StaticProgressStore
 from .protocol.project_protocols import ProjectProtocol
 from .protocol.write_protocols import WriteProtocol
@@ -50,7 +54,13 @@ class SessionQueryRunner(QueryRunner):
         database: Optional[str] = None,
         custom_error: bool = True,
     ) -> DataFrame:
-        return self._db_query_runner.run_cypher(query, params, database, custom_error)
+        try:
+            return self._db_query_runner.run_cypher(query, params, database, custom_error)
+        finally:
+            # Cypher run against the database may project graphs into the session
+            graph_info_cache = self.graph_info_cache()
+            if graph_info_cache is not None:
+                graph_info_cache.invalidate_after_query(query)
 
     def call_function(self, endpoint: str, params: Optional[CallParameters] = None) -> Any:
         return self._gds_query_runner.call_function(endpoint, params)
@@ -68,6 +78,10 @@ class SessionQueryRunner(QueryRunner):
             params = CallParameters()
 
         if SessionQueryRunner.GDS_REMOTE_PROJECTION_PROC_NAME in endpoint:
+            graph_info_cache = self.graph_info_cache()
+            if graph_info_cache is not None:
+                # The projection runs on the database, so the cache of the session does not see the call
+                graph_info_cache.invalidate(params["graph_name"])
             return self._remote_projection(endpoint, params, yields, database, logging)
 
         elif ".write" in endpoint and self.is_remote_projected_graph(params["graph_name"]):
@@ -75,6 +89,29 @@ class SessionQueryRunner(QueryRunner):
 
         return self._gds_query_runner.call_procedure(endpoint, params, yields, database, logging, custom_error)
 
+    def call_procedure_batches(
+        self,
+        endpoint: str,
+        params: Optional[CallParameters] = None,
+        yields: Optional[List[str]] = None,
+        database: Optional[str] = None,
+        custom_error: bool = True,
+        batch_size: Optional[int] = None,
+    ) -> Iterator[DataFrame]:
+        return self._gds_query_runner.call_procedure_batches(
+            endpoint, params, yields, database, custom_error, batch_size
+        )
+
+    def call_procedure_arrow(
+        self,
+        endpoint: str,
+        params: Optional[CallParameters] = None,
+        yields: Optional[List[str]] = None,
+        database: Optional[str] = None,
+        custom_error: bool = True,
+    ) -> Union[Table, DataFrame]:
+        return self._gds_query_runner.call_procedure_arrow(endpoint, params, yields, database, custom_error)
+
     def is_remote_projected_graph(self, graph_name: str) -> bool:
         database_location: str = self._gds_query_runner.call_procedure(
             endpoint="gds.graph.list",
@@ -98,6 +135,19 @@ class SessionQueryRunner(QueryRunner):
     def set_bookmarks(self, bookmarks: Optional[Any]) -> None:
         self._db_query_runner.set_bookmarks(bookmarks)
 
+    def graph_info_cache(self) -> Optional[GraphInfoCache]:
+        return self._gds_query_runner.graph_info_cache()
+
+    def set_progress_sinks(self, progress_sinks: List[ProgressSink]) -> None:
+        self._gds_query_runner.set_progress_sinks(progress_sinks)
+        self._progress_logger.set_progress_sinks(progress_sinks)
+
+    @contextmanager
+    def scoped_progress_sinks(self, progress_sinks: List[ProgressSink]) -> Iterator[None]:
+        with self._gds_query_runner.scoped_progress_sinks(progress_sinks):
+            with self._progress_logger.scoped_progress_sinks(progress_sinks):
+                yield
+
     def bookmarks(self) -> Optional[Any]:
         return self._db_query_runner.bookmarks()
 
@@ -108,9 +158,15 @@ class SessionQueryRunner(QueryRunner):
         return self._db_query_runner.database()
 
     def create_graph_constructor(
-        self, graph_name: str, concurrency: int, undirected_relationship_types: Optional[List[str]]
+        self,
+        graph_name: str,
+        concurrency: int,
+        undirected_relationship_types: Optional[List[str]],
+        **upload_options: Any,
     ) -> GraphConstructor:
-        return self._gds_query_runner.create_graph_constructor(graph_name, concurrency, undirected_relationship_types)
+        return self._gds_query_runner.create_graph_constructor(
+            graph_name, concurrency, undirected_relationship_types, **upload_options
+        )
 
     def close(self) -> None:
         self._gds_arrow_client.close()
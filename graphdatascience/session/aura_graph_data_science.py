@@ -1,4 +1,4 @@
-from typing import Any, Callable, Dict, Optional
+from typing import Any, Callable, ContextManager, Dict, List, Optional
 
 from pandas import DataFrame
 
@@ -15,6 +15,7 @@ from graphdatascience.query_runner.arrow_info import ArrowInfo
 from graphdatascience.query_runner.arrow_query_runner import ArrowQueryRunner
 from graphdatascience.query_runner.gds_arrow_client import GdsArrowClient
 from graphdatascience.query_runner.neo4j_query_runner import Neo4jQueryRunner
+from graphdatascience.query_runner.progress.progress_sink import ProgressSink
 from graphdatascience.query_runner.session_query_runner import SessionQueryRunner
 from graphdatascience.session.dbms_connection_info import DbmsConnectionInfo
 from graphdatascience.utils.util_remote_proc_runner import UtilRemoteProcRunner
@@ -35,6 +36,7 @@ class AuraGraphDataScience(DirectEndpoints, UncallableNamespace):
         arrow_disable_server_verification: bool = False,
         arrow_tls_root_certs: Optional[bytes] = None,
         bookmarks: Optional[Any] = None,
+        arrow_compression: Optional[str] = None,
     ):
         # we need to explicitly set this as the default value is None
         # database in the session is always neo4j
@@ -53,9 +55,10 @@ class AuraGraphDataScience(DirectEndpoints, UncallableNamespace):
             encrypted=session_bolt_query_runner.encrypted(),
             disable_server_verification=arrow_disable_server_verification,
             tls_root_certs=arrow_tls_root_certs,
+            compression=arrow_compression,
         )
 
-        # TODO: merge with the gds_arrow_client created inside ArrowQueryRunner
+        # shares the pooled Flight connection with the gds_arrow_client created inside ArrowQueryRunner
         session_arrow_client = GdsArrowClient.create(
             session_bolt_query_runner,
             arrow_info,
@@ -63,6 +66,7 @@ class AuraGraphDataScience(DirectEndpoints, UncallableNamespace):
             session_bolt_query_runner.encrypted(),
             arrow_disable_server_verification,
             arrow_tls_root_certs,
+            compression=arrow_compression,
         )
 
         db_bolt_query_runner = Neo4jQueryRunner.create(
@@ -159,6 +163,33 @@ class AuraGraphDataScience(DirectEndpoints, UncallableNamespace):
         """
         self._query_runner.set_bookmarks(bookmarks)
 
+    def set_progress_sinks(self, progress_sinks: List[ProgressSink]) -> None:
+        """
+        Set where procedures that log their progress report it to. By default, progress is shown as a tqdm progress bar.
+
+        Parameters
+        ----------
+        progress_sinks: List[ProgressSink]
+            The sinks receiving the progress. If empty, progress is not polled at all.
+        """
+        self._query_runner.set_progress_sinks(progress_sinks)
+
+    def progress_sinks(self, progress_sinks: List[ProgressSink]) -> ContextManager[None]:
+        """
+        Report the progress of procedures called on the current thread within the returned context to the given sinks,
+        instead of to the sinks set with `set_progress_sinks`.
+
+        Parameters
+        ----------
+        progress_sinks: List[ProgressSink]
+            The sinks receiving the progress. If empty, progress is not polled at all.
+
+        Returns
+        -------
+        A context manager to use in a `with` statement.
+        """
+        return self._query_runner.scoped_progress_sinks(progress_sinks)
+
     def database(self) -> Optional[str]:
         """
         Get the database which cypher queries are run against.
@@ -47,6 +47,7 @@ class DedicatedSessions:
         db_connection: DbmsConnectionInfo,
         ttl: Optional[timedelta] = None,
         cloud_location: Optional[CloudLocation] = None,
+        arrow_compression: Optional[str] = None,
     ) -> AuraGraphDataScience:
         self._validate_db_connection(db_connection)
 
@@ -75,7 +76,10 @@ class DedicatedSessions:
         )
 
         return self._construct_client(
-            session_id=session_id, session_connection=session_connection, db_connection=db_connection
+            session_id=session_id,
+            session_connection=session_connection,
+            db_connection=db_connection,
+            arrow_compression=arrow_compression,
         )
 
     def delete(self, *, session_name: Optional[str] = None, session_id: Optional[str] = None) -> bool:
@@ -152,10 +156,15 @@ class DedicatedSessions:
             return self._aura_api.create_session(name=session_name, dbid=dbid, pwd=pwd, memory=memory, ttl=ttl)
 
     def _construct_client(
-        self, session_id: str, session_connection: DbmsConnectionInfo, db_connection: DbmsConnectionInfo
+        self,
+        session_id: str,
+        session_connection: DbmsConnectionInfo,
+        db_connection: DbmsConnectionInfo,
+        arrow_compression: Optional[str] = None,
     ) -> AuraGraphDataScience:
         return AuraGraphDataScience.create(
             gds_session_connection_info=session_connection,
             db_connection_info=db_connection,
             delete_fn=lambda: self._aura_api.delete_session(session_id=session_id),
+            arrow_compression=arrow_compression,
         )
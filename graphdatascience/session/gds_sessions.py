@@ -77,6 +77,7 @@ class GdsSessions:
         db_connection: DbmsConnectionInfo,
         ttl: Optional[timedelta] = None,
         cloud_location: Optional[CloudLocation] = None,
+        arrow_compression: Optional[str] = None,
     ) -> AuraGraphDataScience:
         """
         Retrieves an existing session with the given session name and database connection,
@@ -90,11 +91,19 @@ class GdsSessions:
             db_connection (DbmsConnectionInfo): The database connection information.
             ttl: Optional[timedelta]: The sessions time to live after inactivity in seconds.
             cloud_location (Optional[CloudLocation]): The cloud location. Required if the GDS session is for a self-managed database.
+            arrow_compression (Optional[str]): The IPC compression ("lz4" or "zstd") of data sent to the session.
 
         Returns:
             AuraGraphDataScience: The session.
         """
-        return self._impl.get_or_create(session_name, memory, db_connection, ttl=ttl, cloud_location=cloud_location)
+        return self._impl.get_or_create(
+            session_name,
+            memory,
+            db_connection,
+            ttl=ttl,
+            cloud_location=cloud_location,
+            arrow_compression=arrow_compression,
+        )
 
     def delete(self, *, session_name: Optional[str] = None, session_id: Optional[str] = None) -> bool:
         """
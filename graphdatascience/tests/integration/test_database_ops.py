@@ -1,9 +1,9 @@
-import concurrent.futures as f
 import re
 import time
 
 import pytest
 from neo4j import Driver
+from pandas import DataFrame
 
 from graphdatascience.graph_data_science import GraphDataScience
 from graphdatascience.query_runner.neo4j_query_runner import Neo4jQueryRunner
@@ -182,10 +182,12 @@ def test_no_db_explicitly_set() -> None:
 
 
 def test_warning_when_logging_fails(runner: Neo4jQueryRunner) -> None:
-    with f.ThreadPoolExecutor(1) as pool:
-        future = pool.submit(lambda: time.sleep(2))
-        with pytest.warns(RuntimeWarning, match=r"^Unable to get progress:"):
-            runner._progress_logger._log(future, "DUMMY", "bad_database")
+    def slow_query() -> DataFrame:
+        time.sleep(2)
+        return DataFrame()
+
+    with pytest.warns(RuntimeWarning, match=r"^Unable to get progress:"):
+        runner._progress_logger.run_with_progress_logging(slow_query, "DUMMY", "bad_database")
 
 
 def test_bookmarks(runner: Neo4jQueryRunner) -> None:
@@ -38,6 +38,7 @@ class CollectingQueryRunner(QueryRunner):
 
         self.queries: List[str] = []
         self.params: List[Dict[str, Any]] = []
+        self.upload_options: List[Dict[str, Any]] = []
         self._server_version = server_version
         self._database = "dummy"
 
@@ -116,8 +117,13 @@ class CollectingQueryRunner(QueryRunner):
         return None
 
     def create_graph_constructor(
-        self, graph_name: str, concurrency: int, undirected_relationship_types: Optional[List[str]]
+        self,
+        graph_name: str,
+        concurrency: int,
+        undirected_relationship_types: Optional[List[str]],
+        **upload_options: Any,
     ) -> GraphConstructor:
+        self.upload_options.append(upload_options)
         return CypherGraphConstructor(
             self, graph_name, concurrency, undirected_relationship_types, self._server_version
         )
@@ -0,0 +1,123 @@
+import threading
+from typing import List, Optional
+
+from pandas import DataFrame
+
+from graphdatascience import ServerVersion
+from graphdatascience.query_runner.progress.progress_monitor import ProgressMonitor
+from graphdatascience.query_runner.progress.progress_provider import TaskWithProgress
+from graphdatascience.query_runner.progress.query_progress_provider import QueryProgressProvider
+
+
+class FakeProgressMonitor(ProgressMonitor):
+    _MIN_POLLING_INTERVAL = 0.01
+    _MAX_POLLING_INTERVAL = 0.05
+
+
+def test_polls_all_jobs_with_one_query() -> None:
+    queries: List[str] = []
+    both_polled = threading.Event()
+
+    def fake_run_cypher(query: str, database: Optional[str] = None) -> DataFrame:
+        queries.append(query)
+        return DataFrame(
+            [
+                {"jobId": "foo", "taskName": "Louvain", "progress": "42%"},
+                {"jobId": "bar", "taskName": "WCC", "progress": "n/a"},
+            ]
+        )
+
+    received: List[TaskWithProgress] = []
+
+    def on_progress(task: TaskWithProgress) -> None:
+        received.append(task)
+        if len(received) == 2:
+            both_polled.set()
+
+    monitor = FakeProgressMonitor(QueryProgressProvider(fake_run_cypher, lambda: ServerVersion(3, 0, 0)))
+    monitor.subscribe("foo", None, on_progress, lambda e: None)
+    monitor.subscribe("bar", None, on_progress, lambda e: None)
+
+    assert both_polled.wait(timeout=5)
+    monitor.unsubscribe("foo")
+    monitor.unsubscribe("bar")
+
+    assert (
+        "CALL gds.listProgress() YIELD jobId, taskName, progress"
+        " WHERE jobId IN ['foo', 'bar'] RETURN jobId, taskName, progress"
+    ) in queries
+    assert sorted(received, key=lambda task: task.task_name) == [
+        TaskWithProgress("Louvain", "42%"),
+        TaskWithProgress("WCC", "n/a"),
+    ]
+
+
+def test_publishes_only_changed_progress() -> None:
+    progress = iter(["10%", "10%", "50%"])
+    polled_three_times = threading.Event()
+
+    def fake_run_cypher(query: str, database: Optional[str] = None) -> DataFrame:
+        percent = next(progress, None)
+        if percent is None:
+            polled_three_times.set()
+            return DataFrame(columns=["jobId", "taskName", "progress"])
+
+        return DataFrame([{"jobId": "foo", "taskName": "Louvain", "progress": percent}])
+
+    received: List[str] = []
+
+    monitor = FakeProgressMonitor(QueryProgressProvider(fake_run_cypher, lambda: ServerVersion(3, 0, 0)))
+    monitor.subscribe("foo", "database", lambda task: received.append(task.progress_percent), lambda e: None)
+
+    assert polled_three_times.wait(timeout=5)
+    monitor.unsubscribe("foo")
+
+    assert received == ["10%", "50%"]
+
+
+def test_reports_errors_to_subscribers() -> None:
+    errors: List[Exception] = []
+    failed = threading.Event()
+
+    def fake_run_cypher(query: str, database: Optional[str] = None) -> DataFrame:
+        raise RuntimeError("Database 'bad_database' not found")
+
+    def on_error(e: Exception) -> None:
+        errors.append(e)
+        failed.set()
+
+    monitor = FakeProgressMonitor(QueryProgressProvider(fake_run_cypher, lambda: ServerVersion(3, 0, 0)))
+    monitor.subscribe("foo", "bad_database", lambda task: None, on_error)
+
+    assert failed.wait(timeout=5)
+    monitor.unsubscribe("foo")
+
+    assert "bad_database" in str(errors[0])
+
+
+def test_slow_subscriber_does_not_block_other_jobs() -> None:
+    in_callback = threading.Event()
+    release_callback = threading.Event()
+
+    def fake_run_cypher(query: str, database: Optional[str] = None) -> DataFrame:
+        return DataFrame([{"jobId": "foo", "taskName": "Louvain", "progress": "42%"}])
+
+    def slow_on_progress(task: TaskWithProgress) -> None:
+        in_callback.set()
+        release_callback.wait(timeout=5)
+
+    monitor = FakeProgressMonitor(QueryProgressProvider(fake_run_cypher, lambda: ServerVersion(3, 0, 0)))
+    monitor.subscribe("foo", None, slow_on_progress, lambda e: None)
+    assert in_callback.wait(timeout=5)
+
+    def subscribe_and_unsubscribe_other_job() -> None:
+        monitor.subscribe("bar", None, lambda task: None, lambda e: None)
+        monitor.unsubscribe("bar")
+
+    other_job = threading.Thread(target=subscribe_and_unsubscribe_other_job)
+    other_job.start()
+    other_job.join(timeout=1)
+    assert not other_job.is_alive()
+
+    release_callback.set()
+    monitor.unsubscribe("foo")
@@ -0,0 +1,77 @@
+import logging
+from typing import Any, Dict, List, Tuple
+
+import pytest
+
+from graphdatascience.query_runner.progress.progress_provider import TaskWithProgress
+from graphdatascience.query_runner.progress.progress_sink import (
+    GaugeProgressSink,
+    LoggingProgressSink,
+    SpanEventProgressSink,
+)
+
+
+class FakeGauge:
+    def __init__(self) -> None:
+        self.values: Dict[str, float] = {}
+        self._job_id = ""
+
+    def labels(self, job_id: str) -> "FakeGauge":
+        self._job_id = job_id
+        return self
+
+    def set(self, value: float) -> None:
+        self.values[self._job_id] = value
+
+    def remove(self, job_id: str) -> None:
+        del self.values[job_id]
+
+
+class FakeSpan:
+    def __init__(self) -> None:
+        self.events: List[Tuple[str, Dict[str, Any]]] = []
+
+    def add_event(self, name: str, attributes: Dict[str, Any]) -> None:
+        self.events.append((name, attributes))
+
+
+def test_logging_sink(caplog: pytest.LogCaptureFixture) -> None:
+    sink = LoggingProgressSink(logging.getLogger("test"))
+
+    with caplog.at_level(logging.INFO, logger="test"):
+        sink.update("foo", TaskWithProgress("Louvain", "42%"))
+        sink.error("foo", RuntimeError("Database not found"))
+        sink.finish("foo")
+
+    assert [record.getMessage() for record in caplog.records] == [
+        "Louvain [foo]: 42%",
+        "Unable to get progress of job foo: Database not found",
+        "Finished job foo",
+    ]
+
+
+def test_gauge_sink() -> None:
+    gauge = FakeGauge()
+    sink = GaugeProgressSink(gauge)
+
+    sink.update("foo", TaskWithProgress("Louvain", "42.5%"))
+    sink.update("bar", TaskWithProgress("WCC", "n/a"))
+    assert gauge.values == {"foo": 42.5}
+
+    sink.finish("foo")
+    sink.finish("bar")
+    assert gauge.values == {}
+
+
+def test_span_event_sink() -> None:
+    span = FakeSpan()
+    sink = SpanEventProgressSink(span)
+
+    sink.start("foo")
+    sink.update("foo", TaskWithProgress("Louvain", "42%"))
+    sink.finish("foo")
+    sink.update("foo", TaskWithProgress("Louvain", "100%"))
+
+    assert span.events == [
+        ("gds.progress", {"gds.job_id": "foo", "gds.task_name": "Louvain", "gds.progress": "42%"}),
+    ]
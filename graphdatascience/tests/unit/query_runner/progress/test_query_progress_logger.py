@@ -1,9 +1,12 @@
 import time
-from typing import Optional
+from typing import List, Optional
 
+import pytest
 from pandas import DataFrame
 
 from graphdatascience import ServerVersion
+from graphdatascience.query_runner.progress.progress_provider import TaskWithProgress
+from graphdatascience.query_runner.progress.progress_sink import CallbackProgressSink, ProgressSink, TqdmProgressSink
 from graphdatascience.query_runner.progress.query_progress_logger import QueryProgressLogger
 from graphdatascience.query_runner.progress.query_progress_provider import QueryProgressProvider
 from graphdatascience.query_runner.progress.static_progress_provider import StaticProgressProvider, StaticProgressStore
@@ -12,10 +15,13 @@ from graphdatascience.tests.unit.conftest import CollectingQueryRunner
 
 def test_call_through_functions() -> None:
     def fake_run_cypher(query: str, database: Optional[str] = None) -> DataFrame:
-        assert query == "CALL gds.listProgress('foo') YIELD taskName, progress RETURN taskName, progress LIMIT 1"
+        assert query == (
+            "CALL gds.listProgress() YIELD jobId, taskName, progress"
+            " WHERE jobId IN ['foo'] RETURN jobId, taskName, progress"
+        )
         assert database == "database"
 
-        return DataFrame([{"progress": "n/a", "taskName": "Test task"}])
+        return DataFrame([{"jobId": "foo", "progress": "n/a", "taskName": "Test task"}])
 
     def fake_query() -> DataFrame:
         time.sleep(1)
@@ -43,10 +49,13 @@ def test_skips_progress_logging_for_old_server_version() -> None:
 
 def test_uses_beta_endpoint() -> None:
     def fake_run_cypher(query: str, database: Optional[str] = None) -> DataFrame:
-        assert query == "CALL gds.beta.listProgress('foo') YIELD taskName, progress RETURN taskName, progress LIMIT 1"
+        assert query == (
+            "CALL gds.beta.listProgress() YIELD jobId, taskName, progress"
+            " WHERE jobId IN ['foo'] RETURN jobId, taskName, progress"
+        )
         assert database == "database"
 
-        return DataFrame([{"progress": "n/a", "taskName": "Test task"}])
+        return DataFrame([{"jobId": "foo", "progress": "n/a", "taskName": "Test task"}])
 
     def fake_query() -> DataFrame:
         time.sleep(1)
@@ -75,3 +84,59 @@ def test_uses_static_store() -> None:
     task_with_volume = progress_provider.root_task_with_progress("test-job")
     assert task_with_volume.task_name == "Test task"
     assert task_with_volume.progress_percent == "n/a"
+
+
+def test_reports_progress_to_scoped_sinks() -> None:
+    def fake_run_cypher(query: str, database: Optional[str] = None) -> DataFrame:
+        return DataFrame([{"jobId": "foo", "progress": "42%", "taskName": "Test task"}])
+
+    def fake_query() -> DataFrame:
+        time.sleep(1)
+        return DataFrame([{"result": 42}])
+
+    updates: List[str] = []
+    qpl = QueryProgressLogger(fake_run_cypher, lambda: ServerVersion(3, 0, 0))
+    with qpl.scoped_progress_sinks([CallbackProgressSink(lambda job_id, task: updates.append(task.progress_percent))]):
+        df = qpl.run_with_progress_logging(fake_query, "foo", "database")
+
+    assert df["result"][0] == 42
+    assert updates == ["42%"]
+    assert isinstance(qpl.progress_sinks()[0], TqdmProgressSink)
+
+
+def test_skips_polling_without_sinks() -> None:
+    def fake_run_cypher(query: str, database: Optional[str] = None) -> DataFrame:  # type: ignore
+        print("Should not be called!")
+        assert False
+
+    def fake_query() -> DataFrame:
+        time.sleep(1)
+        return DataFrame([{"result": 42}])
+
+    qpl = QueryProgressLogger(fake_run_cypher, lambda: ServerVersion(3, 0, 0))
+    qpl.set_progress_sinks([])
+    df = qpl.run_with_progress_logging(fake_query, "foo", "database")
+
+    assert df["result"][0] == 42
+
+
+def test_failing_sink_does_not_fail_the_call() -> None:
+    def fake_run_cypher(query: str, database: Optional[str] = None) -> DataFrame:
+        return DataFrame([{"jobId": "foo", "progress": "n/a", "taskName": "Test task"}])
+
+    def fake_query() -> DataFrame:
+        return DataFrame([{"result": 42}])
+
+    class FailingSink(ProgressSink):
+        def update(self, job_id: str, task_with_progress: TaskWithProgress) -> None:
+            pass
+
+        def finish(self, job_id: str) -> None:
+            raise RuntimeError("sink is broken")
+
+    qpl = QueryProgressLogger(fake_run_cypher, lambda: ServerVersion(3, 0, 0))
+    qpl.set_progress_sinks([FailingSink()])
+    with pytest.warns(RuntimeWarning, match="Progress sink FailingSink failed: sink is broken"):
+        df = qpl.run_with_progress_logging(fake_query, "foo", "database")
+
+    assert df["result"][0] == 42
@@ -0,0 +1,38 @@
+import numpy as np
+
+from graphdatascience.query_runner.columnar_result import to_columnar_frame
+
+
+def test_typed_columns() -> None:
+    records = [(0, 0.5, True, "a"), (1, 1, False, "b")]
+
+    df = to_columnar_frame(["nodeId", "score", "flag", "name"], records)
+
+    assert df["nodeId"].dtype == np.int64
+    assert df["score"].dtype == np.float64
+    assert df["flag"].dtype == np.bool_
+    assert df["name"].dtype == object
+    assert df["score"].tolist() == [0.5, 1.0]
+    assert df["name"].tolist() == ["a", "b"]
+
+
+def test_columns_with_nulls_and_lists() -> None:
+    records = [(0, [1.0, 2.0]), (None, [3.0])]
+
+    df = to_columnar_frame(["nodeId", "embedding"], records)
+
+    assert df["nodeId"].isna().tolist() == [False, True]
+    assert df["embedding"].tolist() == [[1.0, 2.0], [3.0]]
+
+
+def test_integers_beyond_int64() -> None:
+    df = to_columnar_frame(["x"], [(2**64,), (1,)])
+
+    assert df["x"].tolist() == [2**64, 1]
+
+
+def test_empty_result() -> None:
+    df = to_columnar_frame(["nodeId", "score"], [])
+
+    assert list(df.columns) == ["nodeId", "score"]
+    assert len(df) == 0
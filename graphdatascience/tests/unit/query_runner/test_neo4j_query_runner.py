@@ -0,0 +1,241 @@
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+import neo4j
+import pytest
+from pandas import DataFrame, Series
+
+from graphdatascience.query_runner.neo4j_query_runner import Neo4jQueryRunner
+
+
+class FakeResult:
+    _warn_notification_severity = None
+
+    def __init__(self, df: DataFrame, iteration_failure: Optional[Exception] = None):
+        self._df = df
+        self._iteration_failure = iteration_failure
+
+    def keys(self) -> List[str]:
+        return list(self._df.columns)
+
+    def __iter__(self) -> Iterator[Tuple[Any, ...]]:
+        yield from self._df.itertuples(index=False, name=None)
+        if self._iteration_failure is not None:
+            raise self._iteration_failure
+
+    def to_df(self) -> DataFrame:
+        return self._df
+
+    def consume(self) -> Any:
+        class Summary:
+            notifications: List[Dict[str, Any]] = []
+
+        return Summary()
+
+
+class FakeSession:
+    def __init__(self, driver: "FakeDriver"):
+        self._driver = driver
+
+    def __enter__(self) -> "FakeSession":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        pass
+
+    def run(self, query: str, params: Dict[str, Any]) -> FakeResult:
+        self._driver.queries.append(query)
+        if self._driver.failures:
+            raise self._driver.failures.pop(0)
+        iteration_failure = self._driver.iteration_failures.pop(0) if self._driver.iteration_failures else None
+        return FakeResult(self._driver.result, iteration_failure)
+
+    def execute_read(self, work: Callable[[Any], DataFrame]) -> DataFrame:
+        self._driver.transactions.append("READ")
+        return self._retry(work)
+
+    def execute_write(self, work: Callable[[Any], DataFrame]) -> DataFrame:
+        self._driver.transactions.append("WRITE")
+        return self._retry(work)
+
+    def _retry(self, work: Callable[[Any], DataFrame]) -> DataFrame:
+        # like the driver, managed transactions re-run their work after a lost connection
+        try:
+            return work(self)
+        except (neo4j.exceptions.ServiceUnavailable, neo4j.exceptions.SessionExpired):
+            return work(self)
+
+    def last_bookmark(self) -> None:
+        return None
+
+    def last_bookmarks(self) -> None:
+        return None
+
+
+class FakeDriver:
+    def __init__(self, failures: Optional[List[Exception]] = None, result: Optional[DataFrame] = None):
+        self.failures = failures or []
+        self.iteration_failures: List[Exception] = []
+        self.result = result if result is not None else DataFrame([{"x": 1}])
+        self.fetch_sizes: List[Optional[int]] = []
+        self.queries: List[str] = []
+        self.transactions: List[str] = []
+        self.verifications = 0
+
+    def session(
+        self, database: Optional[str], bookmarks: Optional[Any], fetch_size: Optional[int] = None
+    ) -> FakeSession:
+        self.fetch_sizes.append(fetch_size)
+        return FakeSession(self)
+
+    def verify_connectivity(self, database: Optional[str]) -> None:
+        self.verifications += 1
+
+    def close(self) -> None:
+        pass
+
+
+def test_verifies_connectivity_once() -> None:
+    driver = FakeDriver()
+    runner = Neo4jQueryRunner(driver)  # type: ignore
+
+    for _ in range(3):
+        runner.run_cypher("RETURN 1")
+
+    assert driver.queries == ["RETURN 1"] * 3
+    assert driver.verifications == 1
+
+
+def test_reverifies_connectivity_after_lost_connection() -> None:
+    driver = FakeDriver(failures=[neo4j.exceptions.ServiceUnavailable("connection lost")])
+    runner = Neo4jQueryRunner(driver)  # type: ignore
+
+    result = runner.call_procedure("gds.pageRank.stream")
+
+    assert result.equals(DataFrame([{"x": 1}]))
+    assert driver.queries == ["CALL gds.pageRank.stream()"] * 2
+    assert driver.verifications == 2
+
+    runner.call_procedure("gds.pageRank.stream")
+
+    assert driver.verifications == 2
+
+
+def test_does_not_rerun_writes_after_lost_connection() -> None:
+    driver = FakeDriver(
+        failures=[
+            neo4j.exceptions.ServiceUnavailable("connection lost"),
+            neo4j.exceptions.SessionExpired("session expired"),
+        ]
+    )
+    runner = Neo4jQueryRunner(driver)  # type: ignore
+
+    with pytest.raises(neo4j.exceptions.ServiceUnavailable):
+        runner.call_procedure("gds.pageRank.mutate")
+
+    assert driver.queries == ["CALL gds.pageRank.mutate()"]
+    assert driver.verifications == 2
+
+    with pytest.raises(neo4j.exceptions.SessionExpired):
+        runner.run_cypher("CREATE (n)")
+
+    assert driver.queries == ["CALL gds.pageRank.mutate()", "CREATE (n)"]
+    assert driver.verifications == 3
+
+
+def test_managed_transactions() -> None:
+    driver = FakeDriver()
+    runner = Neo4jQueryRunner(driver, managed_transactions=True)  # type: ignore
+
+    runner.call_procedure("gds.pageRank.stream")
+    runner.call_procedure("gds.pageRank.mutate")
+    runner.call_procedure("gds.graph.list")
+    runner.call_procedure("gds.graph.project.estimate")
+    runner.run_cypher("MATCH (n) RETURN n")
+
+    assert driver.transactions == ["READ", "READ", "READ"]
+    assert driver.queries[-1] == "MATCH (n) RETURN n"
+
+
+def test_managed_transactions_do_not_rerun_writes() -> None:
+    driver = FakeDriver(failures=[neo4j.exceptions.ServiceUnavailable("connection lost")])
+    runner = Neo4jQueryRunner(driver, managed_transactions=True)  # type: ignore
+
+    with pytest.raises(neo4j.exceptions.ServiceUnavailable):
+        runner.call_procedure("gds.pageRank.mutate")
+
+    assert driver.transactions == []
+    assert driver.queries == ["CALL gds.pageRank.mutate()"]
+
+    driver.failures = [neo4j.exceptions.ServiceUnavailable("connection lost")]
+    runner.call_procedure("gds.pageRank.stream")
+
+    assert driver.transactions == ["READ"]
+    assert driver.queries[1:] == ["CALL gds.pageRank.stream()"] * 2
+
+
+def test_auto_commit_transactions_by_default() -> None:
+    driver = FakeDriver()
+    runner = Neo4jQueryRunner(driver)  # type: ignore
+
+    runner.call_procedure("gds.pageRank.stream")
+
+    assert driver.transactions == []
+
+
+def test_call_procedure_batches() -> None:
+    driver = FakeDriver(result=DataFrame({"nodeId": range(5), "score": [0.5] * 5}))
+    runner = Neo4jQueryRunner(driver)  # type: ignore
+
+    batches = runner.call_procedure_batches("gds.pageRank.stream", batch_size=2)
+
+    assert driver.queries == []
+
+    batches_list = list(batches)
+
+    assert driver.queries == ["CALL gds.pageRank.stream()"]
+    assert driver.fetch_sizes == [2]
+    assert [len(batch) for batch in batches_list] == [2, 2, 1]
+    assert [node_id for batch in batches_list for node_id in batch["nodeId"]] == list(range(5))
+
+
+def test_call_procedure_batches_lost_connection_while_iterating() -> None:
+    driver = FakeDriver(result=DataFrame({"nodeId": range(5)}))
+    driver.iteration_failures = [neo4j.exceptions.ServiceUnavailable("connection lost")]
+    runner = Neo4jQueryRunner(driver)  # type: ignore
+
+    batches = runner.call_procedure_batches("gds.pageRank.stream", batch_size=2)
+
+    assert len(next(batches)) == 2
+    with pytest.raises(neo4j.exceptions.ServiceUnavailable):
+        list(batches)
+
+    assert driver.verifications == 1
+    list(runner.call_procedure_batches("gds.pageRank.stream", batch_size=2))
+    assert driver.verifications == 2
+
+
+def test_call_procedure_batches_custom_error_while_iterating() -> None:
+    driver = FakeDriver(result=DataFrame({"name": ["gds.pageRank.stream"]}))
+    driver.iteration_failures = [
+        RuntimeError("There is no procedure with the name `gds.pageRank.strem` registered for this database instance")
+    ]
+    runner = Neo4jQueryRunner(driver)  # type: ignore
+
+    with pytest.raises(SyntaxError, match="Did you mean 'gds.pageRank.stream'"):
+        list(runner.call_procedure_batches("gds.pageRank.strem"))
+
+    assert driver.queries == ["CALL gds.pageRank.strem()", "CALL gds.list() YIELD name"]
+
+
+def test_run_cypher_invalidates_graph_info() -> None:
+    driver = FakeDriver()
+    runner = Neo4jQueryRunner(driver)  # type: ignore
+    graph_info_cache = runner.graph_info_cache()
+    assert graph_info_cache is not None
+
+    graph_info_cache.put(None, "g", Series({"nodeCount": 10}))
+    runner.run_cypher("MATCH (n) RETURN n")
+    assert graph_info_cache.get(None, "g") is not None
+
+    runner.run_cypher("CALL gds.graph.drop('g')")
+    assert graph_info_cache.get(None, "g") is None
@@ -36,3 +36,8 @@ def test_from_arrow_info_fails(arrow_version: str) -> None:
 def test_prefix() -> None:
     assert ArrowEndpointVersion.ALPHA.prefix() == ""
     assert ArrowEndpointVersion.V1.prefix() == "v1/"
+
+
+def test_supports_dictionary_encoding() -> None:
+    assert not ArrowEndpointVersion.ALPHA.supports_dictionary_encoding()
+    assert ArrowEndpointVersion.V1.supports_dictionary_encoding()
@@ -0,0 +1,287 @@
+import time
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Dict, List, Tuple
+
+import pytest
+from pandas import DataFrame
+from pyarrow import RecordBatch, RecordBatchReader, Schema, Table, flight, ipc
+from pyarrow.types import is_dictionary
+
+from graphdatascience.query_runner import arrow_graph_constructor
+from graphdatascience.query_runner.adaptive_batch_sizer import AdaptiveBatchSizer
+from graphdatascience.query_runner.arrow_graph_constructor import ArrowGraphConstructor
+from graphdatascience.query_runner.gds_arrow_client import GdsArrowClient
+
+
+class FakeFlightWriter:
+    def __init__(self, puts: List[Tuple[str, List[RecordBatch]]], entity_type: str) -> None:
+        self._batches: List[RecordBatch] = []
+        puts.append((entity_type, self._batches))
+
+    def __enter__(self) -> "FakeFlightWriter":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        pass
+
+    def write_batch(self, batch: RecordBatch) -> None:
+        self._batches.append(batch)
+
+
+class FakeArrowClient(GdsArrowClient):
+    def __init__(self) -> None:
+        self.actions: List[str] = []
+        self.puts: List[Tuple[str, List[RecordBatch]]] = []
+
+    def send_action(self, action_type: str, meta_data: Dict[str, Any]) -> None:
+        self.actions.append(action_type)
+
+    def start_put(self, payload: Dict[str, Any], schema: Schema) -> Tuple[Any, Any]:
+        return FakeFlightWriter(self.puts, payload["entity_type"]), None
+
+
+def uploaded_rows(client: FakeArrowClient, entity_type: str) -> int:
+    return sum(batch.num_rows for put_type, batches in client.puts if put_type == entity_type for batch in batches)
+
+
+def test_construct_from_dataframes() -> None:
+    client = FakeArrowClient()
+    constructor = ArrowGraphConstructor("neo4j", "g", client, 2, None, chunk_size=10)
+
+    nodes = DataFrame({"nodeId": range(250)})
+    rels = DataFrame({"sourceNodeId": range(50), "targetNodeId": range(50)})
+    constructor.run([nodes], [rels])
+
+    assert client.actions == ["CREATE_GRAPH", "NODE_LOAD_DONE", "RELATIONSHIP_LOAD_DONE"]
+    assert uploaded_rows(client, "node") == 250
+    assert uploaded_rows(client, "relationship") == 50
+    assert max(batch.num_rows for _, batches in client.puts for batch in batches) == 10
+
+
+def test_construct_from_arrow_table() -> None:
+    client = FakeArrowClient()
+    constructor = ArrowGraphConstructor("neo4j", "g", client, 2, None, chunk_size=10)
+
+    nodes = Table.from_pydict({"nodeId": list(range(250))})
+    constructor.run([nodes], [])
+
+    # the table is sliced into partitions of 10 chunks each
+    assert len([put for put in client.puts if put[0] == "node"]) == 3
+    assert uploaded_rows(client, "node") == 250
+
+
+def test_construct_from_record_batch_reader() -> None:
+    client = FakeArrowClient()
+    constructor = ArrowGraphConstructor("neo4j", "g", client, 2, None, chunk_size=10)
+
+    batches = [RecordBatch.from_pydict({"nodeId": list(range(i * 25, (i + 1) * 25))}) for i in range(4)]
+    reader = RecordBatchReader.from_batches(batches[0].schema, batches)
+    constructor.run([reader], [])
+
+    # the batches of the reader are distributed over one upload stream per thread
+    assert len(client.puts) == 2
+    assert sorted(batch.num_rows for _, batches in client.puts for batch in batches) == [5] * 4 + [10] * 8
+
+
+def test_construct_from_record_batch_reader_failing_upload() -> None:
+    class FailingArrowClient(FakeArrowClient):
+        def start_put(self, payload: Dict[str, Any], schema: Schema) -> Tuple[Any, Any]:
+            raise Exception("upload failed")
+
+    client = FailingArrowClient()
+    constructor = ArrowGraphConstructor("neo4j", "g", client, 2, None, chunk_size=10)
+
+    batches = [RecordBatch.from_pydict({"nodeId": list(range(i * 25, (i + 1) * 25))}) for i in range(40)]
+    reader = RecordBatchReader.from_batches(batches[0].schema, batches)
+
+    with pytest.raises(Exception, match="upload failed"):
+        constructor.run([reader], [])
+
+    assert client.actions == ["CREATE_GRAPH", "ABORT"]
+
+
+def test_construct_adapts_chunk_size_to_row_width() -> None:
+    client = FakeArrowClient()
+    constructor = ArrowGraphConstructor("neo4j", "g", client, 2, None, target_batch_bytes=16_000)
+
+    # 8 bytes per row for the ids, and 8 * 100 bytes per row for the embeddings
+    narrow = Table.from_pydict({"nodeId": list(range(10_000))})
+    wide = Table.from_pydict({"nodeId": list(range(1_000)), "embedding": [[0.0] * 100] * 1_000})
+    constructor.run([narrow], [])
+    narrow_batch_sizes = {batch.num_rows for _, batches in client.puts for batch in batches}
+
+    client.puts.clear()
+    constructor = ArrowGraphConstructor("neo4j", "g", client, 2, None, target_batch_bytes=16_000)
+    constructor.run([wide], [])
+    wide_batch_sizes = {batch.num_rows for _, batches in client.puts for batch in batches}
+
+    assert max(narrow_batch_sizes) == 2_000
+    assert max(wide_batch_sizes) == 100
+    assert constructor.upload_settings()["streams"] == 2  # type: ignore
+
+
+def test_construct_partitions_wide_dataframes_by_arrow_size() -> None:
+    client = FakeArrowClient()
+    constructor = ArrowGraphConstructor("neo4j", "g", client, 2, None, target_batch_bytes=16_000)
+
+    # pandas counts the list column as 8 bytes per row, while each list holds 800 bytes of floats
+    nodes = DataFrame({"nodeId": range(5_000), "embedding": [[0.0] * 100] * 5_000})
+    constructor.run([nodes], [])
+
+    # every partition is uploaded in its own stream
+    assert len(client.puts) > 2
+    assert uploaded_rows(client, "node") == 5_000
+
+
+def test_adaptive_batch_sizer_backs_off_on_slow_writes() -> None:
+    sizer = AdaptiveBatchSizer(target_batch_bytes=1_000, max_in_flight=4, max_write_seconds=0.001)
+
+    with sizer.write(100):
+        time.sleep(0.01)
+
+    assert sizer.settings()["streams"] == 3
+
+    sizer = AdaptiveBatchSizer(target_batch_bytes=1_000, max_in_flight=4, max_write_seconds=10.0)
+    assert sizer.chunk_size(num_bytes=80_000, num_rows=10_000) == 125
+    assert sizer.settings()["chunk_size"] == 125
+
+
+def test_adaptive_batch_sizer_adapts_to_throughput() -> None:
+    # a fast stream gets batches of up to four times the target size
+    sizer = AdaptiveBatchSizer(target_batch_bytes=1_000, max_in_flight=4, min_chunk_size=1)
+    with sizer.write(1_000_000):
+        time.sleep(0.001)
+
+    assert sizer.chunk_size(num_bytes=80_000, num_rows=10_000) == 500
+    assert sizer.settings()["batch_bytes"] == 4_000
+
+    # a slow stream gets batches of down to a quarter of the target size
+    sizer = AdaptiveBatchSizer(target_batch_bytes=1_000, max_in_flight=4, min_chunk_size=1)
+    with sizer.write(1):
+        time.sleep(0.05)
+
+    assert sizer.chunk_size(num_bytes=80_000, num_rows=10_000) == 31
+    assert sizer.settings()["batch_bytes"] == 250
+
+
+class FlakyArrowClient(FakeArrowClient):
+    def __init__(self, failures: int) -> None:
+        super().__init__()
+        self.failures = failures
+
+    def start_put(self, payload: Dict[str, Any], schema: Schema) -> Tuple[Any, Any]:
+        if self.failures > 0:
+            self.failures -= 1
+            raise flight.FlightUnavailableError("connection reset")
+
+        return super().start_put(payload, schema)
+
+
+def test_construct_retries_opening_streams() -> None:
+    client = FlakyArrowClient(failures=2)
+    constructor = ArrowGraphConstructor("neo4j", "g", client, 1, None, chunk_size=10, retry_backoff_seconds=0)
+
+    nodes = DataFrame({"nodeId": range(250)})
+    constructor.run([nodes], [])
+
+    assert client.actions == ["CREATE_GRAPH", "NODE_LOAD_DONE", "RELATIONSHIP_LOAD_DONE"]
+    assert uploaded_rows(client, "node") == 250
+
+
+def test_construct_aborts_after_retry_budget() -> None:
+    client = FlakyArrowClient(failures=3)
+    constructor = ArrowGraphConstructor(
+        "neo4j", "g", client, 1, None, chunk_size=10, max_retries=2, retry_backoff_seconds=0
+    )
+
+    batches = [RecordBatch.from_pydict({"nodeId": list(range(i * 25, (i + 1) * 25))}) for i in range(4)]
+    reader = RecordBatchReader.from_batches(batches[0].schema, batches)
+
+    with pytest.raises(flight.FlightUnavailableError, match="connection reset"):
+        constructor.run([reader], [])
+
+    assert client.actions == ["CREATE_GRAPH", "ABORT"]
+
+
+def test_construct_does_not_resend_started_streams() -> None:
+    class FailingFlightWriter(FakeFlightWriter):
+        def write_batch(self, batch: RecordBatch) -> None:
+            super().write_batch(batch)
+            raise flight.FlightUnavailableError("connection reset")
+
+    class FailingWriteArrowClient(FakeArrowClient):
+        def start_put(self, payload: Dict[str, Any], schema: Schema) -> Tuple[Any, Any]:
+            return FailingFlightWriter(self.puts, payload["entity_type"]), None
+
+    client = FailingWriteArrowClient()
+    constructor = ArrowGraphConstructor("neo4j", "g", client, 1, None, chunk_size=10, retry_backoff_seconds=0)
+
+    with pytest.raises(flight.FlightUnavailableError, match="connection reset"):
+        constructor.run([DataFrame({"nodeId": range(50)})], [])
+
+    # the batch may have been ingested by the server, so it must not be sent again
+    assert len(client.puts) == 1
+    assert client.actions == ["CREATE_GRAPH", "ABORT"]
+
+
+def test_construct_with_conversion_processes() -> None:
+    client = FakeArrowClient()
+    constructor = ArrowGraphConstructor("neo4j", "g", client, 2, None, chunk_size=10, conversion_processes=2)
+
+    nodes = DataFrame({"nodeId": range(250), "labels": [["A", "B"]] * 250})
+    rels = DataFrame({"sourceNodeId": range(50), "targetNodeId": range(50), "relationshipType": ["REL"] * 50})
+    constructor.run([nodes], [rels])
+
+    assert client.actions == ["CREATE_GRAPH", "NODE_LOAD_DONE", "RELATIONSHIP_LOAD_DONE"]
+    assert uploaded_rows(client, "node") == 250
+    assert uploaded_rows(client, "relationship") == 50
+    node_batches = [batch for entity_type, batches in client.puts if entity_type == "node" for batch in batches]
+    assert all(batch.column("labels").to_pylist() == [["A", "B"]] * batch.num_rows for batch in node_batches)
+
+
+def test_shared_ipc_stream_of_inherited_partition() -> None:
+    nodes = DataFrame({"nodeId": range(25), "embedding": [[0.5, 1.5]] * 25})
+    arrow_graph_constructor._conversion_partitions[-1] = [nodes]
+
+    try:
+        name, size = arrow_graph_constructor._to_shared_ipc_stream(-1, 0)
+    finally:
+        del arrow_graph_constructor._conversion_partitions[-1]
+
+    shared_memory = SharedMemory(name=name)
+    try:
+        table = ipc.open_stream(bytes(shared_memory.buf[:size])).read_all()
+    finally:
+        shared_memory.close()
+        shared_memory.unlink()
+
+    assert table.to_pandas().equals(nodes)
+
+
+def test_construct_dictionary_encodes_labels_and_types() -> None:
+    client = FakeArrowClient()
+    constructor = ArrowGraphConstructor("neo4j", "g", client, 2, None, chunk_size=10, dictionary_encode=True)
+
+    nodes = DataFrame({"nodeId": range(25), "labels": [["A"], ["A", "B"], ["B"], ["A"], ["B"]] * 5})
+    rels = DataFrame({"sourceNodeId": range(25), "targetNodeId": range(25), "relationshipType": ["REL"] * 25})
+    constructor.run([nodes], [rels])
+
+    node_batches = [batch for entity_type, batches in client.puts if entity_type == "node" for batch in batches]
+    rel_batches = [batch for entity_type, batches in client.puts if entity_type == "relationship" for batch in batches]
+
+    assert all(is_dictionary(batch.schema.field("labels").type.value_type) for batch in node_batches)
+    assert all(is_dictionary(batch.schema.field("relationshipType").type) for batch in rel_batches)
+    uploaded_labels = [label for batch in node_batches for label in batch.column("labels").to_pylist()]
+    assert uploaded_labels == nodes["labels"].tolist()
+    assert [t for batch in rel_batches for t in batch.column("relationshipType").to_pylist()] == ["REL"] * 25
+
+
+def test_construct_without_dictionary_encoding() -> None:
+    client = FakeArrowClient()
+    constructor = ArrowGraphConstructor("neo4j", "g", client, 2, None, chunk_size=10)
+
+    rels = DataFrame({"sourceNodeId": range(25), "targetNodeId": range(25), "relationshipType": ["REL"] * 25})
+    constructor.run([], [rels])
+
+    rel_batches = [batch for _, batches in client.puts for batch in batches]
+    assert not any(is_dictionary(batch.schema.field("relationshipType").type) for batch in rel_batches)
@@ -1,13 +1,48 @@
+from typing import Any, Dict, List, Optional
+
 import pytest
+from pandas import DataFrame
+from pyarrow import Table, concat_tables
 from pyarrow.flight import FlightUnavailableError
 
+from graphdatascience.call_parameters import CallParameters
 from graphdatascience.query_runner.arrow_info import ArrowInfo
 from graphdatascience.query_runner.arrow_query_runner import ArrowQueryRunner
+from graphdatascience.query_runner.gds_arrow_client import GdsArrowClient
+from graphdatascience.query_runner.graph_info_cache import GraphInfoCache
 from graphdatascience.server_version.server_version import ServerVersion
 
 from .conftest import CollectingQueryRunner
 
 
+class FakeArrowClient(GdsArrowClient):
+    def __init__(self, tables_by_entity: Dict[str, Table]) -> None:
+        self._tables_by_entity = tables_by_entity
+        self.configurations: List[Dict[str, Any]] = []
+        self.concurrency: Optional[int] = None
+
+    def get_property_table(
+        self, database: Optional[str], graph_name: str, procedure_name: str, configuration: Dict[str, Any]
+    ) -> Table:
+        self.configurations.append(configuration)
+        entities = configuration.get("node_labels", configuration.get("relationship_types"))
+        return concat_tables([self._tables_by_entity[entity] for entity in entities])
+
+    def get_property_table_partitioned(
+        self,
+        database: Optional[str],
+        graph_name: str,
+        procedure_name: str,
+        configurations: List[Dict[str, Any]],
+        concurrency: int,
+    ) -> Table:
+        self.concurrency = concurrency
+        return super().get_property_table_partitioned(database, graph_name, procedure_name, configurations, concurrency)
+
+    def close(self) -> None:
+        pass
+
+
 @pytest.mark.parametrize("server_version", [ServerVersion(2, 6, 0)])
 def test_create(runner: CollectingQueryRunner) -> None:
     arrow_info = ArrowInfo(listenAddress="localhost:1234", enabled=True, running=True, versions=[])
@@ -37,3 +72,155 @@ def test_create_with_provided_connection(runner: CollectingQueryRunner) -> None:
 
     with pytest.raises(FlightUnavailableError, match=".+ failed to connect .+ ipv4:127.0.0.1:4321: .+"):
         arrow_runner._gds_arrow_client.send_action("TEST", {})
+
+
+def graph_list_result(nodes: Dict[str, Any], relationships: Dict[str, Any]) -> DataFrame:
+    return DataFrame([{"database": "dummy", "schema": {"nodes": nodes, "relationships": relationships}}])
+
+
+@pytest.mark.parametrize("server_version", [ServerVersion(2, 6, 0)])
+def test_partitioned_node_property_stream(runner: CollectingQueryRunner) -> None:
+    runner.add__mock_result(
+        "gds.graph.list", graph_list_result({"A": {"x": "Float"}, "B": {"x": "Float"}, "C": {"y": "Float"}}, {})
+    )
+    client = FakeArrowClient(
+        {
+            "A": Table.from_pydict({"nodeId": [0, 1], "x": [1.0, 2.0]}),
+            "B": Table.from_pydict({"nodeId": [1, 2], "x": [2.0, 3.0]}),
+        }
+    )
+    arrow_runner = ArrowQueryRunner(client, runner, runner.server_version(), download_concurrency=4)
+
+    params = CallParameters(graph_name="g", properties=["x"], entities=["*"], config={})
+    result = arrow_runner.call_procedure("gds.graph.nodeProperties.stream", params)
+
+    # the label C does not have the property, so it is not streamed
+    assert [config["node_labels"] for config in client.configurations] == [["A"], ["B"]]
+    assert client.concurrency == 2
+    # node 1 has both labels but is only returned once
+    assert result.to_dict("records") == [{"nodeId": 0, "x": 1.0}, {"nodeId": 1, "x": 2.0}, {"nodeId": 2, "x": 3.0}]
+
+
+@pytest.mark.parametrize("server_version", [ServerVersion(2, 6, 0)])
+def test_partitioned_relationship_property_stream(runner: CollectingQueryRunner) -> None:
+    runner.add__mock_result("gds.graph.list", graph_list_result({}, {"R": {"w": "Float"}, "S": {"w": "Float"}}))
+    client = FakeArrowClient(
+        {
+            "R": Table.from_pydict({"sourceNodeId": [0], "targetNodeId": [1], "w": [1.0]}),
+            "S": Table.from_pydict({"sourceNodeId": [0], "targetNodeId": [1], "w": [2.0]}),
+        }
+    )
+    arrow_runner = ArrowQueryRunner(client, runner, runner.server_version(), download_concurrency=2)
+
+    params = CallParameters(graph_name="g", properties=["w"], entities=["R", "S"], config={})
+    result = arrow_runner.call_procedure("gds.graph.relationshipProperties.stream", params)
+
+    assert [config["relationship_types"] for config in client.configurations] == [["R"], ["S"]]
+    assert result["w"].tolist() == [1.0, 2.0]
+
+
+@pytest.mark.parametrize("server_version", [ServerVersion(2, 6, 0)])
+def test_property_stream_without_download_concurrency_is_not_partitioned(runner: CollectingQueryRunner) -> None:
+    client = FakeArrowClient({"A": Table.from_pydict({"nodeId": [0]}), "B": Table.from_pydict({"nodeId": [1]})})
+    arrow_runner = ArrowQueryRunner(client, runner, runner.server_version())
+
+    # the concurrency of the procedure is a server-side setting and does not affect the download
+    params = CallParameters(graph_name="g", properties=["x"], entities=["A", "B"], config={"concurrency": 4})
+    arrow_runner.call_procedure("gds.graph.nodeProperties.stream", params)
+
+    assert [config["node_labels"] for config in client.configurations] == [["A", "B"]]
+    assert client.concurrency is None
+    assert runner.queries == []
+
+
+@pytest.mark.parametrize("server_version", [ServerVersion(2, 6, 0)])
+def test_property_stream_with_properties_missing_on_a_label_is_not_partitioned(runner: CollectingQueryRunner) -> None:
+    runner.add__mock_result("gds.graph.list", graph_list_result({"A": {"x": "Float"}, "B": {"y": "Float"}}, {}))
+    client = FakeArrowClient({"A": Table.from_pydict({"nodeId": [0]}), "B": Table.from_pydict({"nodeId": [1]})})
+    arrow_runner = ArrowQueryRunner(client, runner, runner.server_version(), download_concurrency=4)
+
+    params = CallParameters(graph_name="g", properties=["x"], entities=["A", "B"], config={})
+    arrow_runner.call_procedure("gds.graph.nodeProperties.stream", params)
+
+    # the server decides how to handle the label without the property
+    assert [config["node_labels"] for config in client.configurations] == [["A", "B"]]
+    assert client.concurrency is None
+
+
+@pytest.mark.parametrize("server_version", [ServerVersion(2, 6, 0)])
+def test_partitioned_property_streams_share_graph_schema(server_version: ServerVersion) -> None:
+    class CachingQueryRunner(CollectingQueryRunner):
+        def __init__(self) -> None:
+            super().__init__(server_version)
+            self._graph_info_cache = GraphInfoCache()
+
+        def graph_info_cache(self) -> Optional[GraphInfoCache]:
+            return self._graph_info_cache
+
+    runner = CachingQueryRunner()
+    runner.add__mock_result("gds.graph.list", graph_list_result({"A": {"x": "Float"}, "B": {"x": "Float"}}, {}))
+    client = FakeArrowClient({"A": Table.from_pydict({"nodeId": [0]}), "B": Table.from_pydict({"nodeId": [1]})})
+    arrow_runner = ArrowQueryRunner(client, runner, runner.server_version(), download_concurrency=2)
+
+    params = CallParameters(graph_name="g", properties=["x"], entities=["*"], config={})
+    arrow_runner.call_procedure("gds.graph.nodeProperties.stream", params)
+    arrow_runner.call_procedure("gds.graph.nodeProperties.stream", params)
+
+    assert len([query for query in runner.queries if "gds.graph.list" in query]) == 1
+    assert len(client.configurations) == 4
+
+
+@pytest.mark.parametrize("server_version", [ServerVersion(2, 6, 0)])
+def test_algorithm_stream_via_mutate(runner: CollectingQueryRunner) -> None:
+    client = FakeArrowClient({"*": Table.from_pydict({"nodeId": [0, 1], "propertyValue": [0.5, 1.5]})})
+    arrow_runner = ArrowQueryRunner(client, runner, runner.server_version(), stream_via_mutate=True)
+
+    params = CallParameters(graph_name="g", config={"dampingFactor": 0.85})
+    result = arrow_runner.call_procedure("gds.pageRank.stream", params)
+
+    assert result.to_dict("records") == [{"nodeId": 0, "score": 0.5}, {"nodeId": 1, "score": 1.5}]
+    assert runner.queries == [
+        "CALL gds.pageRank.mutate($graph_name, $config)",
+        "CALL gds.graph.nodeProperties.drop($graph_name, $node_properties, $config)",
+    ]
+
+    property_name = runner.params[0]["config"]["mutateProperty"]
+    assert runner.params[0]["config"]["dampingFactor"] == 0.85
+    assert client.configurations == [{"node_property": property_name, "node_labels": ["*"]}]
+    assert runner.params[1]["node_properties"] == [property_name]
+
+
+@pytest.mark.parametrize("server_version", [ServerVersion(2, 6, 0)])
+def test_unsupported_algorithm_stream_uses_fallback(runner: CollectingQueryRunner) -> None:
+    client = FakeArrowClient({})
+    arrow_runner = ArrowQueryRunner(client, runner, runner.server_version(), stream_via_mutate=True)
+
+    arrow_runner.call_procedure("gds.louvain.stream", CallParameters(graph_name="g", config={}))
+
+    assert runner.queries == ["CALL gds.louvain.stream($graph_name, $config)"]
+    assert client.configurations == []
+
+
+class FailingStreamArrowClient(FakeArrowClient):
+    def get_property_table(
+        self, database: Optional[str], graph_name: str, procedure_name: str, configuration: Dict[str, Any]
+    ) -> Table:
+        self.configurations.append(configuration)
+        raise FlightUnavailableError("stream failed")
+
+
+@pytest.mark.parametrize("server_version", [ServerVersion(2, 6, 0)])
+@pytest.mark.parametrize(
+    "endpoint, drop_endpoint",
+    [("gds.pageRank.stream", "gds.graph.nodeProperties.drop"), ("gds.knn.stream", "gds.graph.relationships.drop")],
+)
+def test_stream_via_mutate_keeps_stream_error(runner: CollectingQueryRunner, endpoint: str, drop_endpoint: str) -> None:
+    runner.add__mock_result(drop_endpoint, RuntimeError("drop failed"))
+    client = FailingStreamArrowClient({})
+    arrow_runner = ArrowQueryRunner(client, runner, runner.server_version(), stream_via_mutate=True)
+
+    with pytest.warns(UserWarning, match="Failed to drop the temporary .+: drop failed"):
+        with pytest.raises(FlightUnavailableError, match="stream failed"):
+            arrow_runner.call_procedure(endpoint, CallParameters(graph_name="g", config={}))
+
+    assert runner.queries[-1].startswith(f"CALL {drop_endpoint}(")
@@ -0,0 +1,195 @@
+import asyncio
+from typing import Any, Dict, List, Optional
+
+from pandas import DataFrame
+from pyarrow import Table
+
+from graphdatascience.async_graph_data_science import AsyncGraphDataScience
+from graphdatascience.call_parameters import CallParameters
+from graphdatascience.query_runner.async_arrow_query_runner import AsyncArrowQueryRunner
+from graphdatascience.query_runner.async_query_runner import AsyncQueryRunner
+from graphdatascience.query_runner.gds_arrow_client import GdsArrowClient
+from graphdatascience.server_version.server_version import ServerVersion
+
+
+class CollectingAsyncQueryRunner(AsyncQueryRunner):
+    def __init__(self, server_version: ServerVersion, result: Optional[DataFrame] = None):
+        self._server_version = server_version
+        self._result = result if result is not None else DataFrame([{"nodeId": 0, "score": 1.0}])
+        self._database: Optional[str] = "neo4j"
+        self.queries: List[str] = []
+        self.params: List[Dict[str, Any]] = []
+        self.closed = False
+
+    async def call_procedure(
+        self,
+        endpoint: str,
+        params: Optional[CallParameters] = None,
+        yields: Optional[List[str]] = None,
+        database: Optional[str] = None,
+        custom_error: bool = True,
+    ) -> DataFrame:
+        if params is None:
+            params = CallParameters()
+        yields_clause = "" if yields is None else " YIELD " + ", ".join(yields)
+
+        return await self.run_cypher(f"CALL {endpoint}({params.placeholder_str()}){yields_clause}", params)
+
+    async def call_function(self, endpoint: str, params: Optional[CallParameters] = None) -> Any:
+        if params is None:
+            params = CallParameters()
+
+        return (await self.run_cypher(f"RETURN {endpoint}({params.placeholder_str()})", params)).squeeze()
+
+    async def run_cypher(
+        self,
+        query: str,
+        params: Optional[Dict[str, Any]] = None,
+        database: Optional[str] = None,
+        custom_error: bool = True,
+    ) -> DataFrame:
+        self.queries.append(query)
+        self.params.append(dict(params or {}))
+        # Yield to the event loop like a real network call would
+        await asyncio.sleep(0)
+
+        return self._result
+
+    async def server_version(self) -> ServerVersion:
+        return self._server_version
+
+    def set_database(self, database: str) -> None:
+        self._database = database
+
+    def database(self) -> Optional[str]:
+        return self._database
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+class FakeArrowClient(GdsArrowClient):
+    def __init__(self, table: Table) -> None:
+        self._table = table
+        self.configurations: List[Dict[str, Any]] = []
+
+    def get_property_table(
+        self, database: Optional[str], graph_name: str, procedure_name: str, configuration: Dict[str, Any]
+    ) -> Table:
+        self.configurations.append(configuration)
+        return self._table
+
+    def close(self) -> None:
+        pass
+
+
+def test_algorithm_call() -> None:
+    runner = CollectingAsyncQueryRunner(ServerVersion(2, 6, 0))
+    gds = AsyncGraphDataScience(runner, ServerVersion(2, 6, 0))
+
+    result = asyncio.run(gds.pageRank.stream("g", dampingFactor=0.85))
+
+    assert runner.queries == ["CALL gds.pageRank.stream($graph_name, $config)"]
+    assert runner.params == [{"graph_name": "g", "config": {"dampingFactor": 0.85}}]
+    assert isinstance(result, DataFrame)
+
+
+def test_single_row_modes_return_series() -> None:
+    runner = CollectingAsyncQueryRunner(ServerVersion(2, 6, 0), DataFrame([{"nodePropertiesWritten": 3}]))
+    gds = AsyncGraphDataScience(runner, ServerVersion(2, 6, 0))
+
+    result = asyncio.run(gds.wcc.mutate("g", mutateProperty="component"))
+
+    assert result["nodePropertiesWritten"] == 3
+
+
+def test_call_without_config() -> None:
+    runner = CollectingAsyncQueryRunner(ServerVersion(2, 6, 0))
+    gds = AsyncGraphDataScience(runner, ServerVersion(2, 6, 0))
+
+    asyncio.run(gds.graph.drop("g", True))
+
+    assert runner.queries == ["CALL gds.graph.drop($graph_name, $fail_if_missing, $db_name)"]
+    assert runner.params == [{"graph_name": "g", "fail_if_missing": True, "db_name": ""}]
+
+
+def test_catalog_call_defaults() -> None:
+    runner = CollectingAsyncQueryRunner(ServerVersion(2, 6, 0))
+    gds = AsyncGraphDataScience(runner, ServerVersion(2, 6, 0))
+
+    asyncio.run(gds.graph.nodeProperties.stream("g", ["x"], listNodeLabels=True))
+
+    assert runner.queries == ["CALL gds.graph.nodeProperties.stream($graph_name, $properties, $entities, $config)"]
+    assert runner.params == [
+        {"graph_name": "g", "properties": ["x"], "entities": ["*"], "config": {"listNodeLabels": True}}
+    ]
+
+
+def test_concurrent_calls() -> None:
+    runner = CollectingAsyncQueryRunner(ServerVersion(2, 6, 0))
+    gds = AsyncGraphDataScience(runner, ServerVersion(2, 6, 0))
+
+    async def run_all() -> List[Any]:
+        return await asyncio.gather(*[gds.wcc.stream(f"g{i}") for i in range(10)])
+
+    results = asyncio.run(run_all())
+
+    assert len(results) == 10
+    assert sorted(params["graph_name"] for params in runner.params) == sorted(f"g{i}" for i in range(10))
+
+
+def test_property_stream_via_arrow() -> None:
+    runner = CollectingAsyncQueryRunner(ServerVersion(2, 6, 0))
+    arrow_client = FakeArrowClient(Table.from_pydict({"nodeId": [0, 1], "propertyValue": [0.5, 1.5]}))
+    gds = AsyncGraphDataScience(
+        AsyncArrowQueryRunner(arrow_client, runner, ServerVersion(2, 6, 0)), ServerVersion(2, 6, 0)
+    )
+
+    result = asyncio.run(gds.graph.nodeProperty.stream("g", "score", ["A"]))
+
+    assert runner.queries == []
+    assert arrow_client.configurations == [{"node_property": "score", "node_labels": ["A"]}]
+    assert list(result["propertyValue"]) == [0.5, 1.5]
+
+
+def test_run_cypher_bypasses_arrow() -> None:
+    runner = CollectingAsyncQueryRunner(ServerVersion(2, 6, 0))
+    arrow_client = FakeArrowClient(Table.from_pydict({}))
+    gds = AsyncGraphDataScience(
+        AsyncArrowQueryRunner(arrow_client, runner, ServerVersion(2, 6, 0)), ServerVersion(2, 6, 0)
+    )
+
+    asyncio.run(gds.run_cypher("MATCH (n) RETURN n"))
+    asyncio.run(gds.close())
+
+    assert runner.queries == ["MATCH (n) RETURN n"]
+    assert runner.closed
+
+
+def test_property_stream_via_arrow_defaults() -> None:
+    runner = CollectingAsyncQueryRunner(ServerVersion(2, 6, 0))
+    arrow_client = FakeArrowClient(Table.from_pydict({"nodeId": [0, 1], "x": [0.5, 1.5]}))
+    gds = AsyncGraphDataScience(
+        AsyncArrowQueryRunner(arrow_client, runner, ServerVersion(2, 6, 0)), ServerVersion(2, 6, 0)
+    )
+
+    asyncio.run(gds.graph.nodeProperties.stream("g", ["x"]))
+
+    assert runner.queries == []
+    assert arrow_client.configurations == [{"node_properties": ["x"], "node_labels": ["*"]}]
+
+
+def test_relationships_stream_via_arrow() -> None:
+    runner = CollectingAsyncQueryRunner(ServerVersion(2, 6, 0))
+    arrow_client = FakeArrowClient(
+        Table.from_pydict({"sourceNodeId": [0], "targetNodeId": [1], "relationshipType": ["R"]})
+    )
+    gds = AsyncGraphDataScience(
+        AsyncArrowQueryRunner(arrow_client, runner, ServerVersion(2, 6, 0)), ServerVersion(2, 6, 0)
+    )
+
+    asyncio.run(gds.graph.relationships.stream("g", ["R"]))
+    asyncio.run(gds.graph.relationships.stream("g"))
+
+    assert runner.queries == []
+    assert arrow_client.configurations == [{"relationship_types": ["R"]}, {"relationship_types": ["*"]}]
@@ -320,6 +320,7 @@ def test_create_attached_session(mocker: MockerFixture, aura_api: AuraApi) -> No
             uri="neo4j+s://foo.bar", username="neo4j", password=HASHED_DB_PASSWORD
         ),
         "session_id": "ffff0-ffff1",
+        "arrow_compression": None,
     }
 
     assert len(sessions.list()) == 1
@@ -352,6 +353,7 @@ def test_create_standalone_session(mocker: MockerFixture, aura_api: AuraApi) ->
             uri="neo4j+s://foo.bar", username="neo4j", password=HASHED_DB_PASSWORD
         ),
         "session_id": "None-ffff0",
+        "arrow_compression": None,
     }
 
     assert len(sessions.list()) == 1
@@ -389,12 +391,31 @@ def test_get_or_create(mocker: MockerFixture, aura_api: AuraApi) -> None:
             uri="neo4j+s://foo.bar", username="neo4j", password=HASHED_DB_PASSWORD
         ),
         "session_id": "ffff0-ffff1",
+        "arrow_compression": None,
     }
     assert gds_args1 == gds_args2
 
     assert [i.name for i in sessions.list()] == ["my-session"]
 
 
+def test_get_or_create_with_arrow_compression(mocker: MockerFixture, aura_api: AuraApi) -> None:
+    _setup_db_instance(aura_api)
+
+    sessions = DedicatedSessions(aura_api)
+
+    patch_construct_client(mocker)
+    patch_validate_db_connection(mocker)
+
+    gds_args = sessions.get_or_create(
+        "my-session",
+        SessionMemory.m_8GB,
+        DbmsConnectionInfo("neo4j+s://ffff0.databases.neo4j.io", "dbuser", "db_pw"),
+        arrow_compression="lz4",
+    )
+
+    assert gds_args["arrow_compression"] == "lz4"  # type: ignore
+
+
 def test_get_or_create_expired_session(mocker: MockerFixture, aura_api: AuraApi) -> None:
     db = _setup_db_instance(aura_api)
 
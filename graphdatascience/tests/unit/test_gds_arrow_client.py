@@ -1,9 +1,50 @@
 import re
+import time
+from typing import Any, List, Tuple
 
 import pytest
-from pyarrow import flight
+from pandas import DataFrame
+from pyarrow import RecordBatch, Schema, flight
 
 from graphdatascience.query_runner.gds_arrow_client import AuthMiddleware, GdsArrowClient
+from graphdatascience.server_version.server_version import ServerVersion
+
+
+class FakeChunk:
+    def __init__(self, data: RecordBatch) -> None:
+        self.data = data
+
+
+class FakeStreamReader:
+    def __init__(self, batches: List[RecordBatch]) -> None:
+        self._batches = batches
+        self.cancelled = False
+
+    def read_chunk(self) -> FakeChunk:
+        if not self._batches:
+            raise StopIteration
+        return FakeChunk(self._batches.pop(0))
+
+    def cancel(self) -> None:
+        self.cancelled = True
+
+
+class FakeFlightClient:
+    def __init__(self, reader: FakeStreamReader) -> None:
+        self._reader = reader
+        self.tickets: List[Any] = []
+        self.put_options: List[Any] = []
+
+    def do_get(self, ticket: Any) -> FakeStreamReader:
+        self.tickets.append(ticket)
+        return self._reader
+
+    def do_put(self, descriptor: Any, schema: Schema, options: Any = None) -> Tuple[Any, Any]:
+        self.put_options.append(options)
+        return None, None
+
+    def close(self) -> None:
+        pass
 
 
 def test_auth_middleware() -> None:
@@ -52,3 +93,161 @@ def test_handle_flight_error():
                 "FlightServerError: Flight returned internal error, with message: org.apache.arrow.flight.FlightRuntimeException: UNKNOWN: Unexpected configuration key(s): [undirectedRelationshipTypes]"
             )
         )
+
+
+def test_get_property_batches() -> None:
+    reader = FakeStreamReader(
+        [
+            RecordBatch.from_pydict({"nodeId": [0, 1], "labels": [["A"], ["B"]]}),
+            RecordBatch.from_pydict({"nodeId": [2], "labels": [["A"]]}),
+        ]
+    )
+    client = GdsArrowClient("localhost", 1234, ServerVersion(2, 6, 0))
+    client._flight_client = FakeFlightClient(reader)
+
+    batches = list(client.get_property_batches("neo4j", "g", "gds.graph.nodeLabels.stream", {"list_node_labels": True}))
+
+    assert [batch["nodeId"].tolist() for batch in batches] == [[0, 1], [2]]
+    assert all(batch.columns.tolist() == ["nodeId", "nodeLabels"] for batch in batches)
+    assert not reader.cancelled
+
+
+def test_get_property_batches_cancels_unconsumed_stream() -> None:
+    reader = FakeStreamReader([RecordBatch.from_pydict({"nodeId": [0, 1]}), RecordBatch.from_pydict({"nodeId": [2]})])
+    client = GdsArrowClient("localhost", 1234, ServerVersion(2, 6, 0))
+    client._flight_client = FakeFlightClient(reader)
+
+    batches = client.get_property_batches("neo4j", "g", "gds.graph.nodeProperty.stream", {})
+    assert next(batches)["nodeId"].tolist() == [0, 1]
+    batches.close()
+
+    assert reader.cancelled
+
+
+def test_get_property_batches_requires_database() -> None:
+    client = GdsArrowClient("localhost", 1234, ServerVersion(2, 6, 0))
+
+    with pytest.raises(ValueError, match="explicitly specified a valid Neo4j database"):
+        next(client.get_property_batches(None, "g", "gds.graph.nodeProperty.stream", {}))
+
+
+@pytest.mark.parametrize("compression", ["lz4", "zstd"])
+def test_start_put_with_compression(compression: str) -> None:
+    client = GdsArrowClient("localhost", 1234, ServerVersion(2, 6, 0), compression=compression)
+    fake_client = FakeFlightClient(FakeStreamReader([]))
+    client._flight_client = fake_client
+
+    client.start_put({"name": "g", "entity_type": "node"}, Schema.from_pandas(DataFrame({"nodeId": [0]})))
+
+    assert isinstance(fake_client.put_options[0], flight.FlightCallOptions)
+
+
+def test_start_put_without_compression() -> None:
+    client = GdsArrowClient("localhost", 1234, ServerVersion(2, 6, 0))
+    fake_client = FakeFlightClient(FakeStreamReader([]))
+    client._flight_client = fake_client
+
+    client.start_put({"name": "g", "entity_type": "node"}, Schema.from_pandas(DataFrame({"nodeId": [0]})))
+
+    assert fake_client.put_options == [None]
+
+
+def test_unsupported_compression() -> None:
+    with pytest.raises(ValueError, match="Unsupported compression 'gzip'"):
+        GdsArrowClient("localhost", 1234, ServerVersion(2, 6, 0), compression="gzip")
+
+
+def test_clients_share_pooled_connection() -> None:
+    client = GdsArrowClient("localhost", 1234, ServerVersion(2, 6, 0), auth=("user", "password"))
+    same_client = GdsArrowClient("localhost", 1234, ServerVersion(2, 6, 0), auth=("user", "password"))
+    other_client = GdsArrowClient("localhost", 1234, ServerVersion(2, 6, 0), auth=("other", "password"))
+
+    assert client._flight_client is same_client._flight_client
+    assert client._auth_middleware is same_client._auth_middleware
+    assert client._flight_client is not other_client._flight_client
+
+    client.close()
+    # closing twice must not release the connection of the other client
+    client.close()
+
+    reconnected_client = GdsArrowClient("localhost", 1234, ServerVersion(2, 6, 0), auth=("user", "password"))
+    assert reconnected_client._flight_client is same_client._flight_client
+
+    for c in [same_client, other_client, reconnected_client]:
+        c.close()
+
+
+class CountingAuthFlightClient:
+    def __init__(self, middleware: AuthMiddleware) -> None:
+        self._middleware = middleware
+        self.authentications = 0
+
+    def authenticate_basic_token(self, username: str, password: str) -> None:
+        self.authentications += 1
+        self._middleware.received_headers({"authorization": [f"Bearer token-{self.authentications}"]})
+
+    def close(self) -> None:
+        pass
+
+
+def test_request_token_reuses_cached_token() -> None:
+    client = GdsArrowClient("localhost", 1234, ServerVersion(2, 6, 0), auth=("user", "password"))
+    fake_client = CountingAuthFlightClient(client._auth_middleware)
+    client._flight_client = fake_client
+
+    assert client.request_token() == "token-1"
+    assert client.request_token() == "token-1"
+    assert fake_client.authentications == 1
+
+    client.close()
+
+
+def test_request_token_reauthenticates_close_to_expiry() -> None:
+    client = GdsArrowClient("localhost", 4321, ServerVersion(2, 6, 0), auth=("user", "password"))
+    middleware = client._auth_middleware
+    fake_client = CountingAuthFlightClient(middleware)
+    client._flight_client = fake_client
+
+    middleware._set_token("old-token")
+    middleware._token_timestamp -= AuthMiddleware.TOKEN_LIFETIME - AuthMiddleware.REFRESH_MARGIN + 1
+
+    # the token is about to expire, so a new one is requested before returning
+    assert client.request_token() == "token-1"
+    assert fake_client.authentications == 1
+
+    middleware._token_timestamp -= AuthMiddleware.TOKEN_LIFETIME + 1
+
+    # the token has expired, so a new one is requested before returning
+    assert client.request_token() == "token-2"
+
+    client.close()
+
+
+def test_auth_middleware_refreshes_token_before_expiry() -> None:
+    middleware = AuthMiddleware(("user", "password"))
+    middleware.TOKEN_LIFETIME = 1
+    middleware.REFRESH_MARGIN = 0.9  # type: ignore
+    refreshes: List[str] = []
+
+    def refresh() -> None:
+        refreshes.append("refresh")
+        middleware.received_headers({"authorization": [f"Bearer token-{len(refreshes)}"]})
+
+    middleware.set_refresh_callback(refresh)
+    middleware.received_headers({"authorization": ["Bearer token-0"]})
+
+    # the refreshed token schedules the next refresh, without any call being made
+    for _ in range(100):
+        if len(refreshes) >= 2:
+            break
+        time.sleep(0.01)
+
+    assert len(refreshes) >= 2
+    assert middleware.token() == f"token-{len(refreshes)}"
+
+    middleware.close()
+    refresh_count = len(refreshes)
+    time.sleep(0.3)
+
+    assert len(refreshes) in [refresh_count, refresh_count + 1]
+    assert middleware._refresh_timer is not None and not middleware._refresh_timer.is_alive()
@@ -1,5 +1,8 @@
+from pathlib import Path
+
 import pytest
 from pandas import DataFrame
+from pyarrow import Table
 
 from graphdatascience.graph_data_science import GraphDataScience
 from graphdatascience.server_version.server_version import ServerVersion
@@ -28,11 +31,14 @@ def test_graph_project_based_construct_without_arrow(runner: CollectingQueryRunn
     runner.add__mock_result("gds.debug.sysInfo", DataFrame([{"gdsEdition": "Unlicensed"}]))
     gds.graph.construct("hello", nodes, relationships, concurrency=2)
 
-    expected_node_query = "UNWIND $nodes as node RETURN node[0] as id, node[1] as labels, node[2] as propA"
+    expected_node_query = (
+        "UNWIND range(0, size($nodes[0]) - 1) AS i "
+        "RETURN $nodes[0][i] as id, $nodes[1][i] as labels, $nodes[2][i] as propA"
+    )
     expected_relationship_query = (
-        "UNWIND $relationships as relationship RETURN "
-        "relationship[0] as source, relationship[1] as target, "
-        "relationship[2] as type, relationship[3] as relPropA"
+        "UNWIND range(0, size($relationships[0]) - 1) AS i RETURN "
+        "$relationships[0][i] as source, $relationships[1][i] as target, "
+        "$relationships[2][i] as type, $relationships[3][i] as relPropA"
     )
     expected_proc_query = (
         "CALL gds.graph.project.cypher("
@@ -44,8 +50,8 @@ def test_graph_project_based_construct_without_arrow(runner: CollectingQueryRunn
 
     assert runner.last_query() == expected_proc_query
     assert runner.last_params() == {
-        "nodes": nodes.values.tolist(),
-        "relationships": relationships.values.tolist(),
+        "nodes": [nodes[column].tolist() for column in nodes.columns],
+        "relationships": [relationships[column].tolist() for column in relationships.columns],
         "read_concurrency": 2,
         "graph_name": "hello",
         "node_query": expected_node_query,
@@ -93,15 +99,15 @@ def test_multi_df(
     gds.graph.construct("hello", nodes, relationships)
 
     expected_proc_query = (
-        "UNWIND $data AS data"
-        " WITH data,"
-        " CASE WHEN data[6] THEN data[5] ELSE null END AS sourceNodeLabels,"
-        " CASE WHEN data[3] THEN data[2] ELSE null END AS relationshipType,"
-        " CASE WHEN data[10] THEN data[9] ELSE null END AS targetNodeId,"
-        " CASE WHEN data[8] THEN data[7] ELSE null END AS sourceNodeProperties,"
-        f" CASE WHEN data[1] THEN data[0] ELSE null END AS {properties_key}"
+        "UNWIND range(0, size($data[0]) - 1) AS i"
+        " WITH i,"
+        " CASE WHEN $data[6][i] THEN $data[5][i] ELSE null END AS sourceNodeLabels,"
+        " CASE WHEN $data[3][i] THEN $data[2][i] ELSE null END AS relationshipType,"
+        " CASE WHEN $data[10][i] THEN $data[9][i] ELSE null END AS targetNodeId,"
+        " CASE WHEN $data[8][i] THEN $data[7][i] ELSE null END AS sourceNodeProperties,"
+        f" CASE WHEN $data[1][i] THEN $data[0][i] ELSE null END AS {properties_key}"
         f" RETURN gds{tier}.graph.project("
-        "$graph_name, data[4], targetNodeId, {"
+        "$graph_name, $data[4][i], targetNodeId, {"
         f"sourceNodeLabels: sourceNodeLabels{target_node_labels}, "
         f"sourceNodeProperties: sourceNodeProperties{target_node_properties}"
         f"{in_between_configs}"
@@ -113,7 +119,7 @@ def test_multi_df(
 
     actual_params = runner.last_params()
 
-    expected_df = [
+    expected_rows = [
         [None, False, None, False, 0, "a", True, {"property": 6.0}, True, -1, False],
         [None, False, None, False, 1, "a", True, {"property": 7.0}, True, -1, False],
         [None, False, None, False, 2, "b", True, {"q": -500}, True, -1, False],
@@ -127,7 +133,7 @@ def test_multi_df(
     assert actual_params == {
         "configuration": {"readConcurrency": 4, "undirectedRelationshipTypes": None},
         "graph_name": "hello",
-        "data": expected_df,
+        "data": [list(column) for column in zip(*expected_rows)],
     }
 
 
@@ -178,15 +184,15 @@ def test_graph_aggregation_based_construct_without_arrow(
     gds.graph.construct("hello", nodes, relationships, concurrency=2, undirected_relationship_types=["REL"])
 
     expected_proc_query = (
-        "UNWIND $data AS data"
-        " WITH data,"
-        " CASE WHEN data[6] THEN data[5] ELSE null END AS sourceNodeLabels,"
-        " CASE WHEN data[3] THEN data[2] ELSE null END AS relationshipType,"
-        " CASE WHEN data[10] THEN data[9] ELSE null END AS targetNodeId,"
-        " CASE WHEN data[8] THEN data[7] ELSE null END AS sourceNodeProperties,"
-        f" CASE WHEN data[1] THEN data[0] ELSE null END AS {properties_key}"
+        "UNWIND range(0, size($data[0]) - 1) AS i"
+        " WITH i,"
+        " CASE WHEN $data[6][i] THEN $data[5][i] ELSE null END AS sourceNodeLabels,"
+        " CASE WHEN $data[3][i] THEN $data[2][i] ELSE null END AS relationshipType,"
+        " CASE WHEN $data[10][i] THEN $data[9][i] ELSE null END AS targetNodeId,"
+        " CASE WHEN $data[8][i] THEN $data[7][i] ELSE null END AS sourceNodeProperties,"
+        f" CASE WHEN $data[1][i] THEN $data[0][i] ELSE null END AS {properties_key}"
         f" RETURN gds{tier}.graph.project("
-        "$graph_name, data[4], targetNodeId, {"
+        "$graph_name, $data[4][i], targetNodeId, {"
         f"sourceNodeLabels: sourceNodeLabels{target_node_labels}, "
         f"sourceNodeProperties: sourceNodeProperties{target_node_properties}"
         f"{in_between_configs}"
@@ -199,7 +205,7 @@ def test_graph_aggregation_based_construct_without_arrow(
 
     actual_params = runner.last_params()
 
-    expected_df = [
+    expected_rows = [
         [None, False, None, False, 0, ["A"], True, {"pF": 1337.0, "pI": 1337, "pList": [4, 5, 6, 7]}, True, -1, False],
         [None, False, None, False, 1, ["B"], True, {"pF": 42.42, "pI": 42, "pList": [1, 2, 3]}, True, -1, False],
         [{"relPropA": 1337.2}, True, "REL", True, 0, None, False, None, False, 1, True],
@@ -209,7 +215,7 @@ def test_graph_aggregation_based_construct_without_arrow(
     assert actual_params == {
         "configuration": {"readConcurrency": 2, "undirectedRelationshipTypes": ["REL"]},
         "graph_name": "hello",
-        "data": expected_df,
+        "data": [list(column) for column in zip(*expected_rows)],
     }
 
 
@@ -292,3 +298,71 @@ def test_nodes_graph(gds: GraphDataScience, runner: CollectingQueryRunner) -> No
     other_query = runner.last_query()
 
     assert query == other_query
+
+
+@pytest.mark.parametrize("server_version", [ServerVersion(2, 1, 0)])
+def test_graph_construct_from_arrow_table_without_arrow(runner: CollectingQueryRunner, gds: GraphDataScience) -> None:
+    nodes = DataFrame({"nodeId": [0, 1], "propA": [1337, 42]})
+    relationships = DataFrame({"sourceNodeId": [0, 1], "targetNodeId": [1, 0]})
+
+    runner.add__mock_result("gds.graph.exists", DataFrame([{"exists": False}]))
+    runner.add__mock_result("gds.debug.sysInfo", DataFrame([{"gdsEdition": "Unlicensed"}]))
+    gds.graph.construct("hello", Table.from_pandas(nodes), Table.from_pandas(relationships), concurrency=2)
+
+    assert runner.last_params()["nodes"] == [nodes[column].tolist() for column in nodes.columns]
+    assert runner.last_params()["relationships"] == [
+        relationships[column].tolist() for column in relationships.columns
+    ]
+
+
+@pytest.mark.parametrize("server_version", [ServerVersion(2, 1, 0)])
+def test_graph_construct_upload_options(runner: CollectingQueryRunner, gds: GraphDataScience) -> None:
+    nodes = DataFrame({"nodeId": [0, 1]})
+
+    runner.add__mock_result("gds.graph.exists", DataFrame([{"exists": False}]))
+    runner.add__mock_result("gds.debug.sysInfo", DataFrame([{"gdsEdition": "Unlicensed"}]))
+    G = gds.graph.construct("hello", nodes)
+    gds.graph.construct(
+        "hello", nodes, conversion_processes=4, target_batch_bytes=1_000, max_retries=5, retry_backoff_seconds=0.5
+    )
+
+    assert runner.upload_options == [
+        {"target_batch_bytes": 8_000_000, "max_retries": 3, "retry_backoff_seconds": 1.0},
+        {"target_batch_bytes": 1_000, "max_retries": 5, "retry_backoff_seconds": 0.5, "conversion_processes": 4},
+    ]
+    # the Cypher construction does not tune its upload
+    assert G.upload_settings() is None
+
+
+@pytest.mark.parametrize("server_version", [ServerVersion(2, 1, 0)])
+def test_graph_construct_validate_arrow_table_columns(runner: CollectingQueryRunner, gds: GraphDataScience) -> None:
+    nodes = Table.from_pydict({"nodeIds": [0, 1]})
+
+    runner.add__mock_result("gds.graph.exists", DataFrame([{"exists": False}]))
+
+    with pytest.raises(ValueError, match="Node dataframe at index 0 needs to contain a 'nodeId' column."):
+        gds.graph.construct("hello", nodes, concurrency=2)
+
+
+@pytest.mark.parametrize("server_version", [ServerVersion(2, 1, 0)])
+def test_graph_construct_from_files(runner: CollectingQueryRunner, gds: GraphDataScience, tmp_path: Path) -> None:
+    nodes = DataFrame({"nodeId": [0, 1], "propA": [1337, 42]})
+    relationships = DataFrame({"sourceNodeId": [0, 1], "targetNodeId": [1, 0]})
+    nodes.to_parquet(tmp_path / "nodes.parquet", index=False)
+    relationships.to_csv(tmp_path / "rels.csv", index=False)
+
+    runner.add__mock_result("gds.graph.exists", DataFrame([{"exists": False}]))
+    runner.add__mock_result("gds.debug.sysInfo", DataFrame([{"gdsEdition": "Unlicensed"}]))
+    gds.graph.construct_from_files(
+        "hello", str(tmp_path / "nodes.parquet"), [str(tmp_path / "rels.csv")], concurrency=2
+    )
+
+    assert runner.last_params()["nodes"] == [nodes[column].tolist() for column in nodes.columns]
+    assert runner.last_params()["relationships"] == [
+        relationships[column].tolist() for column in relationships.columns
+    ]
+
+
+def test_graph_construct_from_files_unsupported_format(gds: GraphDataScience) -> None:
+    with pytest.raises(ValueError, match="Unsupported file format 'json'"):
+        gds.graph.construct_from_files("hello", "nodes.json", file_format="json")
@@ -0,0 +1,138 @@
+from typing import List, Optional
+
+from pandas import DataFrame
+
+from graphdatascience.call_parameters import CallParameters
+from graphdatascience.graph.graph_object import Graph
+from graphdatascience.query_runner.graph_info_cache import GraphInfoCache
+
+from .conftest import DEFAULT_SERVER_VERSION, CollectingQueryRunner
+
+
+class CachingQueryRunner(CollectingQueryRunner):
+    def __init__(self, ttl_seconds: float = GraphInfoCache.DEFAULT_TTL_SECONDS) -> None:
+        super().__init__(DEFAULT_SERVER_VERSION)
+        self._graph_info_cache = GraphInfoCache(ttl_seconds)
+
+    def call_procedure(
+        self,
+        endpoint: str,
+        params: Optional[CallParameters] = None,
+        yields: Optional[List[str]] = None,
+        database: Optional[str] = None,
+        logging: bool = False,
+        custom_error: bool = True,
+    ) -> DataFrame:
+        try:
+            return super().call_procedure(endpoint, params, yields, database, logging, custom_error)
+        finally:
+            self._graph_info_cache.invalidate_after_call(endpoint, params)
+
+    def graph_info_cache(self) -> Optional[GraphInfoCache]:
+        return self._graph_info_cache
+
+    def graph_list_queries(self) -> List[str]:
+        return [query for query in self.queries if "gds.graph.list" in query]
+
+
+GRAPH_INFO = DataFrame(
+    [
+        {
+            "graphName": "g",
+            "database": "dummy",
+            "configuration": {},
+            "nodeCount": 10,
+            "relationshipCount": 20,
+            "schema": {"nodes": {"A": {}}, "relationships": {"R": {}}},
+            "density": 0.2,
+            "memoryUsage": "1 KiB",
+            "sizeInBytes": 1024,
+            "creationTime": None,
+            "modificationTime": None,
+        }
+    ]
+)
+
+
+def test_graph_info_is_fetched_once() -> None:
+    runner = CachingQueryRunner()
+    runner.add__mock_result("gds.graph.list", GRAPH_INFO)
+    G = Graph("g", runner)
+
+    assert G.node_count() == 10
+    assert G.relationship_count() == 20
+    assert G.node_labels() == ["A"]
+    assert G.density() == 0.2
+    assert G.memory_usage() == "1 KiB"
+
+    assert len(runner.graph_list_queries()) == 1
+    assert "degreeDistribution" not in runner.graph_list_queries()[0]
+
+
+def test_graph_info_is_invalidated_by_mutate() -> None:
+    runner = CachingQueryRunner()
+    runner.add__mock_result("gds.graph.list", GRAPH_INFO)
+    G = Graph("g", runner)
+
+    G.node_count()
+    runner.call_procedure("gds.wcc.stream", CallParameters(graph_name="g", config={}))
+    G.node_count()
+    assert len(runner.graph_list_queries()) == 1
+
+    runner.call_procedure("gds.wcc.mutate", CallParameters(graph_name="g", config={}))
+    G.node_count()
+    assert len(runner.graph_list_queries()) == 2
+
+
+def test_graph_info_is_copied() -> None:
+    runner = CachingQueryRunner()
+    runner.add__mock_result("gds.graph.list", GRAPH_INFO)
+    G = Graph("g", runner)
+
+    G._graph_info(["schema"])["nodes"]["B"] = {}
+
+    assert G.node_labels() == ["A"]
+    assert len(runner.graph_list_queries()) == 1
+
+
+def test_graph_info_is_invalidated_by_cypher() -> None:
+    cache = GraphInfoCache()
+    cache.put("dummy", "g", GRAPH_INFO.squeeze())
+
+    cache.invalidate_after_query("MATCH (n) RETURN count(n)")
+    assert cache.get("dummy", "g") is not None
+
+    cache.invalidate_after_query("MATCH (n) WITH gds.graph.project('g', n, null) AS g RETURN g")
+    assert cache.get("dummy", "g") is None
+
+
+def test_graph_info_expires() -> None:
+    runner = CachingQueryRunner(ttl_seconds=0)
+    runner.add__mock_result("gds.graph.list", GRAPH_INFO)
+    G = Graph("g", runner)
+
+    G.node_count()
+    G.node_count()
+
+    assert len(runner.graph_list_queries()) == 2
+
+
+def test_graph_refresh() -> None:
+    runner = CachingQueryRunner()
+    runner.add__mock_result("gds.graph.list", GRAPH_INFO)
+    G = Graph("g", runner)
+
+    G.node_count()
+    G.refresh()
+    G.node_count()
+
+    assert len(runner.graph_list_queries()) == 2
+
+
+def test_degree_distribution_is_not_cached() -> None:
+    runner = CachingQueryRunner()
+    runner.add__mock_result("gds.graph.list", DataFrame([{"degreeDistribution": {"mean": 2.0}, "database": "dummy"}]))
+    G = Graph("g", runner)
+
+    assert G.degree_distribution()["mean"] == 2.0
+    assert runner.last_query() == "CALL gds.graph.list($graph_name) YIELD degreeDistribution, database"
@@ -125,6 +125,16 @@ def test_graph_list(runner: CollectingQueryRunner, gds: GraphDataScience) -> Non
     assert runner.last_params() == {"graph_name": G.name()}
 
 
+def test_graph_list_lightweight(runner: CollectingQueryRunner, gds: GraphDataScience) -> None:
+    gds.graph.list(lightweight=True)
+
+    assert runner.last_query() == (
+        "CALL gds.graph.list() YIELD graphName, database, configuration, nodeCount, relationshipCount, schema, "
+        "density, memoryUsage, sizeInBytes, creationTime, modificationTime"
+    )
+    assert runner.last_params() == {}
+
+
 def test_graph_exists(runner: CollectingQueryRunner, gds: GraphDataScience) -> None:
     gds.graph.exists("g")
 
@@ -257,6 +267,122 @@ def test_graph_nodeProperties_stream(runner: CollectingQueryRunner, gds: GraphDa
     }
 
 
+@pytest.mark.parametrize("server_version", [ServerVersion(2, 2, 0)])
+def test_graph_nodeProperties_stream_as_iterator(runner: CollectingQueryRunner, gds: GraphDataScience) -> None:
+    G, _ = gds.graph.project("g", "*", "*")
+
+    runner.set__mock_result(DataFrame([{"nodeId": 0, "dummyProp": 2}]))
+
+    batches = list(gds.graph.nodeProperties.stream(G, ["dummyProp"], separate_property_columns=True, as_iterator=True))
+    assert runner.last_query() == "CALL gds.graph.nodeProperties.stream($graph_name, $properties, $entities, $config)"
+    assert runner.last_params() == {
+        "graph_name": "g",
+        "properties": ["dummyProp"],
+        "entities": ["*"],
+        "config": {},
+    }
+
+    assert len(batches) == 1
+    assert batches[0].to_dict("records") == [{"nodeId": 0, "dummyProp": 2}]
+
+
+@pytest.mark.parametrize("server_version", [ServerVersion(2, 2, 0)])
+def test_graph_nodeProperties_stream_output_formats(runner: CollectingQueryRunner, gds: GraphDataScience) -> None:
+    G, _ = gds.graph.project("g", "*", "*")
+
+    runner.set__mock_result(
+        DataFrame(
+            [
+                {"nodeId": 0, "nodeProperty": "embedding", "propertyValue": [1.0, 2.0]},
+                {"nodeId": 1, "nodeProperty": "embedding", "propertyValue": [3.0, 4.0]},
+            ]
+        )
+    )
+
+    table = gds.graph.nodeProperties.stream(G, ["embedding"], output_format="arrow")
+    assert table.column_names == ["nodeId", "embedding"]
+    assert table["embedding"].to_pylist() == [[1.0, 2.0], [3.0, 4.0]]
+
+    arrays = gds.graph.nodeProperties.stream(G, ["embedding"], output_format="numpy")
+    assert arrays["nodeId"].tolist() == [0, 1]
+    assert arrays["embedding"].shape == (2, 2)
+    assert arrays["embedding"].tolist() == [[1.0, 2.0], [3.0, 4.0]]
+
+    with pytest.raises(ValueError, match="Invalid output format 'polars'"):
+        gds.graph.nodeProperties.stream(G, ["embedding"], output_format="polars")  # type: ignore
+
+    with pytest.raises(ValueError, match="'db_node_properties' is only supported for the 'pandas' output format"):
+        gds.graph.nodeProperties.stream(G, ["embedding"], db_node_properties=["name"], output_format="arrow")
+
+
+@pytest.mark.parametrize("server_version", [ServerVersion(2, 2, 0)])
+def test_graph_nodeProperties_stream_output_formats_mixed_types(
+    runner: CollectingQueryRunner, gds: GraphDataScience
+) -> None:
+    G, _ = gds.graph.project("g", "*", "*")
+
+    runner.set__mock_result(
+        DataFrame(
+            [
+                {"nodeId": 0, "nodeProperty": "community", "propertyValue": 3},
+                {"nodeId": 0, "nodeProperty": "embedding", "propertyValue": [1.0, 2.0]},
+                {"nodeId": 1, "nodeProperty": "community", "propertyValue": 4},
+                {"nodeId": 1, "nodeProperty": "embedding", "propertyValue": [3.0, 4.0]},
+            ]
+        )
+    )
+
+    table = gds.graph.nodeProperties.stream(G, ["community", "embedding"], output_format="arrow")
+    assert table.column_names == ["nodeId", "community", "embedding"]
+    assert table["community"].to_pylist() == [3, 4]
+    assert table["embedding"].to_pylist() == [[1.0, 2.0], [3.0, 4.0]]
+
+
+@pytest.mark.parametrize("server_version", [ServerVersion(2, 2, 0)])
+def test_graph_relationshipProperties_stream_output_formats(
+    runner: CollectingQueryRunner, gds: GraphDataScience
+) -> None:
+    G, _ = gds.graph.project("g", "*", "*")
+
+    runner.set__mock_result(
+        DataFrame(
+            [
+                {
+                    "sourceNodeId": 0,
+                    "targetNodeId": 1,
+                    "relationshipType": "R",
+                    "relationshipProperty": "weight",
+                    "propertyValue": 0.5,
+                },
+                {
+                    "sourceNodeId": 0,
+                    "targetNodeId": 1,
+                    "relationshipType": "R",
+                    "relationshipProperty": "labels",
+                    "propertyValue": [1.0, 2.0],
+                },
+            ]
+        )
+    )
+
+    table = gds.graph.relationshipProperties.stream(G, ["weight", "labels"], output_format="arrow")
+    assert table.column_names == ["sourceNodeId", "targetNodeId", "relationshipType", "labels", "weight"]
+    assert table["weight"].to_pylist() == [0.5]
+    assert table["labels"].to_pylist() == [[1.0, 2.0]]
+
+    arrays = gds.graph.relationshipProperties.stream(G, ["weight", "labels"], output_format="numpy")
+    assert arrays["sourceNodeId"].tolist() == [0]
+    assert arrays["relationshipType"].tolist() == ["R"]
+    assert arrays["weight"].tolist() == [0.5]
+    assert arrays["labels"].tolist() == [[1.0, 2.0]]
+    assert runner.last_params() == {
+        "graph_name": "g",
+        "properties": ["weight", "labels"],
+        "entities": ["*"],
+        "config": {},
+    }
+
+
 def test_graph_streamRelationshipProperty(runner: CollectingQueryRunner, gds: GraphDataScience) -> None:
     G, _ = gds.graph.project("g", "*", "*")
 
@@ -23,6 +23,17 @@ def test_simple_mutate(runner: CollectingQueryRunner, gds: GraphDataScience, G:
     }
 
 
+def test_simple_stream_iter(runner: CollectingQueryRunner, gds: GraphDataScience, G: Graph) -> None:
+    chunks = list(gds.algoName.stream.iter(G, chunk_size=10, dampingFactor=0.2))
+
+    assert len(chunks) == 1
+    assert runner.last_query() == "CALL gds.algoName.stream($graph_name, $config)"
+    assert runner.last_params() == {
+        "graph_name": GRAPH_NAME,
+        "config": {"dampingFactor": 0.2},
+    }
+
+
 def test_simple_stats(runner: CollectingQueryRunner, gds: GraphDataScience, G: Graph) -> None:
     gds.algoName.stats(G, dampingFactor=0.2, tolerance=0.3)
 
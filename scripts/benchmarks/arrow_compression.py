@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+
+"""
+Compares the size and CPU cost of the Arrow IPC compression codecs that can be passed as `arrow_compression`,
+and estimates the resulting upload time for a range of network bandwidths.
+"""
+
+import argparse
+import time
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from pyarrow import BufferOutputStream, Table, ipc
+
+CODECS: List[Optional[str]] = [None, "lz4", "zstd"]
+
+
+def relationship_table(num_rows: int) -> Table:
+    rng = np.random.default_rng(42)
+    return Table.from_pydict(
+        {
+            "sourceNodeId": rng.integers(0, num_rows // 10, num_rows),
+            "targetNodeId": rng.integers(0, num_rows // 10, num_rows),
+            "relationshipType": ["REL"] * num_rows,
+            "weight": rng.random(num_rows),
+        }
+    )
+
+
+def node_table(num_rows: int, embedding_dimension: int) -> Table:
+    rng = np.random.default_rng(42)
+    return Table.from_pydict(
+        {
+            "nodeId": np.arange(num_rows),
+            "labels": [["Person"]] * num_rows,
+            "embedding": list(rng.random((num_rows, embedding_dimension), dtype=np.float32)),
+        }
+    )
+
+
+def measure(table: Table, codec: Optional[str], repetitions: int) -> Tuple[int, float]:
+    options = ipc.IpcWriteOptions(compression=codec)
+    size, seconds = 0, 0.0
+
+    for _ in range(repetitions):
+        start = time.perf_counter()
+        sink = BufferOutputStream()
+        with ipc.new_stream(sink, table.schema, options=options) as writer:
+            writer.write_table(table, max_chunksize=10_000)
+        buffer = sink.getvalue()
+        ipc.open_stream(buffer).read_all()
+        seconds += time.perf_counter() - start
+        size = buffer.size
+
+    return size, seconds / repetitions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=5_000_000, help="number of relationship rows")
+    parser.add_argument("--embedding-dimension", type=int, default=128)
+    parser.add_argument("--repetitions", type=int, default=3)
+    parser.add_argument("--bandwidths", type=float, nargs="+", default=[50, 200, 1000], help="link speeds in Mbit/s")
+    args = parser.parse_args()
+
+    tables: Dict[str, Table] = {
+        "relationships": relationship_table(args.rows),
+        "nodes with embeddings": node_table(args.rows // 10, args.embedding_dimension),
+    }
+
+    header = f"{'data':<24}{'codec':<8}{'MB':>10}{'ratio':>8}{'codec s':>10}" + "".join(
+        f"{f'{bandwidth:g} Mbit/s':>16}" for bandwidth in args.bandwidths
+    )
+    print(header)
+    print("-" * len(header))
+
+    for name, table in tables.items():
+        uncompressed_size = None
+        for codec in CODECS:
+            size, seconds = measure(table, codec, args.repetitions)
+            uncompressed_size = uncompressed_size or size
+
+            # Estimated wall time to send the data: CPU time for compression plus transfer time
+            transfer_times = [seconds + size * 8 / (bandwidth * 1_000_000) for bandwidth in args.bandwidths]
+            print(
+                f"{name:<24}{str(codec):<8}{size / 1_000_000:>10.1f}{uncompressed_size / size:>8.2f}{seconds:>10.2f}"
+                + "".join(f"{f'{transfer_time:.1f} s':>16}" for transfer_time in transfer_times)
+            )
+
+
+if __name__ == "__main__":
+    main()
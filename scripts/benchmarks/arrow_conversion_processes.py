@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+
+"""
+Measures how many node rows per second `gds.graph.construct` converts to Arrow for different `conversion_processes`,
+for a dataframe with a list column of embeddings and a column of label lists. It also compares the previous
+implementation, which pickled each partition to send it to a worker. No GDS Arrow server is needed, as the uploaded
+batches are discarded.
+"""
+
+import argparse
+import time
+from typing import Any, Dict, List, NoReturn, Optional, Tuple, Type
+
+import numpy as np
+from pandas import DataFrame
+from pyarrow import RecordBatch, Schema, Table
+from tqdm.auto import tqdm
+
+from graphdatascience.query_runner import arrow_graph_constructor
+from graphdatascience.query_runner.arrow_graph_constructor import ArrowGraphConstructor
+from graphdatascience.query_runner.gds_arrow_client import GdsArrowClient
+
+
+class DiscardingWriter:
+    def __enter__(self) -> "DiscardingWriter":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        pass
+
+    def write_batch(self, batch: RecordBatch) -> None:
+        pass
+
+
+class DiscardingArrowClient(GdsArrowClient):
+    def __init__(self) -> None:
+        pass
+
+    def send_action(self, action_type: str, meta_data: Dict[str, Any]) -> None:
+        pass
+
+    def start_put(self, payload: Dict[str, Any], schema: Schema) -> Tuple[Any, Any]:
+        return DiscardingWriter(), None
+
+
+def convert_pickled(df: DataFrame) -> int:
+    return Table.from_pandas(df).nbytes  # type: ignore
+
+
+class PickledConversionConstructor(ArrowGraphConstructor):
+    """
+    The conversion before the workers inherited the partitions. The partition is pickled to submit it to a worker,
+    while writing and sending the stream is left out, so this is a lower bound of the time it took.
+    """
+
+    def _send_converted_df(
+        self, conversion_pool: Tuple[Any, int], index: int, entity_type: str, pbar: tqdm[NoReturn]
+    ) -> None:
+        process_pool, key = conversion_pool
+        df = arrow_graph_constructor._conversion_partitions[key][index]
+        process_pool.submit(convert_pickled, df).result()
+        pbar.update(len(df))
+
+
+def nodes(num_rows: int, embedding_dimension: int) -> DataFrame:
+    rng = np.random.default_rng(42)
+    return DataFrame(
+        {
+            "nodeId": np.arange(num_rows),
+            "labels": [["Person", "Customer"]] * num_rows,
+            "embedding": list(rng.random((num_rows, embedding_dimension))),
+        }
+    )
+
+
+def measure(
+    constructor_class: Type[ArrowGraphConstructor],
+    df: DataFrame,
+    concurrency: int,
+    conversion_processes: Optional[int],
+    repetitions: int,
+) -> float:
+    seconds = float("inf")
+    for _ in range(repetitions):
+        constructor = constructor_class(
+            "neo4j", "g", DiscardingArrowClient(), concurrency, None, conversion_processes=conversion_processes
+        )
+        start = time.perf_counter()
+        constructor.run([df], [])
+        seconds = min(seconds, time.perf_counter() - start)
+
+    return seconds
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--embedding-dimension", type=int, default=256)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--processes", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--repetitions", type=int, default=3)
+    args = parser.parse_args()
+
+    df = nodes(args.rows, args.embedding_dimension)
+
+    runs: List[Tuple[str, Type[ArrowGraphConstructor], Optional[int]]] = [("threads", ArrowGraphConstructor, None)]
+    for processes in args.processes:
+        runs.append((f"pickled x{processes}", PickledConversionConstructor, processes))
+        runs.append((f"inherited x{processes}", ArrowGraphConstructor, processes))
+
+    print(f"{'conversion':<16}{'seconds':>10}{'rows/s':>14}")
+    for name, constructor_class, processes in runs:
+        seconds = measure(constructor_class, df, args.concurrency, processes, args.repetitions)
+        print(f"{name:<16}{seconds:>10.2f}{args.rows / seconds:>14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
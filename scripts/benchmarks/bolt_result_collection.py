@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+
+"""
+Compares the time to materialize a Bolt result as a DataFrame with the driver's `Result.to_df` and with the
+columnar collector used by the client, for a result shaped like the output of an algorithm in stream mode.
+"""
+
+import argparse
+import time
+from typing import Callable, Dict, List
+
+from neo4j import Driver, GraphDatabase, Result
+from pandas import DataFrame
+
+from graphdatascience.query_runner.columnar_result import to_columnar_frame
+
+QUERY = "UNWIND range(0, $rows - 1) AS nodeId RETURN nodeId, rand() AS score, nodeId % 100 AS communityId"
+
+
+def measure(driver: Driver, collect: Callable[[Result], DataFrame], rows: int) -> float:
+    with driver.session() as session:
+        start = time.perf_counter()
+        df = collect(session.run(QUERY, {"rows": rows}))
+        seconds = time.perf_counter() - start
+
+    assert len(df) == rows
+    return seconds
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--uri", default="bolt://localhost:7687")
+    parser.add_argument("--user", default="neo4j")
+    parser.add_argument("--password", default="password")
+    parser.add_argument("--rows", type=int, nargs="+", default=[100_000, 1_000_000, 10_000_000])
+    parser.add_argument("--repetitions", type=int, default=3)
+    args = parser.parse_args()
+
+    collectors: Dict[str, Callable[[Result], DataFrame]] = {
+        "Result.to_df": lambda result: result.to_df(),
+        "to_columnar_frame": lambda result: to_columnar_frame(result.keys(), result),
+    }
+
+    with GraphDatabase.driver(args.uri, auth=(args.user, args.password)) as driver:
+        header = f"{'rows':>12}" + "".join(f"{name + ' s':>22}" for name in collectors) + f"{'speedup':>10}"
+        print(header)
+        print("-" * len(header))
+
+        for rows in args.rows:
+            timings: List[float] = []
+            for collect in collectors.values():
+                # The best of several runs excludes warm-up effects on the server
+                timings.append(min(measure(driver, collect, rows) for _ in range(args.repetitions)))
+
+            speedup = timings[0] / timings[1]
+            print(f"{rows:>12}" + "".join(f"{seconds:>22.2f}" for seconds in timings) + f"{speedup:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()